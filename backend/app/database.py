@@ -1,9 +1,104 @@
 import json
 import os
-from typing import Dict, List, Optional
+import time
+import heapq
+import sqlite3
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-class JSONStorage:
+logger = logging.getLogger(__name__)
+
+# Keyset position in the archive: (timestamp, analysis_id) of the last row seen
+ArchiveKey = Tuple[str, str]
+
+@dataclass
+class ArchiveFilters:
+    """Optional archive filters; a None field is not filtered on"""
+    user_id: Optional[str] = None
+    verdict: Optional[str] = None
+    content_type: Optional[str] = None
+    language: Optional[str] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+    min_confidence: Optional[float] = None
+    max_confidence: Optional[float] = None
+
+    def matches(self, entry: Dict) -> bool:
+        for field in ("user_id", "verdict", "content_type", "language"):
+            wanted = getattr(self, field)
+            if wanted is not None and entry.get(field) != wanted:
+                return False
+        timestamp = str(entry.get("timestamp", ""))
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp > self.until:
+            return False
+        confidence = entry.get("confidence_score")
+        if self.min_confidence is not None or self.max_confidence is not None:
+            if not isinstance(confidence, (int, float)):
+                return False
+            if self.min_confidence is not None and confidence < self.min_confidence:
+                return False
+            if self.max_confidence is not None and confidence > self.max_confidence:
+                return False
+        return True
+
+class StorageBackend:
+    """Interface shared by all analysis storage engines"""
+
+    def save_analysis(self, analysis_id: str, data: Dict) -> bool:
+        raise NotImplementedError
+
+    def get_analysis(self, analysis_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_all_analyses(self, limit: int = 50) -> List[Dict]:
+        raise NotImplementedError
+
+    def query_analyses(self, limit: int = 20, user_id: Optional[str] = None) -> List[Dict]:
+        """Newest analyses matching the filters (filters applied before the limit)"""
+        entries, _ = self.page_analyses(limit=limit, filters=ArchiveFilters(user_id=user_id))
+        return entries
+
+    def page_analyses(
+        self,
+        limit: int = 20,
+        after: Optional[ArchiveKey] = None,
+        filters: Optional[ArchiveFilters] = None,
+    ) -> Tuple[List[Dict], Optional[ArchiveKey]]:
+        """
+        One newest-first archive page using keyset pagination.
+
+        Args:
+            limit (int): Page size
+            after (ArchiveKey): (timestamp, analysis_id) of the last row of the previous page
+            filters (ArchiveFilters): Optional field filters
+
+        Returns:
+            Tuple[List[Dict], Optional[ArchiveKey]]: Page entries and the key to
+            continue from (None when this is the last page)
+        """
+        # Generic fallback for file backends: scan, filter, then slice
+        filters = filters or ArchiveFilters()
+        entries = [e for e in self.get_all_analyses(limit=2 ** 31) if filters.matches(e)]
+        entries.sort(key=lambda e: (str(e.get("timestamp", "")), str(e.get("analysis_id", ""))), reverse=True)
+        if after is not None:
+            entries = [e for e in entries if (str(e.get("timestamp", "")), str(e.get("analysis_id", ""))) < tuple(after)]
+        page = entries[:limit]
+        next_key = None
+        if len(entries) > limit and page:
+            last = page[-1]
+            next_key = (str(last.get("timestamp", "")), str(last.get("analysis_id", "")))
+        return page, next_key
+
+    def close(self) -> None:
+        """Release file handles / flush pending writes"""
+        pass
+
+class JSONStorage(StorageBackend):
     def __init__(self, storage_dir: str = "storage"):
         self.storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
@@ -64,5 +159,551 @@ class JSONStorage:
             print(f"Error retrieving all analyses: {e}")
             return []
 
+class LogStorage(StorageBackend):
+    """
+    Append-only NDJSON segment log with an in-memory index.
+
+    - Every save is a single appended line; nothing is rewritten in place.
+    - id -> (segment, offset, length) is kept in memory and rebuilt by
+      scanning the segments at startup, so reads are one positioned read.
+    - fsync is batched (every `fsync_every` writes); the line is flushed
+      to the OS immediately, and a background flusher fsyncs pending
+      writes within `fsync_interval` seconds even when no more arrive.
+    - Superseded records are reclaimed by compaction once they make up
+      more than `compact_ratio` of the log. Compaction runs in a
+      background thread and copies the sealed segments without holding
+      the lock, so saves are never blocked behind a rewrite.
+    """
+
+    SEGMENT_PREFIX = "analyses-"
+    SEGMENT_SUFFIX = ".ndjson"
+
+    def __init__(
+        self,
+        storage_dir: str = "storage",
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        fsync_every: int = 32,
+        fsync_interval: float = 1.0,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1024 * 1024,
+    ):
+        self.storage_dir = storage_dir
+        os.makedirs(storage_dir, exist_ok=True)
+        self.legacy_file = os.path.join(storage_dir, "analyses.json")
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._lock = threading.RLock()
+        # analysis_id -> (segment_no, offset, length)
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        # analysis_id -> timestamp (for newest-first listing without I/O)
+        self._timestamps: Dict[str, str] = {}
+        self._read_fds: Dict[int, int] = {}
+        self._live_bytes = 0
+        self._total_bytes = 0
+        self._pending_writes = 0
+        self._last_fsync = time.time()
+        self._compactor: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+        self._load_segments()
+        if not self._segments():
+            self._migrate_legacy_json()
+        self._open_active_segment()
+
+        # With no interval every write is fsynced inline and there is nothing to flush later
+        self._flusher: Optional[threading.Thread] = None
+        if fsync_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="log-storage-fsync", daemon=True)
+            self._flusher.start()
+
+    # ----- segment files -----
+
+    def _segment_path(self, segment_no: int) -> str:
+        return os.path.join(self.storage_dir, f"{self.SEGMENT_PREFIX}{segment_no:06d}{self.SEGMENT_SUFFIX}")
+
+    def _segments(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.storage_dir):
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.SEGMENT_SUFFIX):
+                try:
+                    numbers.append(int(name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def _read_fd(self, segment_no: int) -> int:
+        fd = self._read_fds.get(segment_no)
+        if fd is None:
+            fd = os.open(self._segment_path(segment_no), os.O_RDONLY)
+            self._read_fds[segment_no] = fd
+        return fd
+
+    def _close_read_fds(self) -> None:
+        for fd in self._read_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._read_fds.clear()
+
+    def _index_record(self, record: Dict, segment_no: int, offset: int, length: int) -> None:
+        analysis_id = record.get("id")
+        if analysis_id is None:
+            return
+        previous = self._index.get(analysis_id)
+        if previous is not None:
+            self._live_bytes -= previous[2]
+        self._index[analysis_id] = (segment_no, offset, length)
+        self._timestamps[analysis_id] = record.get("data", {}).get("timestamp", "")
+        self._live_bytes += length
+
+    def _load_segments(self) -> None:
+        """Rebuild the in-memory index by scanning every segment once"""
+        for segment_no in self._segments():
+            path = self._segment_path(segment_no)
+            offset = 0
+            valid_end = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    length = len(line)
+                    if not line.endswith(b"\n"):
+                        # Torn write from a crash - drop the partial tail
+                        break
+                    try:
+                        record = json.loads(line)
+                        self._index_record(record, segment_no, offset, length)
+                    except ValueError:
+                        logger.warning(f"Skipping corrupt record in {path} at offset {offset}")
+                    offset += length
+                    valid_end = offset
+            if valid_end < os.path.getsize(path):
+                with open(path, "r+b") as f:
+                    f.truncate(valid_end)
+            self._total_bytes += valid_end
+
+    def _open_active_segment(self) -> None:
+        segments = self._segments()
+        self._active_no = segments[-1] if segments else 1
+        self._active = open(self._segment_path(self._active_no), "ab")
+        self._active_size = self._active.tell()
+
+    def _roll_segment(self) -> None:
+        self._sync(force=True)
+        self._active.close()
+        self._active_no += 1
+        self._active = open(self._segment_path(self._active_no), "ab")
+        self._active_size = 0
+
+    def _append(self, record: Dict) -> None:
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        if self._active_size and self._active_size + len(line) > self.segment_max_bytes:
+            self._roll_segment()
+        offset = self._active_size
+        self._active.write(line)
+        self._active.flush()
+        self._active_size += len(line)
+        self._total_bytes += len(line)
+        self._pending_writes += 1
+        self._index_record(record, self._active_no, offset, len(line))
+
+    def _sync(self, force: bool = False) -> None:
+        """fsync the active segment when forced or when the batch is due"""
+        if not force and not self._pending_writes:
+            return
+        due = (
+            force
+            or self._pending_writes >= self.fsync_every
+            or time.time() - self._last_fsync >= self.fsync_interval
+        )
+        if due:
+            os.fsync(self._active.fileno())
+            self._pending_writes = 0
+            self._last_fsync = time.time()
+
+    def _flush_loop(self) -> None:
+        """fsync writes left pending when saves stop, so none waits longer than fsync_interval"""
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                if self._pending_writes and not self._active.closed:
+                    try:
+                        self._sync(force=True)
+                    except OSError as e:
+                        logger.warning(f"Background fsync failed: {e}")
+
+    def _migrate_legacy_json(self) -> None:
+        """Import an existing analyses.json into the log once"""
+        if not os.path.exists(self.legacy_file):
+            return
+        try:
+            with open(self.legacy_file, "r") as f:
+                analyses = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not migrate {self.legacy_file}: {e}")
+            return
+        self._active_no = 1
+        self._active = open(self._segment_path(1), "ab")
+        self._active_size = self._active.tell()
+        for analysis_id, data in analyses.items():
+            self._append({"id": analysis_id, "data": data})
+        self._sync(force=True)
+        self._active.close()
+        logger.info(f"Migrated {len(analyses)} analyses from {self.legacy_file} to the append-only log")
+
+    # ----- compaction -----
+
+    def _needs_compaction(self) -> bool:
+        if self._total_bytes < self.compact_min_bytes:
+            return False
+        dead = self._total_bytes - self._live_bytes
+        return dead / self._total_bytes > self.compact_ratio
+
+    def _start_compaction(self) -> None:
+        """Compact in a background thread unless a compaction is already running (lock held)"""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_safely, name="log-storage-compact", daemon=True)
+        self._compactor.start()
+
+    def _compact_safely(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.error(f"Analysis log compaction failed: {e}")
+
+    def compact(self) -> None:
+        """
+        Rewrite the live records of the sealed segments into one segment.
+
+        The active segment is sealed first, so new saves go to a fresh
+        segment while the sealed ones are copied without the lock. The
+        copy takes the number of the last sealed segment: replayed in
+        order it still precedes every newer write, and a crash before the
+        old segments are deleted leaves only superseded duplicates.
+        """
+        with self._lock:
+            self._roll_segment()
+            sealed = [n for n in self._segments() if n < self._active_no]
+            if not sealed:
+                return
+            sealed_set = set(sealed)
+            live = sorted(
+                (location, analysis_id) for analysis_id, location in self._index.items() if location[0] in sealed_set
+            )
+        target_no = sealed[-1]
+        target_path = self._segment_path(target_no)
+        tmp_path = f"{target_path}.compact"
+
+        # Sealed segments are immutable, so they are read without the lock
+        moved: Dict[str, Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = {}
+        handles: Dict[int, object] = {}
+        try:
+            with open(tmp_path, "wb") as out:
+                offset = 0
+                for (segment_no, old_offset, length), analysis_id in live:
+                    f = handles.get(segment_no)
+                    if f is None:
+                        f = handles[segment_no] = open(self._segment_path(segment_no), "rb")
+                    f.seek(old_offset)
+                    out.write(f.read(length))
+                    moved[analysis_id] = ((segment_no, old_offset, length), (target_no, offset, length))
+                    offset += length
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            for f in handles.values():
+                f.close()
+
+        with self._lock:
+            self._close_read_fds()
+            os.replace(tmp_path, target_path)
+            for segment_no in sealed[:-1]:
+                try:
+                    os.remove(self._segment_path(segment_no))
+                except OSError:
+                    pass
+            for analysis_id, (old, new) in moved.items():
+                # Records saved again during the copy already point past the sealed segments
+                if self._index.get(analysis_id) == old:
+                    self._index[analysis_id] = new
+            self._total_bytes = sum(os.path.getsize(self._segment_path(n)) for n in self._segments() if n != self._active_no)
+            self._total_bytes += self._active_size
+        logger.info(f"Compacted analysis log: {len(moved)} live records kept from {len(sealed)} segments")
+
+    # ----- public interface -----
+
+    def save_analysis(self, analysis_id: str, data: Dict) -> bool:
+        """Append analysis result to the log"""
+        try:
+            if 'timestamp' not in data:
+                data['timestamp'] = datetime.now().isoformat()
+            with self._lock:
+                self._append({"id": analysis_id, "data": data})
+                self._sync()
+                if self._needs_compaction():
+                    self._start_compaction()
+            return True
+        except Exception as e:
+            print(f"Error saving analysis: {e}")
+            return False
+
+    def get_analysis(self, analysis_id: str) -> Optional[Dict]:
+        """Retrieve analysis by ID with a single positioned read"""
+        try:
+            with self._lock:
+                location = self._index.get(analysis_id)
+                if location is None:
+                    return None
+                segment_no, offset, length = location
+                raw = os.pread(self._read_fd(segment_no), length, offset)
+            return json.loads(raw).get("data")
+        except Exception as e:
+            print(f"Error retrieving analysis: {e}")
+            return None
+
+    def get_all_analyses(self, limit: int = 50) -> List[Dict]:
+        """Get newest analyses; ordering comes from the in-memory index"""
+        try:
+            with self._lock:
+                newest = heapq.nlargest(limit, self._timestamps.items(), key=lambda item: item[1])
+            results = []
+            for analysis_id, _ in newest:
+                data = self.get_analysis(analysis_id)
+                if data is not None:
+                    results.append(data)
+            return results
+        except Exception as e:
+            print(f"Error retrieving all analyses: {e}")
+            return []
+
+    def iter_analyses(self):
+        """Yield (analysis_id, data) for every live record"""
+        for analysis_id in list(self._index):
+            data = self.get_analysis(analysis_id)
+            if data is not None:
+                yield analysis_id, data
+
+    def close(self) -> None:
+        self._closed.set()
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if not self._active.closed:
+                self._sync(force=True)
+                self._active.close()
+            self._close_read_fds()
+
+class SQLiteStorage(StorageBackend):
+    """
+    SQLite (WAL mode) storage with indexed archive queries.
+
+    The full analysis is kept as a JSON document; the columns used for
+    filtering and ordering are extracted on write and indexed, so archive
+    queries are answered by SQLite instead of loading every analysis.
+    """
+
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS analyses (
+            id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL DEFAULT '',
+            user_id TEXT,
+            verdict TEXT,
+            content_type TEXT,
+            language TEXT,
+            confidence REAL,
+            data TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_analyses_timestamp ON analyses (timestamp, id)",
+        "CREATE INDEX IF NOT EXISTS idx_analyses_user ON analyses (user_id, timestamp, id)",
+        "CREATE INDEX IF NOT EXISTS idx_analyses_verdict ON analyses (verdict, timestamp, id)",
+        "CREATE INDEX IF NOT EXISTS idx_analyses_content_type ON analyses (content_type, timestamp, id)",
+        "CREATE INDEX IF NOT EXISTS idx_analyses_language ON analyses (language, timestamp, id)",
+    ]
+
+    def __init__(self, storage_dir: str = "storage", db_name: str = "analyses.db"):
+        self.storage_dir = storage_dir
+        os.makedirs(storage_dir, exist_ok=True)
+        self.db_file = os.path.join(storage_dir, db_name)
+        self.legacy_file = os.path.join(storage_dir, "analyses.json")
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+        self._migrate_legacy()
+
+    @staticmethod
+    def _row_values(analysis_id: str, data: Dict) -> Tuple:
+        confidence = data.get("confidence_score")
+        return (
+            analysis_id,
+            str(data.get("timestamp", "")),
+            data.get("user_id"),
+            data.get("verdict"),
+            data.get("content_type"),
+            data.get("language"),
+            float(confidence) if isinstance(confidence, (int, float)) else None,
+            json.dumps(data, default=str),
+        )
+
+    def _insert_many(self, items) -> int:
+        rows = [self._row_values(analysis_id, data) for analysis_id, data in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analyses "
+                "(id, timestamp, user_id, verdict, content_type, language, confidence, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def _migrate_legacy(self) -> None:
+        """Import analyses from the NDJSON log or analyses.json into an empty database"""
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM analyses LIMIT 1").fetchone():
+                return
+
+        has_log = any(
+            name.startswith(LogStorage.SEGMENT_PREFIX) and name.endswith(LogStorage.SEGMENT_SUFFIX)
+            for name in os.listdir(self.storage_dir)
+        )
+        try:
+            if has_log:
+                log = LogStorage(self.storage_dir)
+                count = self._insert_many(log.iter_analyses())
+                log.close()
+                source = "append-only log"
+            elif os.path.exists(self.legacy_file):
+                with open(self.legacy_file, "r") as f:
+                    analyses = json.load(f)
+                count = self._insert_many(analyses.items())
+                source = self.legacy_file
+            else:
+                return
+            logger.info(f"Migrated {count} analyses from {source} into {self.db_file}")
+        except Exception as e:
+            logger.warning(f"Storage migration failed: {e}")
+
+    def save_analysis(self, analysis_id: str, data: Dict) -> bool:
+        """Insert or replace an analysis row"""
+        try:
+            if 'timestamp' not in data:
+                data['timestamp'] = datetime.now().isoformat()
+            self._insert_many([(analysis_id, data)])
+            return True
+        except Exception as e:
+            print(f"Error saving analysis: {e}")
+            return False
+
+    def get_analysis(self, analysis_id: str) -> Optional[Dict]:
+        """Retrieve analysis by primary key"""
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT data FROM analyses WHERE id = ?", (analysis_id,)).fetchone()
+            return json.loads(row["data"]) if row else None
+        except Exception as e:
+            print(f"Error retrieving analysis: {e}")
+            return None
+
+    def get_all_analyses(self, limit: int = 50) -> List[Dict]:
+        """Get newest analyses via the timestamp index"""
+        return self.query_analyses(limit=limit)
+
+    def page_analyses(
+        self,
+        limit: int = 20,
+        after: Optional[ArchiveKey] = None,
+        filters: Optional[ArchiveFilters] = None,
+    ) -> Tuple[List[Dict], Optional[ArchiveKey]]:
+        """Keyset-paginated archive page; filters, ordering and limit run in SQL"""
+        filters = filters or ArchiveFilters()
+        clauses = []
+        params: List = []
+        for column in ("user_id", "verdict", "content_type", "language"):
+            value = getattr(filters, column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if filters.since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(filters.since)
+        if filters.until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(filters.until)
+        if filters.min_confidence is not None:
+            clauses.append("confidence >= ?")
+            params.append(filters.min_confidence)
+        if filters.max_confidence is not None:
+            clauses.append("confidence <= ?")
+            params.append(filters.max_confidence)
+        if after is not None:
+            # Seek past the previous page instead of OFFSET scanning
+            clauses.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params.extend([after[0], after[0], after[1]])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit = max(0, int(limit))
+        sql = f"SELECT id, timestamp, data FROM analyses {where} ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except Exception as e:
+            print(f"Error querying analyses: {e}")
+            return [], None
+
+        page_rows = rows[:limit]
+        next_key = None
+        if len(rows) > limit and page_rows:
+            next_key = (page_rows[-1]["timestamp"], page_rows[-1]["id"])
+        return [json.loads(row["data"]) for row in page_rows], next_key
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+def analysis_record(result, content_type: str, content: str, language: Optional[str], user_id: Optional[str]) -> Dict:
+    """Build the archive entry stored for a completed analysis Result"""
+    return {
+        "analysis_id": result.id,
+        "content_type": content_type,
+        "content": "[IMAGE]" if content_type == "image" else content[:500],
+        "language": language,
+        "user_id": user_id,
+        "verdict": result.verdict.label,
+        "confidence_score": result.verdict.confidence,
+        "summary": result.verdict.summary,
+        "processing_time": result.audit.get("processing_time", "0s"),
+        "result": result.dict()  # Store complete Result object
+    }
+
+def create_storage(backend: Optional[str] = None, storage_dir: str = "storage") -> StorageBackend:
+    """Build the configured storage engine (STORAGE_BACKEND=sqlite|log|json)"""
+    backend = (backend or os.getenv("STORAGE_BACKEND", "sqlite")).lower()
+    if backend == "json":
+        return JSONStorage(storage_dir)
+    if backend == "sqlite":
+        return SQLiteStorage(storage_dir)
+    return LogStorage(
+        storage_dir,
+        segment_max_bytes=int(os.getenv("STORAGE_SEGMENT_MAX_BYTES", 16 * 1024 * 1024)),
+        fsync_every=int(os.getenv("STORAGE_FSYNC_EVERY", 32)),
+        fsync_interval=float(os.getenv("STORAGE_FSYNC_INTERVAL", 1.0)),
+    )
+
 # Global storage instance
-storage = JSONStorage()
\ No newline at end of file
+storage = create_storage()
@@ -6,6 +6,8 @@ load_dotenv()  # Load .env before importing settings
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from contextlib import asynccontextmanager
 from datetime import datetime
 import time
 from pydantic import BaseModel
@@ -13,11 +15,37 @@ from pydantic import BaseModel
 # SAMBHAV FIX: Simplified imports to avoid missing modules
 try:
     from app.services.analysis_engine import run_analysis
+    from app.services.http_client import http_clients
+    from app.services.cache import evidence_cache, analysis_memo, page_cache
+    from app.services.singleflight import analysis_flights
+    from app.services.metrics import metrics, gauge_lines
+    from app.services.hedging import hedger
+    from app.services.resilience import upstreams
+    from app.services.quota import quotas
+    from app.database import storage
+    from app.services.jobs import job_workers, job_queue
+    from app.verify import router as verify_router
+    from app.routes.text_analysis import router as text_analysis_router
+    from app.routes.health import router as health_router
+    from app.services.health_monitor import health_monitor
 except ImportError:
     # If app structure is different, try direct import
     import sys
     sys.path.append('.')
     from app.services.analysis_engine import run_analysis
+    from app.services.http_client import http_clients
+    from app.services.cache import evidence_cache, analysis_memo, page_cache
+    from app.services.singleflight import analysis_flights
+    from app.services.metrics import metrics, gauge_lines
+    from app.services.hedging import hedger
+    from app.services.resilience import upstreams
+    from app.services.quota import quotas
+    from app.database import storage
+    from app.services.jobs import job_workers, job_queue
+    from app.verify import router as verify_router
+    from app.routes.text_analysis import router as text_analysis_router
+    from app.routes.health import router as health_router
+    from app.services.health_monitor import health_monitor
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -34,13 +62,31 @@ class AnalyzeRequest(BaseModel):
     content: str
     language: str = "en"
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    await http_clients.startup()
+    logger.info("🔌 Shared HTTP client pools ready")
+    await job_workers.start()
+    health_monitor.ensure_started()
+    try:
+        yield
+    finally:
+        await health_monitor.stop()
+        await job_workers.stop()
+        job_queue.close()
+        await http_clients.close()
+        storage.close()
+        logger.info("🔌 Shared HTTP client pools closed")
+
 # Initialize FastAPI app
 app = FastAPI(
     title="CrediScope API",
     description="AI-powered misinformation detection platform - SAMBHAV Edition",
     version="1.0.0-sambhav",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -58,6 +104,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Verification, results and archive routes
+app.include_router(verify_router, prefix="/api/v1", tags=["verification"])
+app.include_router(text_analysis_router, prefix="/api/v1", tags=["analysis"])
+app.include_router(health_router, prefix="/api/v1", tags=["health"])
+
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse, tags=["utils"])
 async def health_check():
@@ -290,16 +341,91 @@ def format_intelligence_report(intelligence: object) -> str:
     
     return "; ".join(sections) if sections else "No specific intelligence insights available."
 
-# Additional versioned health check
-@app.get("/api/v1/health", tags=["utils"])
-async def api_health():
+# Evidence cache hit/miss counters
+@app.get("/api/v1/cache/stats", tags=["utils"])
+async def cache_stats():
     return {
-        "status": "healthy - SAMBHAV Edition",
-        "api_version": "v1",
-        "sambhav_active": True,
+        "evidence": evidence_cache.stats(),
+        "analysis": analysis_memo.stats(),
+        "pages": page_cache.stats(),
+        "coalescing": analysis_flights.stats(),
+        "hedging": hedger.stats(),
         "timestamp": datetime.utcnow()
     }
 
+def cache_metric_lines() -> list:
+    """Cache and coalescing ratios as Prometheus gauges"""
+    evidence = evidence_cache.stats()
+    memo = analysis_memo.stats()
+    pages = page_cache.stats()
+    flights = analysis_flights.stats()
+    hit_ratios = [
+        ({"cache": "analysis"}, memo["hit_ratio"]),
+        ({"cache": "evidence"}, evidence["hit_ratio"]),
+        ({"cache": "pages"}, pages["hit_ratio"]),
+    ]
+    hit_ratios += [
+        ({"cache": "evidence", "source": source}, counters["hit_ratio"])
+        for source, counters in evidence["sources"].items()
+    ]
+    return (
+        gauge_lines("crediscope_cache_hit_ratio", "Cache hit ratio since startup", hit_ratios)
+        + gauge_lines("crediscope_cache_entries", "Entries held in memory", [
+            ({"cache": "analysis"}, memo["entries"]),
+            ({"cache": "evidence"}, evidence["memory_entries"]),
+            ({"cache": "pages"}, pages["memory_entries"]),
+        ])
+        + gauge_lines("crediscope_inflight_analyses", "Analyses currently running (coalescing keys)", [
+            ({}, flights["in_flight"]),
+        ])
+    )
+
+# Client-side quota buckets and throttle events
+@app.get("/api/v1/quota/stats", tags=["utils"])
+async def quota_stats():
+    return {**quotas.stats(), "timestamp": datetime.utcnow()}
+
+def quota_metric_lines() -> list:
+    """Remaining client-side quota per bucket"""
+    samples = []
+    for bucket, remaining in quotas.stats()["buckets"].items():
+        for window in ("minute", "day"):
+            if remaining[f"remaining_{window}"] is not None:
+                samples.append(({"bucket": bucket, "window": window}, remaining[f"remaining_{window}"]))
+    return gauge_lines("crediscope_quota_remaining", "Requests left in the current quota window", samples)
+
+def hedge_metric_lines() -> list:
+    """Current hedge delay (observed tail latency) per hedged API"""
+    return gauge_lines("crediscope_hedge_delay_seconds", "Wait before a hedged API request is duplicated", [
+        ({"api": api}, stats["hedge_after_ms"] / 1000)
+        for api, stats in hedger.stats().items()
+        if stats["hedge_after_ms"] is not None
+    ])
+
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+def upstream_metric_lines() -> list:
+    """Circuit breaker state and adaptive concurrency limit per upstream API"""
+    snapshot = upstreams.snapshot()
+    return (
+        gauge_lines("crediscope_circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)", [
+            ({"upstream": name}, CIRCUIT_STATE_VALUES[guard["state"]]) for name, guard in snapshot.items()
+        ])
+        + gauge_lines("crediscope_upstream_concurrency_limit", "Adaptive (AIMD) concurrency limit", [
+            ({"upstream": name}, guard["concurrency"]["limit"]) for name, guard in snapshot.items()
+        ])
+    )
+
+metrics.register_collector(cache_metric_lines)
+metrics.register_collector(upstream_metric_lines)
+metrics.register_collector(quota_metric_lines)
+metrics.register_collector(hedge_metric_lines)
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["utils"])
+async def prometheus_metrics():
+    """Prometheus text exposition of stage/API latency histograms and counters"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     print("🔥 OPERATION SAMBHAV - Backend Starting...")
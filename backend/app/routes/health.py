@@ -8,6 +8,8 @@ import asyncio
 import time
 import os
 
+from app.services.health_monitor import health_monitor
+
 router = APIRouter()
 
 class HealthResponse(BaseModel):
@@ -29,6 +31,7 @@ async def check_google_apis() -> ServiceCheck:
     try:
         # Test Google Translate API
         import aiohttp
+        from app.services.endpoints import endpoints
         
         api_key = os.getenv("TRANSLATION_API_KEY")
         if not api_key:
@@ -38,23 +41,24 @@ async def check_google_apis() -> ServiceCheck:
                 message="Translation API key not configured"
             )
         
-        url = f"https://translation.googleapis.com/language/translate/v2/languages?key={api_key}"
+        url = endpoints.url("translation", f"/languages?key={api_key}")
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    return ServiceCheck(
-                        status="healthy",
-                        response_time=round(time.time() - start_time, 3),
-                        message="Google APIs accessible"
-                    )
-                else:
-                    return ServiceCheck(
-                        status="unhealthy",
-                        response_time=round(time.time() - start_time, 3),
-                        message=f"API returned status {resp.status}"
-                    )
-                    
+        # Language list: the cheapest authenticated call (not billed per character)
+        session = endpoints.session("translation")
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+            if resp.status == 200:
+                return ServiceCheck(
+                    status="healthy",
+                    response_time=round(time.time() - start_time, 3),
+                    message="Google APIs accessible"
+                )
+            else:
+                return ServiceCheck(
+                    status="unhealthy",
+                    response_time=round(time.time() - start_time, 3),
+                    message=f"API returned status {resp.status}"
+                )
+                
     except Exception as e:
         return ServiceCheck(
             status="unhealthy",
@@ -63,17 +67,23 @@ async def check_google_apis() -> ServiceCheck:
         )
 
 async def check_analysis_engine() -> ServiceCheck:
-    """Check if analysis engine is working"""
+    """Check that the analysis engine can assemble a result (local self-test, no API calls)"""
     start_time = time.time()
     
     try:
-        from app.services.analysis_engine import run_analysis
+        from app.services.analysis_engine import transform_raw_to_structured_result
         
-        # Test with minimal content
-        test_result = await run_analysis("text", "test content", "en")
+        # Runs the scoring and formatting code on empty evidence
+        result = transform_raw_to_structured_result(
+            signals={"fact_checks": [], "search_results": [], "wikipedia": None},
+            parsed_data={"verdict_label": "⚠️ Caution", "confidence": 70},
+            original_text="health check self-test",
+            detected_lang="en",
+            processing_time=0.0
+        )
         
         return ServiceCheck(
-            status="healthy",
+            status="healthy" if result.verdict.label else "unhealthy",
             response_time=round(time.time() - start_time, 3),
             message="Analysis engine responsive"
         )
@@ -86,31 +96,20 @@ async def check_analysis_engine() -> ServiceCheck:
         )
 
 async def check_storage() -> ServiceCheck:
-    """Check if storage system is working"""
+    """Check that storage is readable and its directory writable (nothing is written)"""
     start_time = time.time()
     
     try:
         from app.database import storage
         
-        # Test storage operations
-        test_id = "health_check_test"
-        test_data = {"status": "test", "timestamp": datetime.utcnow().isoformat()}
-        
-        # Test save and retrieve
-        success = storage.save_analysis(test_id, test_data)
-        if success:
-            retrieved = storage.get_analysis(test_id)
-            if retrieved:
-                return ServiceCheck(
-                    status="healthy",
-                    response_time=round(time.time() - start_time, 3),
-                    message="Storage system operational"
-                )
+        # Read path: a lookup that normally finds nothing
+        storage.get_analysis("health_check_test")
+        writable = os.access(storage.storage_dir, os.W_OK)
         
         return ServiceCheck(
-            status="unhealthy",
+            status="healthy" if writable else "unhealthy",
             response_time=round(time.time() - start_time, 3),
-            message="Storage operations failed"
+            message="Storage system operational" if writable else f"Storage directory not writable: {storage.storage_dir}"
         )
         
     except Exception as e:
@@ -120,48 +119,43 @@ async def check_storage() -> ServiceCheck:
             message=f"Storage error: {str(e)}"
         )
 
+def check_upstreams() -> Dict[str, Any]:
+    """Circuit breaker state and concurrency limit of each external API"""
+    from app.services.resilience import upstreams
+    
+    breakers = upstreams.snapshot()
+    open_circuits = [name for name, guard in breakers.items() if guard["state"] != "closed"]
+    return {
+        "status": "degraded" if open_circuits else "healthy",
+        "message": f"Circuits not closed: {', '.join(open_circuits)}" if open_circuits else "All circuits closed",
+        "upstreams": breakers
+    }
+
 # App start time for uptime calculation
 app_start_time = time.time()
 
+# Deep checks run in the background; probes only read their last results
+health_monitor.register("google_apis", check_google_apis)
+health_monitor.register("analysis_engine", check_analysis_engine)
+health_monitor.register("storage", check_storage)
+
 @router.get("/health", response_model=HealthResponse, status_code=status.HTTP_200_OK)
 async def comprehensive_health_check():
     """
     Comprehensive health check endpoint
     
-    Checks:
+    Returns the cached results of the background checks (each with
+    checked_at/age_seconds) plus live circuit breaker state:
     - Google APIs accessibility
     - Analysis engine functionality  
     - Storage system operations
+    - Circuit breakers of external APIs
     - Overall system status
     """
+    health_monitor.ensure_started()
     
-    start_time = time.time()
-    
-    # Run all checks in parallel
-    google_check, analysis_check, storage_check = await asyncio.gather(
-        check_google_apis(),
-        check_analysis_engine(), 
-        check_storage(),
-        return_exceptions=True
-    )
-    
-    # Handle any exceptions
-    checks = {}
-    
-    if isinstance(google_check, ServiceCheck):
-        checks["google_apis"] = google_check.dict()
-    else:
-        checks["google_apis"] = {"status": "error", "message": str(google_check)}
-    
-    if isinstance(analysis_check, ServiceCheck):
-        checks["analysis_engine"] = analysis_check.dict()
-    else:
-        checks["analysis_engine"] = {"status": "error", "message": str(analysis_check)}
-        
-    if isinstance(storage_check, ServiceCheck):
-        checks["storage"] = storage_check.dict()
-    else:
-        checks["storage"] = {"status": "error", "message": str(storage_check)}
+    checks = health_monitor.snapshot()
+    checks["circuit_breakers"] = check_upstreams()
     
     # Determine overall status
     all_statuses = [check.get("status", "error") for check in checks.values()]
@@ -213,10 +207,13 @@ async def readiness_probe():
     """
     
     try:
-        # Quick check of critical components
-        from app.services.analysis_engine import run_analysis
+        # Quick check of critical components, from the cached background checks
+        health_monitor.ensure_started()
+        snapshot = health_monitor.snapshot()
+        failing = [name for name in ("analysis_engine", "storage") if snapshot[name]["status"] == "unhealthy"]
+        if failing:
+            raise RuntimeError(f"Failing checks: {', '.join(failing)}")
         
-        # Very lightweight test
         return {
             "status": "ready",
             "timestamp": datetime.utcnow().isoformat(),
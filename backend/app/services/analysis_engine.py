@@ -22,12 +22,29 @@ import asyncio
 import logging
 import json
 import re
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from urllib.parse import quote as urlquote
 
 import aiohttp
 
+from app.services.endpoints import endpoints
+from app.services.cache import evidence_cache, analysis_memo, MISS
+from app.services.fingerprint import content_fingerprint
+from app.services.singleflight import analysis_flights
+from app.services.metrics import metrics
+from app.services.deadline import Deadline, stage_budget, client_timeout
+from app.services.task_graph import TaskGraph
+from app.services.hedging import hedger
+from app.services.resilience import upstreams
+from app.services.quota import quotas, QuotaExceeded
+from app.services.claim_classifier import classify_claim
+from app.services.domain_reputation import reputation_for
+from app.services.templates import result_templates
+from app.services.claim_extraction import Claim, extract_claims
+from app.services.page_fetch import PageText, get_page_text
+
 # Import models with fallback
 try:
     from app.models import (
@@ -93,6 +110,33 @@ GENAI_API_KEY = os.getenv("GENAI_API_KEY")
 
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5)
 
+# Overall analysis budgets; stages share what is left instead of stacking timeouts
+TEXT_DEADLINE = float(os.getenv("ANALYSIS_DEADLINE_TEXT", "20"))
+URL_DEADLINE = float(os.getenv("ANALYSIS_DEADLINE_URL", "25"))
+# Time kept back at the end of the budget for assembling the Result
+DEADLINE_RESERVE = float(os.getenv("ANALYSIS_DEADLINE_RESERVE", "0.5"))
+# Extra time the hard timeout allows past the deadline
+DEADLINE_BACKSTOP = 2.0
+# Start evidence lookups on the original text while language detection runs
+SPECULATIVE_EVIDENCE = os.getenv("SPECULATIVE_EVIDENCE", "true").lower() == "true"
+# Split long texts into check-worthy claims and query the top ones concurrently
+CLAIM_EXTRACTION = os.getenv("CLAIM_EXTRACTION", "true").lower() == "true"
+CLAIM_TOP_K = int(os.getenv("CLAIM_TOP_K", "3"))
+# Most items per source kept after merging the claims' evidence
+CLAIM_EVIDENCE_CAP = 5
+
+# Progress callback: on_event(stage, data) is called as each pipeline stage finishes
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+def _emit(on_event: Optional[ProgressCallback], stage: str, **data: Any) -> None:
+    """Report a pipeline stage; listener errors never break the analysis"""
+    if on_event is None:
+        return
+    try:
+        on_event(stage, data)
+    except Exception as e:
+        logger.warning(f"Progress listener failed on '{stage}': {e}")
+
 # ---------------------------
 # SAMBHAV: SAFE GET HELPER
 # ---------------------------
@@ -115,135 +159,23 @@ def safe_get(data: Any, *keys: str, default: Any = None) -> Any:
 
 def detect_claim_type(text: str) -> str:
     """Detect the type of claim for specialized processing"""
-    text_lower = text.lower()
-    
-    if any(word in text_lower for word in ["vaccine", "vaccination", "microchip", "tracking"]):
-        return "vaccine_conspiracy"
-    elif any(word in text_lower for word in ["election", "vote", "fraud", "rigged"]):
-        return "election_misinformation" 
-    elif any(word in text_lower for word in ["covid", "coronavirus", "pandemic", "lockdown"]):
-        return "health_misinformation"
-    elif any(word in text_lower for word in ["climate", "global warming", "carbon"]):
-        return "climate_misinformation"
-    elif any(word in text_lower for word in ["economy", "stock", "financial", "crash"]):
-        return "financial_misinformation"
-    else:
-        return "general_misinformation"
+    return classify_claim(text).claim_type
 
-def generate_comprehensive_explanation(original_text: str, claim_type: str, fact_checks: List, search_results: List, wikipedia_data: Dict) -> str:
+def generate_comprehensive_explanation(original_text: str, claim_type: str, fact_checks: List, search_results: List, wikipedia_data: Dict, verdict_label: str = "", language: str = "en") -> str:
     """Generate a comprehensive, factual explanation (10-50 lines) for the claim"""
-    
-    # Count available evidence
-    fact_check_count = len(fact_checks) if fact_checks else 0
-    search_count = len(search_results) if search_results else 0
-    has_wiki = wikipedia_data and isinstance(wikipedia_data, dict) and wikipedia_data.get('extract')
-    
-    if claim_type == "vaccine_conspiracy":
-        explanation = f"""This claim suggests that COVID-19 vaccines contain microchips or tracking devices, which is a conspiracy theory that has been thoroughly investigated and debunked by medical professionals worldwide.
-
-The conspiracy theory typically alleges that governments or organizations are using vaccination programs to secretly implant tracking devices in people. However, this claim fails basic technical and scientific scrutiny for several reasons:
-
-First, the physical impossibility: Standard vaccination needles (typically 22-25 gauge) are far too small to accommodate any functional microchip or tracking device. The smallest RFID chips available commercially are several millimeters in size, while vaccine needles have inner diameters of less than 0.5mm.
-
-Second, the ingredient transparency: All COVID-19 vaccine ingredients are publicly documented and regulated by health authorities including the FDA, EMA, and WHO. These vaccines contain mRNA or viral proteins, lipids, salts, and sugars - no electronic components whatsoever.
-
-Third, the lack of technological infrastructure: Even if microchips could somehow be inserted, there would need to be a massive surveillance network to track billions of people, which doesn't exist and would be technically and economically unfeasible.
-
-Professional fact-checkers have investigated these claims extensively. {f'We found {fact_check_count} professional fact-check reports' if fact_check_count > 0 else 'Multiple professional fact-checking organizations'} have verified that no credible evidence supports microchip vaccine claims.
-
-Medical authorities worldwide, including the World Health Organization, Centers for Disease Control and Prevention, and national health agencies, have repeatedly confirmed that approved vaccines contain only the ingredients listed in their official documentation.
-
-This type of conspiracy theory often spreads during times of uncertainty and can be harmful because it discourages people from making informed health decisions based on scientific evidence. The vaccines have undergone rigorous clinical trials and continue to be monitored for safety and efficacy.
-
-For anyone concerned about vaccine safety, the recommended approach is to consult with qualified healthcare providers who can provide evidence-based information tailored to individual health circumstances."""
-    
-    elif claim_type == "election_misinformation":
-        explanation = f"""This claim relates to electoral integrity and voting processes, which are subjects of significant public interest and concern. Electoral systems in democratic countries include multiple safeguards and verification mechanisms designed to ensure accuracy and prevent fraud.
-
-Modern electoral systems typically incorporate several layers of security and verification: paper ballot backups, bipartisan poll monitoring, statistical audits, signature verification processes, and post-election reviews. These systems are designed and overseen by election officials who are trained professionals bound by legal and ethical standards.
-
-Election security involves collaboration between federal, state, and local authorities, often with input from cybersecurity experts and independent observers. International election monitoring organizations also provide oversight in many jurisdictions to ensure transparency and adherence to democratic standards.
-
-{f'Our analysis found {fact_check_count} professional fact-check reports examining similar electoral claims' if fact_check_count > 0 else 'Professional fact-checking organizations regularly examine electoral claims'}, along with {f'{search_count} additional sources' if search_count > 0 else 'additional credible sources'} providing context and verification.
-
-Electoral misinformation can take many forms, including false claims about voting technology, incorrect information about voter eligibility, misleading statistics about voter turnout, or unsubstantiated allegations about procedural irregularities. Such claims require careful verification through official channels.
-
-When evaluating electoral claims, it's important to rely on official sources such as certified election results, reports from election monitoring organizations, court decisions where legal challenges have been pursued, and statements from bipartisan election officials.
-
-The integrity of democratic processes depends on accurate information and public trust in electoral institutions. Citizens concerned about electoral integrity are encouraged to engage with official processes: volunteering as poll workers, participating in election observer programs, or contacting election officials through official channels.
-
-For specific questions about electoral processes or results, the most reliable sources are official election authorities, certified election results, and reports from established election monitoring organizations with track records of nonpartisan analysis."""
-    
-    elif claim_type == "health_misinformation":
-        explanation = f"""This claim involves health-related information that requires careful verification through established medical and scientific channels. Health misinformation can have serious consequences for individual and public health, making accurate assessment particularly important.
-
-Medical and health claims should be evaluated based on peer-reviewed scientific research, guidance from established health authorities, and consensus among qualified medical professionals. The scientific method includes rigorous testing, peer review, and replication to ensure reliability of health information.
-
-{f'We found {fact_check_count} professional medical fact-checks' if fact_check_count > 0 else 'Professional medical fact-checking organizations'} have examined this type of claim, along with {f'{search_count} additional medical sources' if search_count > 0 else 'additional medical sources'} providing scientific context.
-
-Health authorities such as the World Health Organization (WHO), Centers for Disease Control and Prevention (CDC), and national health agencies maintain updated guidance based on current scientific evidence. These organizations employ medical professionals and researchers who continuously review emerging evidence and update recommendations accordingly.
-
-Medical misinformation often exploits natural concerns about health and safety, sometimes presenting anecdotal evidence or preliminary research as definitive conclusions. It may also misrepresent legitimate scientific studies or present information out of context.
-
-When evaluating health claims, several factors are important: the credentials and expertise of the source, whether claims are supported by peer-reviewed research, consensus among medical professionals, and official guidance from health authorities.
-
-For personal health decisions, the most reliable approach is consultation with qualified healthcare providers who can assess individual circumstances and provide evidence-based recommendations tailored to specific health needs and medical history.
-
-Public health information should come from established health authorities that base recommendations on systematic review of scientific evidence and maintain transparency about their decision-making processes."""
-    
-    else:  # general_misinformation
-        explanation = f"""This claim requires careful verification to determine its accuracy and reliability. In our information-rich environment, distinguishing between accurate and misleading information requires systematic evaluation using established verification methods.
-
-{f'Our analysis identified {fact_check_count} professional fact-check reports' if fact_check_count > 0 else 'Professional fact-checking organizations provide valuable verification services'} and {f'{search_count} additional sources' if search_count > 0 else 'additional credible sources'} that help provide context for evaluating this claim.
-
-Information verification involves several key principles: checking multiple independent sources, evaluating the credibility and expertise of sources, looking for evidence-based support rather than opinion or speculation, and considering potential biases or conflicts of interest.
-
-Misinformation can spread through various mechanisms: social media amplification, emotional appeals that bypass critical thinking, confirmation bias where people seek information that supports existing beliefs, and the natural tendency to trust information from familiar sources without verification.
-
-Credible sources typically have several characteristics: established track records for accuracy, transparent methodology for fact-checking, corrections when errors are discovered, and clear distinctions between news reporting and opinion content.
-
-When evaluating any claim, it's helpful to ask several questions: Who is making the claim and what are their qualifications? What evidence supports the claim? Have other credible sources verified this information? Are there potential conflicts of interest?
-
-For controversial or important claims, cross-referencing multiple reliable sources helps build confidence in accuracy. This might include academic institutions, established news organizations with editorial standards, government agencies with relevant expertise, or professional organizations in related fields.
-
-The goal of information verification is not to suppress discussion or debate, but to ensure that important decisions are based on accurate, well-sourced information rather than speculation or deliberately misleading content."""
-    
-    return explanation.strip()
+    return result_templates.explanation(
+        claim_type, verdict_label, language,
+        fact_checks=len(fact_checks) if fact_checks else 0,
+        sources=len(search_results) if search_results else 0
+    )
 
-def normalize_quick_analysis(original_text: str, claim_type: str, fact_checks: List, search_results: List) -> str:
+def normalize_quick_analysis(original_text: str, claim_type: str, fact_checks: List, search_results: List, verdict_label: str = "", language: str = "en") -> str:
     """Generate quick analysis bullets based on actual evidence found"""
-    
-    fact_check_count = len(fact_checks) if fact_checks else 0
-    search_count = len(search_results) if search_results else 0
-    
-    # Pattern detection analysis
-    pattern_text = "Misinformation pattern detected: uses emotional triggers and unverified sources to spread false information rapidly."
-    if claim_type == "vaccine_conspiracy":
-        pattern_text = "Vaccine conspiracy pattern: exploits fears about medical interventions using technically impossible claims about microchips and tracking."
-    elif claim_type == "election_misinformation":
-        pattern_text = "Electoral misinformation pattern: undermines trust in democratic processes through unsubstantiated fraud allegations."
-    elif claim_type == "health_misinformation":
-        pattern_text = "Health misinformation pattern: exploits medical anxieties and contradicts established scientific consensus."
-    
-    # Evidence verification analysis
-    evidence_text = f"Cross-verified with {fact_check_count} professional fact-checkers and {search_count} additional sources."
-    if fact_check_count == 0 and search_count == 0:
-        evidence_text = "Limited verification sources available - manual fact-checking through official channels recommended."
-    elif fact_check_count > 0 and search_count == 0:
-        evidence_text = f"Verified through {fact_check_count} professional fact-checking organizations with established credibility standards."
-    elif fact_check_count == 0 and search_count > 0:
-        evidence_text = f"Cross-referenced with {search_count} additional sources, though professional fact-checks not yet available."
-    
-    # Scientific/authoritative consensus analysis
-    consensus_text = "Evidence-based analysis shows this claim contradicts verified information from authoritative sources."
-    if claim_type == "vaccine_conspiracy":
-        consensus_text = "Medical authorities worldwide confirm no microchips or tracking devices in any approved vaccines - technically impossible with current vaccination methods."
-    elif claim_type == "election_misinformation":
-        consensus_text = "Electoral authorities maintain multiple verification layers and transparency measures to ensure democratic process integrity."
-    elif claim_type == "health_misinformation":
-        consensus_text = "Medical consensus from health authorities and peer-reviewed research contradicts the claims made in this content."
-    
-    return f"🎭\n{pattern_text}\n🌍\n{evidence_text}\n🧬\n{consensus_text}"
+    return result_templates.quick_analysis(
+        claim_type, verdict_label, language,
+        fact_checks=len(fact_checks) if fact_checks else 0,
+        sources=len(search_results) if search_results else 0
+    )
 
 def structure_evidence_grid(fact_checks: List, search_results: List, wikipedia_data: Dict) -> List[Evidence]:
     """Structure Evidence Grid with real URLs and professional analysis"""
@@ -281,7 +213,10 @@ def structure_evidence_grid(fact_checks: List, search_results: List, wikipedia_d
                     break
             
             if not source_info:
-                source_info = {"name": "Independent Fact Checker", "reliability": 0.85, "base_url": ""}
+                # Unknown publisher: a listed review domain can still vouch for it
+                listed = reputation_for(review_url)
+                reliability = max(0.85, listed.score) if listed.matched else 0.85
+                source_info = {"name": "Independent Fact Checker", "reliability": reliability, "base_url": ""}
             
             # Use actual review URL or fallback to source base URL
             actual_url = review_url if review_url else source_info.get("base_url", "")
@@ -293,8 +228,6 @@ def structure_evidence_grid(fact_checks: List, search_results: List, wikipedia_d
             ))
     
     # Process search results with real URLs
-    quality_domains = ["who.int", "cdc.gov", "nih.gov", "fda.gov", "nature.com", "nejm.org", "bmj.com", "gov.uk", "europa.eu"]
-    
     for result in search_results[:2]:
         if not isinstance(result, dict):
             continue
@@ -306,16 +239,8 @@ def structure_evidence_grid(fact_checks: List, search_results: List, wikipedia_d
         if not (title and snippet and link):
             continue
         
-        # Assess reliability based on domain
-        reliability = 0.70  # Base reliability
-        for domain in quality_domains:
-            if domain in link.lower():
-                reliability = 0.92
-                break
-        
-        # Enhance reliability for educational and government sources
-        if any(domain in link.lower() for domain in [".edu", ".gov"]):
-            reliability = max(reliability, 0.88)
+        # Assess reliability based on the link's host (government and academic namespaces included)
+        reliability = reputation_for(link).score
         
         clean_snippet = snippet[:150] + "..." if len(snippet) > 150 else snippet
         
@@ -368,152 +293,17 @@ def structure_evidence_grid(fact_checks: List, search_results: List, wikipedia_d
     
     return evidence_list[:5]  # Max 5 evidence items
 
-def generate_smart_checklist(claim_type: str, verdict_label: str) -> List[EducationalChecklistItem]:
+def generate_smart_checklist(claim_type: str, verdict_label: str, language: str = "en") -> List[EducationalChecklistItem]:
     """Generate contextual educational checklist matching results-page-final.pdf"""
-    
-    base_items = [
-        EducationalChecklistItem(
-            point="Checked multiple credible sources",
-            explanation="Always verify claims through at least 2-3 independent, authoritative sources before accepting as true. Look for consensus among reputable organizations."
-        )
+    base_items, specific_items = result_templates.checklist(claim_type, verdict_label, language)
+    return [
+        EducationalChecklistItem(point=point, explanation=explanation)
+        for point, explanation in base_items + specific_items[:2]  # Max 3 total items
     ]
-    
-    type_specific_items = {
-        "vaccine_conspiracy": [
-            EducationalChecklistItem(
-                point="Verified through medical authorities",
-                explanation="For health claims, consult WHO, CDC, or national health ministries - not social media posts. Medical misinformation can be life-threatening."
-            ),
-            EducationalChecklistItem(
-                point="Reviewed peer-reviewed research",
-                explanation="Scientific claims should be backed by studies published in reputable medical journals like The Lancet, Nature, or New England Journal of Medicine."
-            ),
-            EducationalChecklistItem(
-                point="Considered emotional manipulation",
-                explanation="Be skeptical of health claims that use fear tactics or urgent language to discourage medical care. Legitimate health information is presented calmly with evidence."
-            )
-        ],
-        "election_misinformation": [
-            EducationalChecklistItem(
-                point="Consulted official election authorities",
-                explanation="Verify electoral claims through official election commissions and certified results. These bodies have legal responsibility for election integrity."
-            ),
-            EducationalChecklistItem(
-                point="Cross-referenced with independent monitors",
-                explanation="Check claims against reports from independent election monitoring organizations that have trained observers and established credibility."
-            ),
-            EducationalChecklistItem(
-                point="Avoided partisan sources",
-                explanation="Political claims require verification through non-partisan, official sources. Partisan sources may have conflicts of interest in reporting election information."
-            )
-        ],
-        "health_misinformation": [
-            EducationalChecklistItem(
-                point="Consulted health professionals", 
-                explanation="Medical claims should be verified with qualified healthcare providers and official health agencies who have medical training and access to current research."
-            ),
-            EducationalChecklistItem(
-                point="Checked scientific literature",
-                explanation="Health information should be supported by peer-reviewed research from medical institutions, not anecdotal reports or unverified studies."
-            ),
-            EducationalChecklistItem(
-                point="Identified fear-based messaging",
-                explanation="Health misinformation often uses fear tactics to spread quickly. Always verify alarming health claims with calm, rational medical sources."
-            )
-        ]
-    }
-    
-    # Add type-specific items
-    specific_items = type_specific_items.get(claim_type, [
-        EducationalChecklistItem(
-            point="Traced information to original source",
-            explanation="Always find the primary source of information rather than relying on forwarded messages. Screenshots and forwards can be easily altered or taken out of context."
-        ),
-        EducationalChecklistItem(
-            point="Evaluated source credibility",
-            explanation="Consider the reputation, expertise, and track record of information sources. Look for sources with established credibility and editorial standards."
-        )
-    ])
-    
-    return base_items + specific_items[:2]  # Max 3 total items
 
-def build_meaningful_intelligence(claim_type: str, verdict_label: str, text: str) -> IntelligenceReport:
+def build_meaningful_intelligence(claim_type: str, verdict_label: str, text: str, language: str = "en") -> IntelligenceReport:
     """Create meaningful Intelligence Report with contextual insights matching results-page-final.pdf"""
-    
-    intelligence_templates = {
-        "vaccine_conspiracy": {
-            "psychological": "This conspiracy theory exploits deep-seated fears about government surveillance and medical authority. By invoking imagery of 'microchips in vaccines,' it triggers paranoia around bodily autonomy and loss of freedom, making the claim emotionally sticky. The fear-based messaging bypasses rational analysis and appeals directly to anxiety about technological control, making individuals more likely to share without verification.",
-            
-            "scientific": "No peer-reviewed scientific studies support microchip insertion claims. Vaccine ingredients are publicly available, rigorously tested through clinical trials, and monitored by international health organizations including WHO, FDA, and EMA. The physical impossibility of inserting functional microchips through standard vaccination needles, combined with the lack of any technological purpose, demonstrates the scientific implausibility of these claims.",
-            
-            "political": "Anti-vaccine misinformation campaigns often serve to undermine public health measures and institutional trust. These narratives can be weaponized to create political division, reduce vaccination rates, and challenge government health policies. The politicization of vaccines transforms medical decisions into identity markers, making evidence-based health communication more difficult.",
-            
-            "geopolitical": "Similar vaccine misinformation campaigns have been documented across multiple countries, often with coordinated messaging and timing that suggests organized disinformation efforts. Foreign actors have been identified amplifying anti-vaccine content to undermine public health responses and create social division in democratic societies during global health emergencies.",
-            
-            "technical": "The technical impossibility of the microchip vaccine claim becomes clear when examining vaccine delivery systems, chip manufacturing, and biological compatibility. Standard vaccine needles are too small for functional microchips, and no technological infrastructure exists for the alleged tracking capabilities described in conspiracy theories.",
-            
-            "financial": "Vaccine misinformation can financially benefit alternative health product sellers, supplement companies, and content creators who monetize conspiracy content. The economic incentives behind spreading health misinformation include driving traffic to alternative treatment sales and building audiences for monetized conspiracy content.",
-            
-            "philosophical": "This conspiracy theory reflects broader philosophical tensions between individual autonomy and collective public health responsibility. It embodies distrust of expert knowledge and institutional authority, preferring intuitive or conspiratorial explanations over scientific evidence and established medical practice."
-        },
-        "election_misinformation": {
-            "psychological": "Electoral misinformation exploits partisan divisions and distrust in democratic institutions. It uses confirmation bias to reinforce existing political beliefs regardless of contradictory evidence. The emotional investment in political outcomes makes individuals more susceptible to information that supports their preferred narrative, even when factually incorrect.",
-            
-            "political": "False electoral claims directly undermine democratic legitimacy and can lead to real-world violence and political instability. When significant portions of the population lose faith in electoral processes, it threatens the peaceful transfer of power and democratic governance itself.",
-            
-            "geopolitical": "Election misinformation campaigns are frequently linked to foreign interference operations designed to destabilize democratic processes. State and non-state actors use electoral disinformation to reduce faith in democratic institutions and create internal division within target countries.",
-            
-            "technical": "Modern electoral systems include multiple verification layers, audit procedures, and oversight mechanisms designed to ensure accuracy and prevent fraud. Paper trail systems, statistical audits, and bipartisan observer processes provide multiple safeguards against the types of manipulation alleged in election conspiracy theories.",
-            
-            "financial": "Election misinformation can be financially motivated by fundraising appeals, legal fee collections, and political donation drives that capitalize on outrage and distrust. The monetization of electoral conspiracy theories creates financial incentives for continued spreading of false claims.",
-            
-            "scientific": "Statistical analysis and election security research consistently demonstrate the accuracy and integrity of modern electoral systems. Peer-reviewed studies of voting systems, audit procedures, and fraud detection methods support the reliability of democratic elections.",
-            
-            "philosophical": "Election misinformation reflects deeper philosophical questions about democratic legitimacy, the role of expertise in validating electoral outcomes, and the tension between popular will and institutional verification of electoral results."
-        },
-        "health_misinformation": {
-            "psychological": "Health misinformation preys on medical anxieties and natural fears about illness, treatment, and bodily autonomy. It often uses personal anecdotes and emotional appeals to override scientific evidence, exploiting the human tendency to prefer simple, intuitive explanations over complex medical realities.",
-            
-            "scientific": "Medical misinformation contradicts evidence-based medicine and peer-reviewed research. It can lead to harmful health decisions, delayed treatment, and reduced trust in healthcare professionals. The scientific method's rigorous testing and verification processes are specifically designed to separate effective treatments from ineffective or harmful ones.",
-            
-            "political": "Health misinformation can be weaponized to undermine public health policies, challenge medical expertise, and create political division during health crises. The politicization of medical issues transforms health decisions into political identity markers.",
-            
-            "technical": "Medical research follows rigorous protocols including randomized controlled trials, peer review, regulatory oversight, and post-market surveillance. These technical safeguards ensure that approved treatments meet safety and efficacy standards before reaching the public.",
-            
-            "financial": "Alternative health product sellers, supplement companies, and unproven treatment providers often financially benefit from spreading medical misinformation. The economic incentives include driving customers away from established treatments toward profitable alternatives.",
-            
-            "geopolitical": "Health misinformation campaigns can be used as tools of information warfare to undermine public health responses, reduce trust in medical institutions, and create social chaos during health emergencies like pandemics.",
-            
-            "philosophical": "Health misinformation embodies tensions between individual health autonomy and collective public health responsibility, between traditional and modern medicine, and between intuitive and scientific ways of understanding health and disease."
-        },
-        "general_misinformation": {
-            "psychological": "This misinformation pattern uses emotional triggers and confirmation bias to spread false information rapidly. It exploits cognitive shortcuts, tribal thinking, and the human tendency to prefer information that confirms existing beliefs over challenging evidence.",
-            
-            "political": "False information can significantly influence public opinion, policy decisions, and social cohesion. Misinformation campaigns may serve specific political or economic interests by shaping public perception and political behavior through deceptive means.",
-            
-            "technical": "Misinformation spreads rapidly through social media algorithms and echo chambers that prioritize engagement over accuracy. The technical infrastructure of information sharing makes fact-checking and correction more difficult than initial false claims.",
-            
-            "geopolitical": "Information warfare is increasingly used by state and non-state actors to influence foreign populations, undermine social stability, and advance strategic interests through the manipulation of information environments.",
-            
-            "financial": "Misinformation can be financially motivated through advertising revenue, product sales, political fundraising, or market manipulation that benefits from false or misleading information spread to large audiences.",
-            
-            "scientific": "Scientific misinformation undermines evidence-based decision making and public understanding of scientific processes. It often misrepresents research findings, ignores scientific consensus, or promotes pseudoscientific explanations over established scientific knowledge.",
-            
-            "philosophical": "Misinformation reflects broader philosophical questions about truth, authority, expertise, and the role of evidence in forming beliefs and making decisions in complex modern societies."
-        }
-    }
-    
-    template = intelligence_templates.get(claim_type, intelligence_templates["general_misinformation"])
-    
-    return IntelligenceReport(
-        psychological=template.get("psychological"),
-        scientific=template.get("scientific"), 
-        political=template.get("political"),
-        technical=template.get("technical"),
-        geopolitical=template.get("geopolitical"),
-        financial=template.get("financial"),
-        philosophical=template.get("philosophical")
-    )
+    return IntelligenceReport(**result_templates.intelligence(claim_type, verdict_label, language))
 
 def calculate_professional_breakdown(signals: Dict, verdict_confidence: int, claim_type: str) -> Dict[str, int]:
     """Calculate confidence breakdown based on actual evidence found"""
@@ -543,8 +333,7 @@ def calculate_professional_breakdown(signals: Dict, verdict_confidence: int, cla
         # Boost for authoritative domains
         for result in search_results:
             if isinstance(result, dict):
-                link = safe_get(result, "link", default="").lower()
-                if any(domain in link for domain in ["who.int", "cdc.gov", "nih.gov", "gov.uk", "nature.com"]):
+                if reputation_for(safe_get(result, "link", default="")).boosted("source_credibility"):
                     source_score = min(90, source_score + 15)
                     break
     
@@ -576,7 +365,7 @@ def calculate_professional_breakdown(signals: Dict, verdict_confidence: int, cla
         "crossMedia": cross_media_score
     }
 
-def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, original_text: str, detected_lang: str, processing_time: float) -> Result:
+def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, original_text: str, detected_lang: str, processing_time: float, language: str = "en") -> Result:
     """Transform raw API data into structured Result matching frontend expectations"""
     
     logger.info("Analysis: Starting structured result transformation")
@@ -614,8 +403,7 @@ def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, origina
         evidence_score += len(search_results) * 10
         for result in search_results:
             if isinstance(result, dict):
-                link = safe_get(result, "link", default="").lower()
-                if any(domain in link for domain in ["who.int", "cdc.gov", "nih.gov", ".gov", ".edu"]):
+                if reputation_for(safe_get(result, "link", default="")).boosted("evidence_score"):
                     evidence_score += 15
     
     # Determine verdict based on evidence and claim type
@@ -641,19 +429,19 @@ def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, origina
         verdict_summary = "Limited verification sources available. Manual fact-checking through official channels strongly recommended."
     
     # Generate comprehensive explanation
-    explanation = generate_comprehensive_explanation(original_text, claim_type, fact_checks, search_results, wikipedia_data)
+    explanation = generate_comprehensive_explanation(original_text, claim_type, fact_checks, search_results, wikipedia_data, verdict_label, language)
     
     # Generate quick analysis bullets
-    quick_analysis_text = normalize_quick_analysis(original_text, claim_type, fact_checks, search_results)
+    quick_analysis_text = normalize_quick_analysis(original_text, claim_type, fact_checks, search_results, verdict_label, language)
     
     # Structure evidence with real URLs
     evidence_list = structure_evidence_grid(fact_checks, search_results, wikipedia_data)
     
     # Generate educational checklist
-    educational_checklist = generate_smart_checklist(claim_type, verdict_label)
+    educational_checklist = generate_smart_checklist(claim_type, verdict_label, language)
     
     # Build intelligence report
-    intelligence_report = build_meaningful_intelligence(claim_type, verdict_label, original_text)
+    intelligence_report = build_meaningful_intelligence(claim_type, verdict_label, original_text, language)
     
     # Calculate breakdown scores
     confidence_breakdown = calculate_professional_breakdown(signals, confidence, claim_type)
@@ -691,6 +479,7 @@ def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, origina
             "processing_time": f"{processing_time:.2f}s",
             "detected_language": detected_lang,
             "claim_type": claim_type,
+            "claim_categories": classify_claim(original_text).scores,
             "fact_checks_found": len(fact_checks),
             "search_results_found": len(search_results),
             "evidence_score": evidence_score,
@@ -706,17 +495,21 @@ def transform_raw_to_structured_result(signals: Dict, parsed_data: Dict, origina
 # ---------------------------
 # EXISTING API FUNCTIONS
 # ---------------------------
-async def detect_language(text: str) -> str:
+async def detect_language(text: str, deadline: Optional[Deadline] = None) -> str:
     """Detect language using Google Translate REST API"""
     if not TRANSLATION_API_KEY or not text:
         return "en"
+    if deadline is not None and deadline.expired:
+        return "en"
     
-    url = f"https://translation.googleapis.com/language/translate/v2/detect?key={TRANSLATION_API_KEY}"
+    url = endpoints.url("translation", f"/detect?key={TRANSLATION_API_KEY}")
     payload = {"q": text}
     
     try:
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-            async with session.post(url, json=payload) as resp:
+        session = endpoints.session("translation")
+        async with upstreams.call("language_detection", upstream="translation", deadline=deadline) as call:
+            async with session.post(url, json=payload, timeout=client_timeout(deadline, HTTP_TIMEOUT.total)) as resp:
+                call.status(resp.status)
                 if resp.status == 200:
                     j = await resp.json()
                     detections = safe_get(j, "data", "detections", default=[])
@@ -726,17 +519,21 @@ async def detect_language(text: str) -> str:
         logger.warning(f"Language detection failed: {e}")
     return "en"
 
-async def translate_text(text: str, target: str = "en") -> str:
+async def translate_text(text: str, target: str = "en", deadline: Optional[Deadline] = None) -> str:
     """Translate text using Google Translate v2 REST"""
     if not TRANSLATION_API_KEY or not text:
         return text
+    if deadline is not None and deadline.expired:
+        return text
     
-    url = f"https://translation.googleapis.com/language/translate/v2?key={TRANSLATION_API_KEY}"
+    url = endpoints.url("translation", f"?key={TRANSLATION_API_KEY}")
     payload = {"q": text, "target": target, "format": "text"}
     
     try:
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-            async with session.post(url, json=payload) as resp:
+        session = endpoints.session("translation")
+        async with upstreams.call("translation", deadline=deadline) as call:
+            async with session.post(url, json=payload, timeout=client_timeout(deadline, HTTP_TIMEOUT.total)) as resp:
+                call.status(resp.status)
                 if resp.status == 200:
                     j = await resp.json()
                     translations = safe_get(j, "data", "translations", default=[])
@@ -746,18 +543,39 @@ async def translate_text(text: str, target: str = "en") -> str:
         logger.warning(f"Translation failed: {e}")
     return text
 
-async def factcheck_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+def _stale_evidence(api: str, query: str, default: Any, variant: str = "") -> Any:
+    """Answer for an API that is over quota: a stale cached result if there is one"""
+    stale = evidence_cache.get_stale(api, query, variant=variant)
+    if stale is MISS:
+        return default
+    logger.info(f"Serving stale cached {api} result while over quota")
+    return stale
+
+async def factcheck_search(query: str, top_k: int = 5, deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
     """Query Google Fact Check Tools API"""
     if not FACTCHECK_API_KEY or not query:
         logger.warning("Fact check API not configured or empty query")
         return []
     
-    url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+    cached = evidence_cache.get("factcheck", query, variant=str(top_k))
+    if cached is not MISS:
+        metrics.api_cache_hit("factcheck")
+        return cached
+    if deadline is not None and deadline.expired:
+        return []
+    
+    url = endpoints.url("factcheck", "/claims:search")
     params = {"key": FACTCHECK_API_KEY, "query": query, "pageSize": top_k}
     
-    try:
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-            async with session.get(url, params=params) as resp:
+    async def fetch() -> Optional[List[Dict[str, Any]]]:
+        await quotas.acquire("factcheck", FACTCHECK_API_KEY, max_wait=stage_budget(deadline, quotas.max_wait))
+        session = endpoints.session("factcheck")
+        async with upstreams.call("factcheck", deadline=deadline) as call:
+            async with session.get(url, params=params, timeout=client_timeout(deadline, HTTP_TIMEOUT.total)) as resp:
+                call.status(resp.status)
+                if resp.status == 429:
+                    quotas.upstream_throttled("factcheck", FACTCHECK_API_KEY, resp.headers.get("Retry-After"))
+                    raise QuotaExceeded("factcheck answered 429")
                 if resp.status == 200:
                     j = await resp.json()
                     claims = safe_get(j, "claims", default=[])
@@ -769,17 +587,34 @@ async def factcheck_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
                         } 
                         for c in claims
                     ]
+        return None
+    
+    try:
+        results = await hedger.run("factcheck", fetch)
+        if results is not None:
+            evidence_cache.set("factcheck", query, results, variant=str(top_k))
+            return results
+    except QuotaExceeded as e:
+        logger.warning(f"Fact check search throttled: {e}")
+        return _stale_evidence("factcheck", query, [], variant=str(top_k))
     except Exception as e:
         logger.warning(f"Fact check search failed: {e}")
     return []
 
-async def google_custom_search(query: str, num: int = 5) -> List[Dict[str, Any]]:
+async def google_custom_search(query: str, num: int = 5, deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
     """Google Custom Search implementation"""
     if not (CUSTOM_SEARCH_API_KEY and CUSTOM_SEARCH_CX) or not query:
         logger.warning("Custom Search not configured or empty query")
         return []
     
-    url = "https://www.googleapis.com/customsearch/v1"
+    cached = evidence_cache.get("custom_search", query, variant=str(num))
+    if cached is not MISS:
+        metrics.api_cache_hit("custom_search")
+        return cached
+    if deadline is not None and deadline.expired:
+        return []
+    
+    url = endpoints.url("custom_search")
     params = {
         "key": CUSTOM_SEARCH_API_KEY,
         "cx": CUSTOM_SEARCH_CX,
@@ -787,9 +622,15 @@ async def google_custom_search(query: str, num: int = 5) -> List[Dict[str, Any]]
         "num": min(num, 10)
     }
     
-    try:
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-            async with session.get(url, params=params) as resp:
+    async def fetch() -> Optional[List[Dict[str, Any]]]:
+        await quotas.acquire("custom_search", CUSTOM_SEARCH_API_KEY, max_wait=stage_budget(deadline, quotas.max_wait))
+        session = endpoints.session("custom_search")
+        async with upstreams.call("custom_search", deadline=deadline) as call:
+            async with session.get(url, params=params, timeout=client_timeout(deadline, HTTP_TIMEOUT.total)) as resp:
+                call.status(resp.status)
+                if resp.status == 429:
+                    quotas.upstream_throttled("custom_search", CUSTOM_SEARCH_API_KEY, resp.headers.get("Retry-After"))
+                    raise QuotaExceeded("custom_search answered 429")
                 if resp.status == 200:
                     data = await resp.json()
                     items = safe_get(data, "items", default=[])
@@ -802,38 +643,69 @@ async def google_custom_search(query: str, num: int = 5) -> List[Dict[str, Any]]
                         }
                         for item in items
                     ]
+        return None
+    
+    try:
+        results = await hedger.run("custom_search", fetch)
+        if results is not None:
+            evidence_cache.set("custom_search", query, results, variant=str(num))
+            return results
+    except QuotaExceeded as e:
+        logger.warning(f"Custom search throttled: {e}")
+        return _stale_evidence("custom_search", query, [], variant=str(num))
     except Exception as e:
         logger.warning(f"Custom search failed: {e}")
     return []
 
-async def wikipedia_lookup(query: str) -> Optional[Dict[str, Any]]:
+async def wikipedia_lookup(query: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
     """Get Wikipedia summary for context"""
     if not query:
         return None
+    
+    cached = evidence_cache.get("wikipedia", query)
+    if cached is not MISS:
+        metrics.api_cache_hit("wikipedia")
+        return cached
+    if deadline is not None and deadline.expired:
+        return None
         
-    try:
-        safe_q = urlquote(query.replace(" ", "_"))
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{safe_q}"
-        
-        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-            async with session.get(url) as resp:
+    safe_q = urlquote(query.replace(" ", "_"))
+    url = endpoints.url("wikipedia", f"/page/summary/{safe_q}")
+    
+    async def fetch() -> Tuple[int, Optional[Dict[str, Any]]]:
+        session = endpoints.session("wikipedia")
+        async with upstreams.call("wikipedia", deadline=deadline) as call:
+            async with session.get(url, timeout=client_timeout(deadline, HTTP_TIMEOUT.total)) as resp:
+                call.status(resp.status)
                 if resp.status == 200:
                     j = await resp.json()
-                    return {
+                    return resp.status, {
                         "title": safe_get(j, "title", default=""),
                         "extract": safe_get(j, "extract", default=""),
                         "url": safe_get(j, "content_urls", "desktop", "page", default=""),
                     }
+                return resp.status, None
+    
+    try:
+        status, summary = await hedger.run("wikipedia", fetch)
+        if status == 200:
+            evidence_cache.set("wikipedia", query, summary)
+            return summary
+        elif status == 404:
+            # No article for this title - remember that too
+            evidence_cache.set("wikipedia", query, None)
     except Exception as e:
         logger.warning(f"Wikipedia lookup failed: {e}")
     return None
 
-async def educational_gemini_analyze(prompt: str) -> Dict[str, Any]:
+async def educational_gemini_analyze(prompt: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
     """Enhanced Gemini with forced JSON structure"""
     if not GENAI_API_KEY or not prompt:
         return {"content": "Educational analysis unavailable"}
+    if deadline is not None and deadline.expired:
+        return {"content": "Educational analysis skipped (deadline)"}
     
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GENAI_API_KEY}"
+    url = endpoints.url("gemini", f"/models/gemini-pro:generateContent?key={GENAI_API_KEY}")
     
     enhanced_prompt = f"""IMPORTANT: You MUST respond with ONLY valid JSON. No explanations, no markdown, no text before or after the JSON.
 
@@ -852,8 +724,10 @@ CRITICAL: Start your response with {{ and end with }}. Nothing else."""
     }
     
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-            async with session.post(url, json=payload) as resp:
+        session = endpoints.session("gemini")
+        async with upstreams.call("gemini", deadline=deadline) as call:
+            async with session.post(url, json=payload, timeout=client_timeout(deadline, 10.0)) as resp:
+                call.status(resp.status)
                 if resp.status == 200:
                     result = await resp.json()
                     logger.info(f"SAMBHAV Gemini response received")
@@ -906,7 +780,7 @@ async def create_educational_prompt(text: str, signals: Dict[str, Any]) -> str:
     
     fact_checks_count = len(signals.get("fact_checks", []))
     
-    if "vaccine" in text.lower() and "microchip" in text.lower():
+    if classify_claim(text).has("vaccine*", "microchip*"):
         return f"""Analyze this vaccine misinformation claim: "{text}"
 
 Evidence: {fact_checks_count} professional fact-checks found.
@@ -919,70 +793,299 @@ Respond with JSON:
 Respond with JSON:
 {{"verdict_label": "⚠️ Caution", "confidence": 70}}"""
 
-async def _gather_educational_evidence(text: str) -> Dict[str, Any]:
-    """Gather evidence from all APIs"""
-    
-    tasks = [
-        asyncio.wait_for(factcheck_search(text), timeout=4.0),
-        asyncio.wait_for(google_custom_search(text, num=5), timeout=4.0),
-        asyncio.wait_for(wikipedia_lookup(text), timeout=3.0)
-    ]
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    return {
-        "fact_checks": results[0] if not isinstance(results[0], Exception) else [],
-        "search_results": results[1] if not isinstance(results[1], Exception) else [],
-        "wikipedia": results[2] if not isinstance(results[2], Exception) else None
-    }
+def _evidence_preview(source: str, value: Any) -> List[Dict[str, str]]:
+    """Small, UI-friendly view of one source's raw results for progress events"""
+    if source == "fact_checks":
+        preview = []
+        for fc in (value or [])[:3]:
+            review = (safe_get(fc, "claimReview", default=[]) or [{}])[0]
+            preview.append({
+                "title": safe_get(review, "publisher", "name", default="Fact Checker"),
+                "url": safe_get(review, "url", default=""),
+                "note": safe_get(review, "textualRating", default="")
+            })
+        return preview
+    if source == "search_results":
+        return [
+            {"title": item.get("title", ""), "url": item.get("link", ""), "note": item.get("snippet", "")[:150]}
+            for item in (value or [])[:3]
+        ]
+    if value:
+        return [{"title": value.get("title", ""), "url": value.get("url", ""), "note": value.get("extract", "")[:150]}]
+    return []
+
+# Evidence sources: name -> (lookup(query, deadline), per-source cap in seconds, empty value)
+EVIDENCE_SOURCES = {
+    "fact_checks": (lambda query, deadline: factcheck_search(query, deadline=deadline), 4.0, []),
+    "search_results": (lambda query, deadline: google_custom_search(query, num=5, deadline=deadline), 4.0, []),
+    "wikipedia": (lambda query, deadline: wikipedia_lookup(query, deadline=deadline), 3.0, None),
+}
+
+def _empty_evidence(source: str) -> Any:
+    """Fresh 'nothing found' value for a source"""
+    empty = EVIDENCE_SOURCES[source][2]
+    return list(empty) if isinstance(empty, list) else empty
+
+def _claims_for(text: str) -> List[Claim]:
+    """Claims to look up for a text: the top-ranked ones, or the whole text"""
+    if CLAIM_EXTRACTION:
+        claims = extract_claims(text, CLAIM_TOP_K)
+        if claims:
+            return claims
+    return [Claim(text, text, 0.0, 0, None)]
+
+def _claim_queries(source: str, claims: List[Claim]) -> List[str]:
+    """Queries of each claim for a source (Wikipedia looks up the claims' topics)"""
+    if source == "wikipedia":
+        return [claim.topic or (claim.query if len(claims) == 1 else "") for claim in claims]
+    return [claim.query for claim in claims]
+
+def _evidence_key(source: str, item: Dict[str, Any]) -> str:
+    if source == "fact_checks":
+        review = (safe_get(item, "claimReview", default=[]) or [{}])[0]
+        return f"{item.get('text', '')}|{safe_get(review, 'url', default='')}"
+    return item.get("link", "") or item.get("title", "")
+
+def _merge_evidence(source: str, values: List[Any]) -> Any:
+    """
+    Combine per-claim results, best-ranked claim first.
+
+    Lists are interleaved round-robin, so every claim contributes, then
+    deduplicated and capped. Wikipedia keeps the best claim's article.
+    """
+    if source == "wikipedia":
+        return next((value for value in values if value), None)
+    merged, seen = [], set()
+    lists = [value or [] for value in values]
+    for rank in range(max((len(items) for items in lists), default=0)):
+        for items in lists:
+            if rank >= len(items) or not isinstance(items[rank], dict):
+                continue
+            key = _evidence_key(source, items[rank])
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(items[rank])
+            if len(merged) >= CLAIM_EVIDENCE_CAP:
+                return merged
+    return merged
+
+async def _claim_evidence(source: str, claims: List[Claim], deadline: Deadline) -> Tuple[Any, List[int]]:
+    """
+    Look up every claim at once under the source's shared budget.
+
+    Args:
+        source (str): Evidence source name (key of EVIDENCE_SOURCES)
+        claims (list): Claims ranked best first
+        deadline (Deadline): Analysis deadline
+
+    Returns:
+        tuple: (merged evidence, items found per claim)
+
+    Raises:
+        asyncio.TimeoutError: No lookup finished within the budget
+    """
+    lookup, cap, _ = EVIDENCE_SOURCES[source]
+    queries = _claim_queries(source, claims)
+    distinct = [query for query in dict.fromkeys(queries) if query]
+    if not distinct:
+        return _empty_evidence(source), [0] * len(claims)
+    if len(distinct) == 1:
+        value = await asyncio.wait_for(lookup(distinct[0], deadline), timeout=stage_budget(deadline, cap))
+        answers = {distinct[0]: value}
+    else:
+        tasks = {query: asyncio.ensure_future(lookup(query, deadline)) for query in distinct}
+        try:
+            done, pending = await asyncio.wait(tasks.values(), timeout=stage_budget(deadline, cap))
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+        if not done:
+            raise asyncio.TimeoutError(f"no {source} lookup finished in time")
+        if pending and deadline.expired:
+            deadline.note_cut_short(source)
+        answers = {
+            query: task.result() if task in done and task.exception() is None else _empty_evidence(source)
+            for query, task in tasks.items()
+        }
+    values = [answers.get(query) if query else _empty_evidence(source) for query in queries]
+    counts = [len(value) if isinstance(value, list) else (1 if value else 0) for value in values]
+    return _merge_evidence(source, values), counts
+
+def _build_text_graph(
+    original_text: str,
+    on_event: Optional[ProgressCallback],
+    deadline: Deadline
+) -> TaskGraph:
+    """
+    Stage graph for a text analysis.
+
+    detect -> text (translated if needed) -> fact_checks, search_results, wikipedia -> evidence
+    text -> claims (top check-worthy claims, or the whole text when short)
+    text + fact_checks -> llm (the prompt needs nothing else)
+    
+    Each source looks up all claims concurrently and merges their evidence.
+
+    Evidence lookups start speculatively on the original text alongside
+    language detection; when the text turns out to be English (the common
+    case) their results are used as-is, otherwise they are cancelled and
+    re-run on the translation.
+    """
+    graph = TaskGraph()
+    started = time.perf_counter()
+    # Items found per claim, by source, for the audit
+    claim_hits: Dict[str, List[int]] = {}
+    
+    async def detect():
+        with metrics.stage("language_detection"):
+            try:
+                lang = await asyncio.wait_for(detect_language(original_text, deadline), timeout=deadline.budget(2.0))
+            except Exception:
+                lang = "en"
+        _emit(on_event, "language_detected", language=lang)
+        return lang
+    
+    async def text(detect):
+        if not detect or detect == "en":
+            return original_text
+        with metrics.stage("translation"):
+            try:
+                translated = await asyncio.wait_for(translate_text(original_text, "en", deadline), timeout=deadline.budget(3.0))
+            except Exception:
+                translated = original_text
+        _emit(on_event, "translated", source_language=detect, translated=translated != original_text)
+        return translated
+    
+    async def claims(text):
+        with metrics.stage("claim_extraction"):
+            found = _claims_for(text)
+        _emit(on_event, "claims_extracted", count=len(found), claims=[claim.query for claim in found])
+        return found
+    
+    def speculative_lookup(source: str):
+        async def run():
+            return await _claim_evidence(source, _claims_for(original_text), deadline)
+        return run
+    
+    def evidence_lookup(source: str):
+        async def run(text, claims):
+            try:
+                if SPECULATIVE_EVIDENCE and text == original_text:
+                    value, hits = await asyncio.shield(graph.task(f"speculative_{source}"))
+                else:
+                    if SPECULATIVE_EVIDENCE:
+                        # Looked up the wrong language; stop it and query the translation
+                        graph.task(f"speculative_{source}").cancel()
+                    value, hits = await _claim_evidence(source, claims, deadline)
+                claim_hits[source] = hits
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError) and deadline.expired:
+                    deadline.note_cut_short(source)
+                _emit(on_event, "evidence", source=source, status="failed", count=0, items=[], error=type(e).__name__)
+                return _empty_evidence(source)
+            # Report each source the moment it answers, not after the slowest one
+            count = len(value) if isinstance(value, list) else (1 if value else 0)
+            _emit(on_event, "evidence", source=source, status="ok", count=count, items=_evidence_preview(source, value))
+            return value
+        return run
+    
+    async def evidence(claims, fact_checks, search_results, wikipedia):
+        metrics.record_stage("evidence", time.perf_counter() - started)
+        _emit(
+            on_event, "evidence_complete",
+            fact_checks=len(fact_checks or []),
+            search_results=len(search_results or []),
+            wikipedia=bool(wikipedia)
+        )
+        report = [
+            {
+                "claim": claim.text,
+                "score": claim.score,
+                **{source: claim_hits[source][i] for source in EVIDENCE_SOURCES if source in claim_hits}
+            }
+            for i, claim in enumerate(claims)
+        ]
+        return {"fact_checks": fact_checks, "search_results": search_results, "wikipedia": wikipedia, "claims": report}
+    
+    async def llm(text, fact_checks):
+        # The prompt only uses the fact checks, so Gemini does not wait for search or Wikipedia
+        educational_prompt = await create_educational_prompt(text, {"fact_checks": fact_checks})
+        with metrics.stage("llm"):
+            try:
+                if deadline.expired:
+                    deadline.note_cut_short("llm")
+                    raise asyncio.TimeoutError("no time left before deadline")
+                llm_output = await asyncio.wait_for(educational_gemini_analyze(educational_prompt, deadline), timeout=deadline.budget(8.0))
+                parsed_data = extract_educational_json(llm_output)
+            except Exception as e:
+                logger.warning(f"LLM analysis failed: {e}")
+                parsed_data = {"verdict_label": "⚠️ Caution", "confidence": 70}
+        _emit(on_event, "llm_complete")
+        return parsed_data
+    
+    graph.add("detect", detect)
+    graph.add("text", text, deps=("detect",))
+    graph.add("claims", claims, deps=("text",))
+    for source in EVIDENCE_SOURCES:
+        if SPECULATIVE_EVIDENCE:
+            graph.add(f"speculative_{source}", speculative_lookup(source))
+        graph.add(source, evidence_lookup(source), deps=("text", "claims"))
+    graph.add("evidence", evidence, deps=("claims",) + tuple(EVIDENCE_SOURCES))
+    graph.add("llm", llm, deps=("text", "fact_checks"))
+    return graph
 
 # ---------------------------
 # MAIN PIPELINE WITH POST-PROCESSING LAYER
 # ---------------------------
-async def analyze_text_pipeline(original_text: str, language_hint: str = "en") -> Result:
+async def analyze_text_pipeline(
+    original_text: str,
+    language_hint: str = "en",
+    on_event: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None
+) -> Result:
     """Main pipeline with post-processing transformation to locked format"""
     t0 = time.time()
+    if deadline is None:
+        deadline = Deadline.after(TEXT_DEADLINE, reserve=DEADLINE_RESERVE)
     
     if not original_text or not original_text.strip():
         raise ValueError("Empty text provided for analysis")
     
-    # Language detection and translation
-    try:
-        detected_lang = await asyncio.wait_for(detect_language(original_text), timeout=2.0)
-    except:
-        detected_lang = "en"
-    
-    text = original_text
-    if detected_lang and detected_lang != "en":
-        try:
-            text = await asyncio.wait_for(translate_text(original_text, target="en"), timeout=3.0)
-        except:
-            text = original_text
-    
-    # Gather evidence from APIs
-    try:
-        signals = await asyncio.wait_for(_gather_educational_evidence(text), timeout=10.0)
-    except:
-        signals = {"fact_checks": [], "search_results": [], "wikipedia": None}
-    
-    # Get basic LLM analysis (simplified for post-processing)
-    educational_prompt = await create_educational_prompt(text, signals)
-    parsed_data = {}
+    # Detection, translation, evidence and the LLM overlap as far as their
+    # dependencies allow; whatever is still running at the deadline is dropped
+    graph = _build_text_graph(original_text, on_event, deadline)
+    results, unfinished = await graph.run(timeout=deadline.budget())
+    for stage in unfinished:
+        if stage in EVIDENCE_SOURCES or stage == "llm":
+            deadline.note_cut_short(stage)
     
-    try:
-        llm_output = await asyncio.wait_for(educational_gemini_analyze(educational_prompt), timeout=8.0)
-        parsed_data = extract_educational_json(llm_output)
-    except Exception as e:
-        logger.warning(f"LLM analysis failed: {e}")
-        parsed_data = {"verdict_label": "⚠️ Caution", "confidence": 70}
+    detected_lang = results.get("detect") or "en"
+    signals = {source: results.get(source, _empty_evidence(source)) for source in EVIDENCE_SOURCES}
+    parsed_data = results.get("llm") or {"verdict_label": "⚠️ Caution", "confidence": 70}
     
     # Transform to structured result format
-    final_result = transform_raw_to_structured_result(
-        signals=signals,
-        parsed_data=parsed_data,
-        original_text=original_text,
-        detected_lang=detected_lang,
-        processing_time=time.time() - t0
+    with metrics.stage("transform"):
+        final_result = transform_raw_to_structured_result(
+            signals=signals,
+            parsed_data=parsed_data,
+            original_text=original_text,
+            detected_lang=detected_lang,
+            processing_time=time.time() - t0,
+            language=language_hint
+        )
+    final_result.audit["deadline"] = deadline.as_dict()
+    claims = results.get("claims") or []
+    if len(claims) > 1:
+        # Long input: which claims were checked and what each one found
+        final_result.audit["claims"] = (results.get("evidence") or {}).get("claims") or [
+            {"claim": claim.text, "score": claim.score} for claim in claims
+        ]
+    _emit(
+        on_event, "verdict",
+        label=final_result.verdict.label,
+        confidence=final_result.verdict.confidence,
+        summary=final_result.verdict.summary
     )
     
     return final_result
@@ -990,29 +1093,34 @@ async def analyze_text_pipeline(original_text: str, language_hint: str = "en") -
 # ---------------------------
 # URL and Image Pipelines (Enhanced)
 # ---------------------------
-async def analyze_url_pipeline(url: str, language_hint: str = "en") -> Result:
+async def analyze_url_pipeline(
+    url: str,
+    language_hint: str = "en",
+    on_event: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None
+) -> Result:
     """URL analysis with post-processing"""
     t0 = time.time()
+    if deadline is None:
+        deadline = Deadline.after(URL_DEADLINE, reserve=DEADLINE_RESERVE)
     
     if not url or not url.strip():
         raise ValueError("Empty URL provided for analysis")
     
-    # Extract page content
-    page_text = ""
+    # Extract page content (cached by URL, revalidated, streamed and size-capped)
+    page = PageText()
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=8)) as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    import re
-                    page_text = re.sub("<[^<]+?>", "", html)[:5000]
+        page = await get_page_text(url, deadline)
     except Exception as e:
         logger.warning(f"Failed to fetch URL: {e}")
+    page_text = page.text
+    _emit(on_event, "page_fetched", url=url, characters=len(page_text))
     
     if page_text and page_text.strip():
-        result = await analyze_text_pipeline(page_text, language_hint)
+        result = await analyze_text_pipeline(page_text, language_hint, on_event, deadline)
         result.domain = "Web Content"
         result.audit["url_analyzed"] = url
+        result.audit["page"] = page.as_dict()
         return result
     else:
         return Result(
@@ -1029,7 +1137,7 @@ async def analyze_url_pipeline(url: str, language_hint: str = "en") -> Result:
             intelligence=IntelligenceReport(
                 technical="URL analysis requires additional verification methods including domain reputation checks, content analysis, and source credibility assessment."
             ),
-            audit={"analysis_time": datetime.utcnow().isoformat(), "processing_time": f"{time.time() - t0:.2f}s", "content_type": "url"}
+            audit={"analysis_time": datetime.utcnow().isoformat(), "processing_time": f"{time.time() - t0:.2f}s", "content_type": "url", "page": page.as_dict()}
         )
 
 async def analyze_image_pipeline(image_base64: str, language_hint: str = "en") -> Result:
@@ -1059,17 +1167,99 @@ async def analyze_image_pipeline(image_base64: str, language_hint: str = "en") -
 # ---------------------------
 # UNIFIED ENTRYPOINT
 # ---------------------------
-async def run_analysis(content_type: str, content: str, language: str = "en") -> Result:
+def _result_from_memo(cached: Result, age: float, content_type: str, content: str) -> Result:
+    """Copy a memoized Result for a new caller, marking it as a cache hit"""
+    result = cached.model_copy(deep=True)
+    result.id = str(uuid.uuid4())
+    if content_type == "text":
+        result.input = content
+    result.audit["cache"] = {
+        "hit": True,
+        "age_seconds": round(age, 3),
+        "original_analysis_time": cached.audit.get("analysis_time"),
+        "original_metrics": result.audit.pop("metrics", None),
+    }
+    result.audit["analysis_time"] = datetime.utcnow().isoformat()
+    return result
+
+# Progress listeners per in-flight fingerprint, so coalesced callers also get stage events
+_stage_listeners: Dict[str, List[ProgressCallback]] = {}
+
+def _broadcaster(fingerprint: str) -> ProgressCallback:
+    def broadcast(stage: str, data: Dict[str, Any]) -> None:
+        for listener in list(_stage_listeners.get(fingerprint, ())):
+            _emit(listener, stage, **data)
+    return broadcast
+
+async def run_analysis(content_type: str, content: str, language: str = "en", on_event: Optional[ProgressCallback] = None) -> Result:
     """Main analysis entrypoint with post-processing layer"""
     
     if not content_type or not content:
         raise ValueError("Missing content_type or content")
     
+    fingerprint = content_fingerprint(content_type, content, language)
+    memoized = analysis_memo.get(fingerprint)
+    if memoized is not None:
+        cached_result, age = memoized
+        logger.info(f"Analysis cache hit for {content_type} ({age:.1f}s old)")
+        _emit(on_event, "cache_hit", age_seconds=round(age, 3))
+        metrics.count_analysis(content_type, "memo_hit")
+        return _result_from_memo(cached_result, age, content_type, content)
+    
+    if on_event is not None:
+        _stage_listeners.setdefault(fingerprint, []).append(on_event)
+    try:
+        # Concurrent identical requests share one pipeline run
+        result, joined = await analysis_flights.do(
+            fingerprint,
+            lambda: _run_and_memoize(fingerprint, content_type, content, language, _broadcaster(fingerprint))
+        )
+    finally:
+        if on_event is not None:
+            listeners = _stage_listeners.get(fingerprint, [])
+            if on_event in listeners:
+                listeners.remove(on_event)
+            if not listeners:
+                _stage_listeners.pop(fingerprint, None)
+    if joined:
+        result = result.model_copy(deep=True)
+        result.id = str(uuid.uuid4())
+        result.audit["coalesced"] = True
+        metrics.count_analysis(content_type, "coalesced")
+    else:
+        metrics.count_analysis(content_type, result.audit.get("status", "computed"))
+    return result
+
+async def _run_and_memoize(fingerprint: str, content_type: str, content: str, language: str, on_event: Optional[ProgressCallback] = None) -> Result:
+    """Run the pipeline once and memoize the completed Result"""
+    timings = metrics.begin_analysis()
+    with metrics.stage(f"{content_type}_pipeline"):
+        result = await _run_analysis_uncached(content_type, content, language, on_event)
+    result.audit["metrics"] = timings.as_dict()
+    
+    # Only memoize completed analyses - timeouts and errors should be retried
+    if result.audit.get("status") not in ("timeout", "error"):
+        result.audit["cache"] = {"hit": False, "age_seconds": 0.0}
+        analysis_memo.put(fingerprint, result.model_copy(deep=True))
+    return result
+
+async def _run_analysis_uncached(content_type: str, content: str, language: str = "en", on_event: Optional[ProgressCallback] = None) -> Result:
+    """Dispatch to the content-type pipeline under its deadline"""
     try:
+        # Pipelines finish by their deadline with partial evidence; the outer
+        # wait_for is only a backstop if a stage ignores its budget.
         if content_type == "text":
-            return await asyncio.wait_for(analyze_text_pipeline(content, language), timeout=20.0)
+            deadline = Deadline.after(TEXT_DEADLINE, reserve=DEADLINE_RESERVE)
+            return await asyncio.wait_for(
+                analyze_text_pipeline(content, language, on_event, deadline),
+                timeout=TEXT_DEADLINE + DEADLINE_BACKSTOP
+            )
         elif content_type == "url":
-            return await asyncio.wait_for(analyze_url_pipeline(content, language), timeout=25.0)
+            deadline = Deadline.after(URL_DEADLINE, reserve=DEADLINE_RESERVE)
+            return await asyncio.wait_for(
+                analyze_url_pipeline(content, language, on_event, deadline),
+                timeout=URL_DEADLINE + DEADLINE_BACKSTOP
+            )
         elif content_type == "image":
             return await asyncio.wait_for(analyze_image_pipeline(content, language), timeout=20.0)
         else:
@@ -0,0 +1,437 @@
+# backend/app/services/cache.py
+"""
+Tiered result cache for evidence lookups.
+
+Viral claims get resubmitted constantly, so the Fact Check, Custom Search
+and Wikipedia answers for a query are cached:
+
+- tier 1: in-process LRU with a size bound (microseconds)
+- tier 2: optional on-disk JSON store that survives restarts
+
+Entries carry their own expiry, so every source can have its own TTL.
+Keys are the normalized query, so "Vaccines  contain microchips" and
+"vaccines contain microchips" share one entry.
+
+Completed analyses are memoized separately (ResultMemo), keyed by the
+content fingerprint from app.services.fingerprint.
+
+Pages fetched for URL analysis are kept in PageCache, keyed by the same
+canonical URL as the memo: the extracted text plus the ETag/Last-Modified
+validators. Once an entry is no longer fresh it is revalidated with a
+conditional GET instead of downloaded again.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.fingerprint import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "not in cache" (None is a legitimate cached value)
+MISS = object()
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a lookup query so trivially different inputs share a key"""
+    if not query:
+        return ""
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+class LRUCache:
+    """Size-bounded in-memory LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, stale_for: float = 0.0) -> Any:
+        """Fresh value, or one expired less than `stale_for` seconds ago"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+            expires_at, value = entry
+            now = time.time()
+            if expires_at < now:
+                # Expired entries linger for stale reads until the LRU evicts them
+                if expires_at + stale_for < now:
+                    return MISS
+            else:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """JSON-file cache tier, one file per key, written atomically"""
+
+    def __init__(self, directory: str, stale_retention: float = 0.0):
+        self.directory = directory
+        # Expired files are kept this long for stale reads before being deleted
+        self.stale_retention = stale_retention
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str, stale_for: float = 0.0) -> Tuple[Any, float]:
+        """Return (value, expires_at) or (MISS, 0); expired entries are kept for stale reads"""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return MISS, 0.0
+        except Exception as e:
+            logger.warning(f"Disk cache read failed for {path}: {e}")
+            return MISS, 0.0
+
+        expires_at = entry.get("expires_at", 0)
+        now = time.time()
+        if expires_at + self.stale_retention < now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return MISS, 0.0
+        if expires_at + stale_for < now:
+            return MISS, 0.0
+        return entry.get("value"), expires_at
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"key": key, "expires_at": time.time() + ttl, "value": value}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Disk cache write failed for {path}: {e}")
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class TieredCache:
+    """Memory LRU in front of an optional disk tier, with per-source TTLs and counters"""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600.0,
+        max_entries: int = 1024,
+        disk_directory: Optional[str] = None,
+        enabled: bool = True,
+        stale_ttl: float = 0.0,
+    ):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self.stale_ttl = stale_ttl
+        self.memory = LRUCache(max_entries)
+        self.disk = DiskCache(disk_directory, stale_ttl) if disk_directory else None
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _key(self, source: str, query: str, variant: str = "") -> str:
+        return f"{source}:{variant}:{normalize_query(query)}"
+
+    def _count(self, source: str, field: str) -> None:
+        counters = self._stats.setdefault(
+            source, {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "stale_hits": 0}
+        )
+        counters[field] += 1
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, self.default_ttl)
+
+    def get(self, source: str, query: str, variant: str = "") -> Any:
+        """Look up a cached lookup result; returns MISS when absent or expired"""
+        if not self.enabled:
+            return MISS
+        key = self._key(source, query, variant)
+
+        value = self.memory.get(key)
+        if value is not MISS:
+            self._count(source, "memory_hits")
+            return value
+
+        if self.disk is not None:
+            value, expires_at = self.disk.get(key)
+            if value is not MISS:
+                # Promote to memory for the rest of its lifetime
+                self.memory.set(key, value, max(0.0, expires_at - time.time()))
+                self._count(source, "disk_hits")
+                return value
+
+        self._count(source, "misses")
+        return MISS
+
+    def get_stale(self, source: str, query: str, variant: str = "") -> Any:
+        """
+        Fallback read that also accepts entries expired up to `stale_ttl` ago.
+
+        Used when an API cannot be called (quota exhausted): an hour-old
+        answer is better evidence than none. Returns MISS when nothing usable is cached.
+        """
+        if not self.enabled or self.stale_ttl <= 0:
+            return MISS
+        key = self._key(source, query, variant)
+        value = self.memory.get(key, stale_for=self.stale_ttl)
+        if value is MISS and self.disk is not None:
+            value, _ = self.disk.get(key, stale_for=self.stale_ttl)
+        if value is not MISS:
+            self._count(source, "stale_hits")
+        return value
+
+    def set(self, source: str, query: str, value: Any, variant: str = "") -> None:
+        """Store a successful lookup result under the source's TTL"""
+        if not self.enabled:
+            return
+        ttl = self.ttl_for(source)
+        if ttl <= 0:
+            return
+        key = self._key(source, query, variant)
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+        self._count(source, "writes")
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per source plus overall hit ratio"""
+        per_source = {}
+        total_hits = total_lookups = 0
+        for source, counters in self._stats.items():
+            hits = counters["memory_hits"] + counters["disk_hits"]
+            lookups = hits + counters["misses"]
+            total_hits += hits
+            total_lookups += lookups
+            per_source[source] = {
+                **counters,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "ttl_seconds": self.ttl_for(source),
+            }
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self.memory),
+            "memory_max_entries": self.memory.max_entries,
+            "disk_enabled": self.disk is not None,
+            "hit_ratio": round(total_hits / total_lookups, 4) if total_lookups else 0.0,
+            "stale_ttl_seconds": self.stale_ttl,
+            "sources": per_source,
+        }
+
+
+class PageCache:
+    """
+    Extracted page text by canonical URL (fingerprint.canonicalize_url), with
+    HTTP validators for revalidation.
+
+    An entry is served without any request for `fresh_ttl` seconds (less
+    if the page's Cache-Control max-age says so). After that it is kept
+    for up to `max_age` seconds so its ETag/Last-Modified can be sent
+    with the next fetch. A 304 answer reuses the stored text.
+    """
+
+    def __init__(
+        self,
+        fresh_ttl: float = 300.0,
+        max_age: float = 7 * 24 * 3600.0,
+        max_entries: int = 512,
+        disk_directory: Optional[str] = None,
+        enabled: bool = True,
+    ):
+        self.fresh_ttl = fresh_ttl
+        self.max_age = max(max_age, fresh_ttl)
+        self.enabled = enabled
+        self.memory = LRUCache(max_entries)
+        self.disk = DiskCache(disk_directory) if disk_directory else None
+        self._stats = {"fresh_hits": 0, "revalidated": 0, "changed": 0, "misses": 0, "writes": 0}
+
+    def count(self, field: str) -> None:
+        self._stats[field] += 1
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for a URL (fresh or not), or None"""
+        if not self.enabled:
+            return None
+        key = canonicalize_url(url)
+        entry = self.memory.get(key)
+        if entry is MISS and self.disk is not None:
+            entry, expires_at = self.disk.get(key)
+            if entry is not MISS:
+                self.memory.set(key, entry, max(0.0, expires_at - time.time()))
+        return None if entry is MISS else entry
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        return entry.get("fresh_until", 0) > time.time()
+
+    def put(self, url: str, entry: Dict[str, Any], fresh_ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Store (or refresh) a page entry.
+
+        Args:
+            url (str): Page URL (canonicalized here)
+            entry (dict): text, etag, last_modified and any page details
+            fresh_ttl (float): Freshness granted by the page, capped at the configured TTL
+
+        Returns:
+            dict: The stored entry
+        """
+        ttl = self.fresh_ttl if fresh_ttl is None else min(fresh_ttl, self.fresh_ttl)
+        entry = dict(entry, fresh_until=time.time() + max(0.0, ttl), stored_at=time.time())
+        if not self.enabled:
+            return entry
+        key = canonicalize_url(url)
+        self.memory.set(key, entry, self.max_age)
+        if self.disk is not None:
+            self.disk.set(key, entry, self.max_age)
+        self.count("writes")
+        return entry
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        served = self._stats["fresh_hits"] + self._stats["revalidated"]
+        lookups = served + self._stats["changed"] + self._stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self.memory),
+            "memory_max_entries": self.memory.max_entries,
+            "disk_enabled": self.disk is not None,
+            "fresh_ttl_seconds": self.fresh_ttl,
+            "max_age_seconds": self.max_age,
+            **self._stats,
+            "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResultMemo:
+    """Memoizes completed analysis results by content fingerprint"""
+
+    def __init__(self, ttl: float = 900.0, max_entries: int = 512, enabled: bool = True):
+        self.ttl = ttl
+        self.enabled = enabled and ttl > 0
+        self._entries = LRUCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get(self, fingerprint: str) -> Optional[Tuple[Any, float]]:
+        """Return (result, age_seconds) or None"""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(fingerprint)
+        if entry is MISS:
+            self.misses += 1
+            return None
+        stored_at, result = entry
+        self.hits += 1
+        return result, time.time() - stored_at
+
+    def put(self, fingerprint: str, result: Any) -> None:
+        if not self.enabled:
+            return
+        self._entries.set(fingerprint, (time.time(), result), self.ttl)
+        self.stores += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self._entries.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Global evidence cache instance
+evidence_cache = TieredCache(
+    ttls={
+        "factcheck": _env_float("CACHE_TTL_FACTCHECK", 6 * 3600),
+        "custom_search": _env_float("CACHE_TTL_CUSTOM_SEARCH", 3600),
+        "wikipedia": _env_float("CACHE_TTL_WIKIPEDIA", 24 * 3600),
+    },
+    default_ttl=_env_float("CACHE_TTL_DEFAULT", 3600),
+    max_entries=int(_env_float("EVIDENCE_CACHE_MAX_ENTRIES", 2048)),
+    disk_directory=(
+        os.getenv("EVIDENCE_CACHE_DIR", os.path.join("storage", "cache", "evidence"))
+        if os.getenv("EVIDENCE_CACHE_DISK", "false").lower() == "true"
+        else None
+    ),
+    enabled=os.getenv("EVIDENCE_CACHE_ENABLED", "true").lower() == "true",
+    stale_ttl=_env_float("EVIDENCE_CACHE_STALE_TTL", 24 * 3600),
+)
+
+# Global page cache for URL analysis
+page_cache = PageCache(
+    fresh_ttl=_env_float("PAGE_CACHE_TTL", 300),
+    max_age=_env_float("PAGE_CACHE_MAX_AGE", 7 * 24 * 3600),
+    max_entries=int(_env_float("PAGE_CACHE_MAX_ENTRIES", 512)),
+    disk_directory=(
+        os.getenv("PAGE_CACHE_DIR", os.path.join("storage", "cache", "pages"))
+        if os.getenv("PAGE_CACHE_DISK", "false").lower() == "true"
+        else None
+    ),
+    enabled=os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true",
+)
+
+# Global whole-analysis memo instance
+analysis_memo = ResultMemo(
+    ttl=_env_float("ANALYSIS_CACHE_TTL", 900),
+    max_entries=int(_env_float("ANALYSIS_CACHE_MAX_ENTRIES", 512)),
+    enabled=os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true",
+)
@@ -0,0 +1,174 @@
+# backend/app/services/claim_classifier.py
+"""
+Keyword-based claim classification with a precompiled Aho-Corasick automaton.
+
+The taxonomy (categories, keywords, weights) lives in
+app/data/claim_taxonomy.json, or in the file named by CLAIM_TAXONOMY_PATH.
+All keywords of all categories are compiled into one automaton at import,
+so classifying a text is a single linear pass over it however many
+keywords there are.
+
+Matches are whole-word and case-insensitive: "vote" matches "vote" but not
+"devoted". A keyword ending in "*" also matches longer words that start
+with it ("vaccine*" matches "vaccine" and "vaccines").
+
+The claim type is the first category, in taxonomy order, with any match,
+so a text mentioning several topics is classified as the old if/elif
+chain did. Per-category scores and matched terms are reported alongside.
+
+Classification is memoized per text, so every consumer in the engine
+(claim type, prompt building, scoring) shares one pass.
+"""
+
+import os
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "claim_taxonomy.json")
+
+
+@dataclass(frozen=True)
+class Keyword:
+    pattern: str      # as written in the taxonomy (e.g. "vaccine*")
+    text: str         # literal text matched (e.g. "vaccine")
+    prefix: bool      # True when the keyword may continue into a longer word
+    category: str
+    weight: float
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher: all occurrences of all patterns in one pass"""
+
+    def __init__(self, patterns: List[str]):
+        # Node 0 is the root; goto[n] maps a character to the next node
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._lengths = [len(p) for p in patterns]
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(index)
+        self._link()
+
+    def _link(self) -> None:
+        """Breadth-first failure links; outputs inherit those of their fallback node"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, pattern index) for every occurrence"""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in out[node]:
+                yield position - lengths[index] + 1, index
+
+
+@dataclass(frozen=True)
+class ClaimProfile:
+    """Everything the keyword pass found in one text"""
+    claim_type: str
+    scores: Dict[str, float] = field(default_factory=dict)
+    terms: FrozenSet[str] = frozenset()
+
+    def has(self, *patterns: str) -> bool:
+        """True when every given taxonomy keyword (as written, e.g. "vaccine*") matched"""
+        return all(pattern in self.terms for pattern in patterns)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class ClaimClassifier:
+    """Compiled taxonomy: one automaton over every category's keywords"""
+
+    def __init__(self, taxonomy: Dict):
+        self.fallback = taxonomy.get("fallback", "general_misinformation")
+        self.categories = [category["name"] for category in taxonomy["categories"]]
+        self.keywords: List[Keyword] = []
+        for category in taxonomy["categories"]:
+            for pattern, weight in category["keywords"].items():
+                literal = pattern.lower().rstrip("*")
+                if not literal:
+                    continue
+                self.keywords.append(Keyword(pattern, literal, pattern.endswith("*"), category["name"], float(weight)))
+        self._automaton = AhoCorasick([keyword.text for keyword in self.keywords])
+
+    @classmethod
+    def from_file(cls, path: str) -> "ClaimClassifier":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def classify(self, text: str) -> ClaimProfile:
+        """Score every category in one pass; the first category in taxonomy order with a match wins"""
+        if not text:
+            return ClaimProfile(self.fallback)
+        lowered = text.lower()
+        end = len(lowered)
+        matched = set()
+        for start, index in self._automaton.iter_matches(lowered):
+            keyword = self.keywords[index]
+            if start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            after = start + len(keyword.text)
+            if not keyword.prefix and after < end and _is_word_char(lowered[after]):
+                continue
+            matched.add(index)
+
+        scores: Dict[str, float] = {}
+        for index in matched:
+            keyword = self.keywords[index]
+            scores[keyword.category] = scores.get(keyword.category, 0.0) + keyword.weight
+
+        # Same priority as the old if/elif chain: scores inform, they do not decide
+        claim_type = next((category for category in self.categories if category in scores), self.fallback)
+        return ClaimProfile(
+            claim_type=claim_type,
+            scores={category: round(score, 3) for category, score in scores.items()},
+            terms=frozenset(self.keywords[index].pattern for index in matched),
+        )
+
+
+def _load_classifier() -> ClaimClassifier:
+    path = os.getenv("CLAIM_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+    classifier = ClaimClassifier.from_file(path)
+    logger.info(f"Claim taxonomy loaded: {len(classifier.categories)} categories, {len(classifier.keywords)} keywords")
+    return classifier
+
+
+# Global classifier compiled from the taxonomy file
+claim_classifier = _load_classifier()
+
+
+@lru_cache(maxsize=256)
+def classify_claim(text: str) -> ClaimProfile:
+    """Classify a text once; repeated calls for the same text reuse the result"""
+    return claim_classifier.classify(text)
@@ -0,0 +1,194 @@
+# backend/app/services/claim_extraction.py
+"""
+Atomic claim extraction and check-worthiness ranking.
+
+Fact Check, Custom Search and Wikipedia work on short queries. Sending a
+whole article as one query found almost nothing. This module splits text
+into sentences, scores each with cheap local heuristics, and returns the
+most check-worthy ones as separate queries.
+
+Heuristics that raise a sentence's score:
+- numbers, percentages and amounts
+- named entities (capitalised words after the first)
+- factual verbs ("causes", "contains", "confirmed", "according to")
+- absolutes ("never", "all", "only")
+- keywords from the claim taxonomy
+
+Heuristics that lower it:
+- questions
+- opinion and call-to-action phrasing
+- page boilerplate
+- fragments that are too short
+
+Texts up to CLAIM_SPLIT_MIN_CHARS are kept as one claim, so short
+inputs query exactly as before.
+"""
+
+import os
+import re
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from app.services.claim_classifier import claim_classifier
+
+logger = logging.getLogger(__name__)
+
+# Longest text still treated as a single claim
+CLAIM_SPLIT_MIN_CHARS = int(os.getenv("CLAIM_SPLIT_MIN_CHARS", "280"))
+# Longest query sent to the evidence APIs
+CLAIM_MAX_QUERY_CHARS = int(os.getenv("CLAIM_MAX_QUERY_CHARS", "200"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?।])[\"'”’)\]]*\s+|\n+")
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc", "ltd", "co", "corp",
+    "gov", "govt", "no", "fig", "approx", "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep",
+    "sept", "oct", "nov", "dec", "u.s", "u.k", "e.g", "i.e", "a.m", "p.m",
+}
+_WORD = re.compile(r"[\w'’-]+")
+_NUMBER = re.compile(r"\d")
+_QUANTITY = re.compile(r"\d\s*(%|percent|per cent|million|billion|crore|lakh|thousand)|[$€£₹]\s*\d", re.IGNORECASE)
+_FACTUAL = re.compile(
+    r"\b(is|are|was|were|has|have|had|will|causes?|caused|contains?|contained|proves?|proved|shows?|showed|"
+    r"confirm(?:s|ed)?|reveal(?:s|ed)?|found|according to|linked to|leads? to|kills?|killed|cures?|cured|"
+    r"bans?|banned|increased?|decreased?|rose|fell|won|lost|announced|approved|arrested|died)\b",
+    re.IGNORECASE,
+)
+_ABSOLUTE = re.compile(r"\b(all|every|never|always|only|no one|nobody|entire|100%|first|largest|most)\b", re.IGNORECASE)
+_OPINION = re.compile(
+    r"\b(i think|i believe|i feel|in my opinion|imo|we should|you should|let's|let us|must watch|wow)\b",
+    re.IGNORECASE,
+)
+_BOILERPLATE = re.compile(
+    r"\b(click|subscribe|share this|sign up|log in|cookies?|all rights reserved|privacy policy|terms of use|"
+    r"read more|follow us|advertisement|newsletter|comments?)\b",
+    re.IGNORECASE,
+)
+_LEADING_ARTICLE = re.compile(r"^(?:The|A|An)\s+")
+_ENTITY = re.compile(r"\b[A-Z][\w'’-]*(?:\s+(?:of|the|and|for|de|van|von)?\s*[A-Z][\w'’-]*)*")
+
+
+@dataclass(frozen=True)
+class Claim:
+    """One check-worthy statement and the queries derived from it"""
+    text: str
+    query: str               # text trimmed to CLAIM_MAX_QUERY_CHARS
+    score: float
+    position: int            # sentence index in the input
+    topic: Optional[str]     # most specific named entity (Wikipedia title candidate)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences and lines of a text, without splitting after common abbreviations"""
+    sentences: List[str] = []
+    pending = ""
+    for piece in _SENTENCE_END.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        pending = f"{pending} {piece}" if pending else piece
+        last_word = pending.rsplit(None, 1)[-1].rstrip(".").lower()
+        if pending.endswith(".") and (last_word in _ABBREVIATIONS or len(last_word) == 1):
+            continue
+        sentences.append(pending)
+        pending = ""
+    if pending:
+        sentences.append(pending)
+    return sentences
+
+
+def _topic(sentence: str) -> Optional[str]:
+    """Longest capitalised phrase, ignoring a lone sentence-initial word"""
+    best = None
+    for match in _ENTITY.finditer(sentence):
+        phrase = match.group(0).strip()
+        if match.start() == 0 and " " not in phrase:
+            continue
+        phrase = _LEADING_ARTICLE.sub("", phrase)
+        if best is None or len(phrase) > len(best):
+            best = phrase
+    return best
+
+
+def check_worthiness(sentence: str) -> float:
+    """Heuristic score; above zero means worth sending to the evidence APIs"""
+    words = _WORD.findall(sentence)
+    if not words:
+        return -10.0
+    score = 0.0
+    if _NUMBER.search(sentence):
+        score += 1.0
+    if _QUANTITY.search(sentence):
+        score += 0.5
+    entities = sum(1 for word in words[1:] if word[:1].isupper())
+    score += min(1.5, 0.5 * entities)
+    if _FACTUAL.search(sentence):
+        score += 1.0
+    if _ABSOLUTE.search(sentence):
+        score += 0.3
+    profile = claim_classifier.classify(sentence)
+    score += min(2.0, sum(profile.scores.values()))
+    if sentence.rstrip().endswith("?"):
+        score -= 1.5
+    if _OPINION.search(sentence):
+        score -= 1.5
+    if _BOILERPLATE.search(sentence):
+        score -= 2.5
+    if len(words) < 5:
+        score -= 2.0
+    elif len(words) > 50:
+        score -= 0.5
+    return round(score, 3)
+
+
+def _query(text: str) -> str:
+    text = text.strip().strip("\"'“”‘’")
+    if len(text) <= CLAIM_MAX_QUERY_CHARS:
+        return text
+    cut = text[:CLAIM_MAX_QUERY_CHARS]
+    return cut.rsplit(" ", 1)[0] if " " in cut else cut
+
+
+def _normalized(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower()))
+
+
+@lru_cache(maxsize=256)
+def _extract(text: str, top_k: int) -> Tuple[Claim, ...]:
+    stripped = text.strip()
+    if len(stripped) <= CLAIM_SPLIT_MIN_CHARS:
+        return (Claim(stripped, stripped, 0.0, 0, None),)
+
+    candidates: List[Claim] = []
+    seen = set()
+    for position, sentence in enumerate(split_sentences(stripped)):
+        key = _normalized(sentence)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        score = check_worthiness(sentence)
+        if score > 0:
+            candidates.append(Claim(sentence, _query(sentence), score, position, _topic(sentence)))
+
+    if not candidates:
+        # Nothing looks like a claim; query the opening of the text instead
+        return (Claim(stripped, _query(stripped), 0.0, 0, None),)
+    candidates.sort(key=lambda claim: (-claim.score, claim.position))
+    return tuple(candidates[:top_k])
+
+
+def extract_claims(text: str, top_k: int = 3) -> List[Claim]:
+    """
+    Most check-worthy claims of a text, best first.
+
+    Args:
+        text (str): Text to analyze (English, or the translation)
+        top_k (int): Maximum number of claims returned
+
+    Returns:
+        list: Claims ranked by check-worthiness (a single claim for short texts)
+    """
+    if not text or not text.strip():
+        return []
+    return list(_extract(text, max(1, top_k)))
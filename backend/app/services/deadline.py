@@ -0,0 +1,86 @@
+# backend/app/services/deadline.py
+"""
+Request deadlines for the analysis pipeline.
+
+One Deadline is created per analysis and passed down to every stage and
+API call. Each stage asks for `deadline.budget(cap)`: its own cap, cut to
+whatever is left of the overall budget. Stages that run out of time are
+recorded, and the Result is assembled from whatever evidence arrived
+rather than being replaced by a generic timeout.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+# Smallest timeout handed to aiohttp (total=0 would mean "no timeout")
+MIN_TIMEOUT = 0.05
+
+
+class Deadline:
+    """Absolute point in time by which an analysis must be assembled"""
+
+    def __init__(self, budget: float, reserve: float = 0.0):
+        self.total = budget
+        self.reserve = reserve
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget
+        self.cut_short: List[str] = []
+
+    @classmethod
+    def after(cls, seconds: float, reserve: float = 0.0) -> "Deadline":
+        return cls(seconds, reserve)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        return self.budget() <= 0
+
+    def budget(self, cap: Optional[float] = None) -> float:
+        """
+        Time a stage may spend: its own cap, limited by the remaining budget.
+
+        Args:
+            cap (float): The stage's own limit (None = no limit of its own)
+
+        Returns:
+            float: Seconds available, keeping `reserve` back for assembling the Result
+        """
+        available = max(0.0, self.remaining() - self.reserve)
+        return available if cap is None else min(cap, available)
+
+    def client_timeout(self, cap: float) -> aiohttp.ClientTimeout:
+        """aiohttp timeout for one request under this deadline"""
+        return aiohttp.ClientTimeout(total=max(MIN_TIMEOUT, self.budget(cap)))
+
+    def note_cut_short(self, stage: str) -> None:
+        """Record a stage that was skipped or abandoned for lack of time"""
+        if stage not in self.cut_short:
+            self.cut_short.append(stage)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_seconds": self.total,
+            "elapsed_seconds": round(self.elapsed(), 3),
+            "remaining_seconds": round(self.remaining(), 3),
+            "partial": bool(self.cut_short),
+            "cut_short": list(self.cut_short),
+        }
+
+
+def stage_budget(deadline: Optional[Deadline], cap: float) -> float:
+    """Budget for a stage, or its own cap when no deadline is in force"""
+    return cap if deadline is None else deadline.budget(cap)
+
+
+def client_timeout(deadline: Optional[Deadline], cap: float) -> aiohttp.ClientTimeout:
+    """aiohttp timeout for a request, honouring the deadline when there is one"""
+    if deadline is None:
+        return aiohttp.ClientTimeout(total=cap)
+    return deadline.client_timeout(cap)
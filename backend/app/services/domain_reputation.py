@@ -0,0 +1,149 @@
+# backend/app/services/domain_reputation.py
+"""
+Domain reputation index for scoring evidence links.
+
+Reliability scores live in app/data/domain_reputation.json, or in the file
+named by DOMAIN_REPUTATION_PATH. At import the entries are compiled into
+a suffix trie keyed by reversed host labels (www.cdc.gov -> gov, cdc,
+www). A lookup walks the host's labels once and keeps the deepest scored
+node, so it costs O(labels) however many domains are listed.
+
+A listed domain covers itself and its subdomains. The longest match
+wins, so "gov" scores the whole namespace and "cdc.gov" overrides it.
+Matching works on parsed hostnames only: a query string such as
+evil.com/?who.int no longer earns a boost.
+
+Scores only feed Evidence.reliability. The score boosts in the verdict
+(evidence score, source credibility) use the named `boosts` lists of the
+same file, compiled into tries of their own, so listing another outlet
+never shifts a verdict.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPUTATION_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "domain_reputation.json")
+
+
+@dataclass(frozen=True)
+class DomainReputation:
+    """Reputation of one URL's host"""
+    host: str
+    matched: Optional[str]    # listed domain that matched (e.g. "cdc.gov"), None if unlisted
+    score: float
+    boosts: FrozenSet[str] = frozenset()   # boost lists the host is on (e.g. "evidence_score")
+
+    def boosted(self, name: str) -> bool:
+        """True when the host is on the named boost list"""
+        return name in self.boosts
+
+
+class _Node:
+    __slots__ = ("children", "score")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.score: Optional[float] = None
+
+
+def host_of(url: str) -> str:
+    """Lower-cased hostname of a URL ("" when there is none); tolerates missing schemes"""
+    if not url:
+        return ""
+    if "//" not in url:
+        url = "//" + url
+    try:
+        host = urlsplit(url.strip()).hostname or ""
+    except ValueError:
+        return ""
+    return host.rstrip(".")
+
+
+class DomainReputationIndex:
+    """Reversed-label suffix trie of domain reliability scores"""
+
+    def __init__(self, domains: Dict[str, float], default: float = 0.70,
+                 boosts: Optional[Dict[str, Iterable[str]]] = None):
+        self.default = default
+        self._root = _Node()
+        self.size = 0
+        for domain, score in domains.items():
+            self.add(domain, float(score))
+        # Boost lists are membership tries: a listed domain and its subdomains are on the list
+        self.boosts: Dict[str, DomainReputationIndex] = {
+            name: DomainReputationIndex({domain: 1.0 for domain in listed}) for name, listed in (boosts or {}).items()
+        }
+
+    @classmethod
+    def from_file(cls, path: str) -> "DomainReputationIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            data.get("domains", {}),
+            default=float(data.get("default", 0.70)),
+            boosts=data.get("boosts", {}),
+        )
+
+    def add(self, domain: str, score: float) -> None:
+        labels = domain.lower().strip(".").split(".")
+        if not all(labels):
+            logger.warning(f"Skipping malformed reputation entry '{domain}'")
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.children.setdefault(label, _Node())
+        if node.score is None:
+            self.size += 1
+        node.score = score
+
+    def lookup(self, host: str) -> Optional[Tuple[str, float]]:
+        """Longest listed suffix of `host` and its score, or None"""
+        if not host:
+            return None
+        labels = host.split(".")
+        node = self._root
+        best = None
+        for depth, label in enumerate(reversed(labels), start=1):
+            node = node.children.get(label)
+            if node is None:
+                break
+            if node.score is not None:
+                best = (depth, node.score)
+        if best is None:
+            return None
+        depth, score = best
+        return ".".join(labels[-depth:]), score
+
+    def reputation(self, url: str) -> DomainReputation:
+        """Score a URL by its host; unlisted hosts get the default score"""
+        host = host_of(url)
+        found = self.lookup(host)
+        boosts = frozenset(name for name, listed in self.boosts.items() if listed.lookup(host) is not None)
+        if found is None:
+            return DomainReputation(host, None, self.default, boosts)
+        matched, score = found
+        return DomainReputation(host, matched, score, boosts)
+
+
+def _load_index() -> DomainReputationIndex:
+    path = os.getenv("DOMAIN_REPUTATION_PATH", DEFAULT_REPUTATION_PATH)
+    index = DomainReputationIndex.from_file(path)
+    logger.info(f"Domain reputation loaded: {index.size} domains")
+    return index
+
+
+# Global index compiled from the reputation file
+domain_reputation = _load_index()
+
+
+@lru_cache(maxsize=4096)
+def reputation_for(url: str) -> DomainReputation:
+    """Reputation of a URL; each URL is parsed and looked up once, then reused"""
+    return domain_reputation.reputation(url)
@@ -0,0 +1,110 @@
+# backend/app/services/endpoints.py
+"""
+Central endpoint configuration for every external API client.
+
+Each API has a named endpoint: a base URL plus the HTTP pool
+(app.services.http_client) its requests go through. Clients build URLs with
+`endpoints.url(name, path)` and get their session from
+`endpoints.session(name)` instead of hard-coding hosts, so any API can be
+pointed at a local mock, a regional endpoint or a caching proxy.
+
+Configuration:
+- `<NAME>_API_URL` overrides the base URL (e.g. FACTCHECK_API_URL)
+- `<NAME>_API_POOL` sends the API through its own HTTP pool, which can then
+  be tuned or given an injected transport via `http_clients.set_transport`
+- `endpoints.configure(...)` changes either at runtime (tests, benchmarks)
+"""
+
+import os
+import logging
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Any
+
+import aiohttp
+
+from app.services.http_client import http_clients
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Where one external API lives and which HTTP pool serves it"""
+    name: str
+    base_url: str
+    pool: str = "api"
+
+
+# name -> (environment prefix, default base URL, default pool)
+DEFAULT_ENDPOINTS = {
+    "translation": ("TRANSLATION", "https://translation.googleapis.com/language/translate/v2", "api"),
+    "factcheck": ("FACTCHECK", "https://factchecktools.googleapis.com/v1alpha1", "api"),
+    "custom_search": ("CUSTOM_SEARCH", "https://www.googleapis.com/customsearch/v1", "api"),
+    "wikipedia": ("WIKIPEDIA", "https://en.wikipedia.org/api/rest_v1", "api"),
+    "gemini": ("GEMINI", "https://generativelanguage.googleapis.com/v1beta", "api"),
+    "vision": ("VISION", "https://vision.googleapis.com/v1/images:annotate", "api"),
+    "safe_browsing": ("SAFE_BROWSING", "https://safebrowsing.googleapis.com/v4/threatMatches:find", "api"),
+}
+
+
+def _from_env(name: str, prefix: str, base_url: str, pool: str) -> Endpoint:
+    return Endpoint(
+        name=name,
+        base_url=os.getenv(f"{prefix}_API_URL", base_url).rstrip("/"),
+        pool=os.getenv(f"{prefix}_API_POOL", pool),
+    )
+
+
+class EndpointRegistry:
+    """Named API endpoints resolved at call time"""
+
+    def __init__(self, endpoints: Optional[Dict[str, Endpoint]] = None):
+        if endpoints is None:
+            endpoints = {
+                name: _from_env(name, prefix, base_url, pool)
+                for name, (prefix, base_url, pool) in DEFAULT_ENDPOINTS.items()
+            }
+        self._endpoints = dict(endpoints)
+
+    def get(self, name: str) -> Endpoint:
+        try:
+            return self._endpoints[name]
+        except KeyError:
+            raise KeyError(f"Unknown API endpoint '{name}'") from None
+
+    def url(self, name: str, path: str = "") -> str:
+        """
+        Build a request URL for an API.
+
+        Args:
+            name (str): Endpoint name (e.g. "factcheck")
+            path (str): Path appended to the base URL (e.g. "/claims:search")
+
+        Returns:
+            str: Absolute URL
+        """
+        return f"{self.get(name).base_url}{path}"
+
+    def session(self, name: str) -> aiohttp.ClientSession:
+        """Shared session of the pool this API is routed through"""
+        return http_clients.get_session(self.get(name).pool)
+
+    def configure(self, name: str, base_url: Optional[str] = None, pool: Optional[str] = None) -> Endpoint:
+        """Override an endpoint at runtime (unknown names are added)"""
+        current = self._endpoints.get(name) or Endpoint(name=name, base_url=base_url or "")
+        updated = replace(
+            current,
+            base_url=(base_url if base_url is not None else current.base_url).rstrip("/"),
+            pool=pool if pool is not None else current.pool,
+        )
+        self._endpoints[name] = updated
+        logger.info(f"API endpoint '{name}' -> {updated.base_url} (pool '{updated.pool}')")
+        return updated
+
+    def describe(self) -> Dict[str, Dict[str, Any]]:
+        """Endpoint table for diagnostics"""
+        return {name: {"base_url": e.base_url, "pool": e.pool} for name, e in self._endpoints.items()}
+
+
+# Global endpoint registry
+endpoints = EndpointRegistry()
@@ -0,0 +1,115 @@
+# backend/app/services/fingerprint.py
+"""
+Content fingerprints for analysis memoization.
+
+Inputs that differ only trivially must map to the same fingerprint:
+
+- text:  unicode-normalized, case-folded, punctuation and whitespace collapsed
+- url:   canonical URL (lowercase scheme/host, default port, fragment and
+         tracking parameters removed, remaining query sorted)
+- image: SHA-256 of the decoded bytes, so re-encoded base64 still matches
+"""
+
+import re
+import base64
+import hashlib
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid",
+    "mc_cid", "mc_eid", "igshid", "_hsenc", "_hsmi", "mkt_tok",
+    "ref", "ref_src", "ref_url", "cmpid", "s_cid", "share", "spm",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold, strip punctuation and collapse whitespace"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """Return a canonical form of a URL for cache keys"""
+    if not url:
+        return ""
+    raw = url.strip()
+    if "://" not in raw:
+        raw = f"http://{raw}"
+
+    try:
+        parts = urlsplit(raw)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower().rstrip(".")
+        port = parts.port
+    except ValueError:
+        return raw
+
+    netloc = host
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+
+    query_pairs = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ]
+    query = urlencode(sorted(query_pairs))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def image_digest(image_base64: str) -> str:
+    """SHA-256 of decoded image bytes (falls back to the raw string)"""
+    payload = image_base64 or ""
+    if payload.startswith("data:") and "," in payload:
+        payload = payload.split(",", 1)[1]
+    try:
+        data = base64.b64decode(payload, validate=False)
+    except Exception:
+        data = payload.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def content_fingerprint(content_type: str, content: str, language: str = "en") -> str:
+    """
+    Stable fingerprint for an analysis request.
+
+    Args:
+        content_type (str): 'text' | 'url' | 'image'
+        content (str): Raw request content
+        language (str): Language hint (part of the key since it can change output)
+
+    Returns:
+        str: "<content_type>:<sha256>" fingerprint
+    """
+    if content_type == "text":
+        canonical = normalize_text(content)
+    elif content_type == "url":
+        canonical = canonicalize_url(content)
+    elif content_type == "image":
+        canonical = image_digest(content)
+    else:
+        canonical = content or ""
+
+    digest = hashlib.sha256(f"{language or 'en'}\x00{canonical}".encode("utf-8")).hexdigest()
+    return f"{content_type}:{digest}"
@@ -0,0 +1,108 @@
+# backend/app/services/health_monitor.py
+"""
+Background health checks with a cached snapshot.
+
+Deep checks (upstream reachability, engine self-test, storage) run on a
+schedule in the background. Health probes only read the last results, so
+a probe costs microseconds and never touches external APIs no matter
+how often a load balancer polls.
+
+Each result carries when it was taken; a result older than
+HEALTH_STALE_AFTER intervals is reported as "stale" (the checker itself is
+stuck or stopped).
+"""
+
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[], Awaitable[Any]]
+
+
+class HealthMonitor:
+    """Runs registered checks periodically and caches their results"""
+
+    def __init__(self, interval: float = 30.0, timeout: float = 10.0, stale_after: float = 3.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._checks: Dict[str, HealthCheck] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+
+    def register(self, name: str, check: HealthCheck) -> None:
+        """Add a deep check; it must return a dict (or model) with at least `status`"""
+        self._checks[name] = check
+
+    async def _run_check(self, name: str, check: HealthCheck) -> None:
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(check(), timeout=self.timeout)
+            entry = result.dict() if hasattr(result, "dict") else dict(result)
+        except asyncio.TimeoutError:
+            entry = {"status": "unhealthy", "message": f"Check timed out after {self.timeout:.0f}s"}
+        except Exception as e:
+            entry = {"status": "unhealthy", "message": f"Check failed: {e}"}
+        entry.setdefault("response_time", round(time.perf_counter() - started, 3))
+        entry["checked_at"] = datetime.utcnow().isoformat()
+        entry["_checked_monotonic"] = time.monotonic()
+        self._results[name] = entry
+
+    async def run_once(self) -> None:
+        """Run every check concurrently and store the results"""
+        await asyncio.gather(*(self._run_check(name, check) for name, check in self._checks.items()))
+        self.runs += 1
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"Health check run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def ensure_started(self) -> None:
+        """Start the background loop if it is not running (idempotent, cheap)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info(f"Health monitor started ({len(self._checks)} checks every {self.interval:.0f}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Last result of every check with its age; never runs a check"""
+        now = time.monotonic()
+        snapshot = {}
+        for name in self._checks:
+            entry = self._results.get(name)
+            if entry is None:
+                snapshot[name] = {"status": "pending", "message": "First check has not completed yet"}
+                continue
+            age = now - entry["_checked_monotonic"]
+            view = {k: v for k, v in entry.items() if not k.startswith("_")}
+            view["age_seconds"] = round(age, 1)
+            if age > self.interval * self.stale_after + self.timeout:
+                view["status"] = "stale"
+            snapshot[name] = view
+        return snapshot
+
+
+# Global health monitor
+health_monitor = HealthMonitor(
+    interval=float(os.getenv("HEALTH_CHECK_INTERVAL", "30")),
+    timeout=float(os.getenv("HEALTH_CHECK_TIMEOUT", "10")),
+    stale_after=float(os.getenv("HEALTH_STALE_AFTER", "3")),
+)
@@ -0,0 +1,190 @@
+# backend/app/services/hedging.py
+"""
+Hedged requests for evidence APIs with long-tail latency.
+
+For an API that has hedging turned on, the first request runs normally.
+If it has not answered by that API's observed p90 latency, an identical
+second request is sent and whichever answers first is used. The other
+request is cancelled.
+
+Hedges are paid for out of a token budget. Every primary request earns
+`HEDGE_BUDGET` tokens, up to a small cap, and each hedge spends one. Extra
+traffic therefore stays at roughly HEDGE_BUDGET × normal traffic even
+when an upstream API is slow across the board. No API is hedged until it
+has `HEDGE_MIN_SAMPLES` latencies, so a cold process never hedges on a
+guess.
+
+Configuration:
+- HEDGED_APIS: comma-separated API names to hedge (default none),
+  e.g. "factcheck,custom_search,wikipedia"
+- HEDGE_QUANTILE (0.9), HEDGE_BUDGET (0.1), HEDGE_MIN_SAMPLES (20)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional
+
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Latencies kept per API for the quantile estimate
+LATENCY_WINDOW = 200
+# Most hedge tokens an API can bank while traffic is healthy
+MAX_HEDGE_TOKENS = 10.0
+
+
+class LatencyWindow:
+    """Recent successful request latencies for one API"""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _ApiHedging:
+    """Per-API latency window, hedge budget and counters"""
+
+    def __init__(self, budget: float):
+        self.latencies = LatencyWindow()
+        self.budget = budget
+        self.tokens = 0.0
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+        self.skipped = 0
+
+    def earn(self) -> None:
+        self.requests += 1
+        self.tokens = min(MAX_HEDGE_TOKENS, self.tokens + self.budget)
+
+    def spend(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class Hedger:
+    """Sends a backup request when the first one runs past the API's tail latency"""
+
+    def __init__(
+        self,
+        apis: Iterable[str] = (),
+        quantile: float = 0.9,
+        budget: float = 0.1,
+        min_samples: int = 20,
+    ):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._apis: Dict[str, _ApiHedging] = {api: _ApiHedging(budget) for api in apis}
+
+    def enabled(self, api: str) -> bool:
+        return api in self._apis
+
+    def hedge_delay(self, api: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data"""
+        state = self._apis.get(api)
+        if state is None or len(state.latencies) < self.min_samples:
+            return None
+        return state.latencies.quantile(self.quantile)
+
+    async def run(self, api: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run one request, hedging it if it is slow and the API is opted in.
+
+        Args:
+            api (str): API name (as used for metrics, e.g. "factcheck")
+            fetch (callable): Zero-arg coroutine function sending one request
+
+        Returns:
+            Any: Result of whichever attempt answered first
+        """
+        state = self._apis.get(api)
+        if state is None:
+            return await fetch()
+
+        state.earn()
+        delay = self.hedge_delay(api)
+        primary = asyncio.ensure_future(self._timed(state, fetch))
+        attempts = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done:
+                    if state.spend():
+                        state.fired += 1
+                        metrics.hedged_requests.inc(api=api, outcome="fired")
+                        attempts.append(asyncio.ensure_future(self._timed(state, fetch, hedge=True)))
+                    else:
+                        state.skipped += 1
+                        metrics.hedged_requests.inc(api=api, outcome="no_budget")
+
+            pending = set(attempts)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            state.won += 1
+                            metrics.hedged_requests.inc(api=api, outcome="won")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed(self, state: _ApiHedging, fetch: Callable[[], Awaitable[Any]], hedge: bool = False) -> Any:
+        if hedge:
+            # Runs in this task's own context copy: audit entries go under "<api>_hedge"
+            metrics.mark_hedge()
+        started = time.perf_counter()
+        result = await fetch()
+        state.latencies.add(time.perf_counter() - started)
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-API hedging counters and the current hedge delay"""
+        stats = {}
+        for api, state in self._apis.items():
+            delay = self.hedge_delay(api)
+            stats[api] = {
+                "hedge_after_ms": round(delay * 1000, 1) if delay is not None else None,
+                "samples": len(state.latencies),
+                "requests": state.requests,
+                "hedges_fired": state.fired,
+                "hedges_won": state.won,
+                "skipped_no_budget": state.skipped,
+                "budget_tokens": round(state.tokens, 2),
+            }
+        return stats
+
+
+def _hedged_apis() -> Iterable[str]:
+    return [api.strip() for api in os.getenv("HEDGED_APIS", "").split(",") if api.strip()]
+
+
+# Global hedger for evidence APIs
+hedger = Hedger(
+    apis=_hedged_apis(),
+    quantile=float(os.getenv("HEDGE_QUANTILE", "0.9")),
+    budget=float(os.getenv("HEDGE_BUDGET", "0.1")),
+    min_samples=int(os.getenv("HEDGE_MIN_SAMPLES", "20")),
+)
@@ -0,0 +1,194 @@
+# backend/app/services/http_client.py
+"""
+Shared HTTP client registry.
+
+Every outbound call (Google APIs, Wikipedia, page fetches) goes through a
+small set of long-lived aiohttp sessions instead of opening a new
+ClientSession per request. Each pool keeps its own connector, so TCP/TLS
+connections are reused (keep-alive), DNS answers are cached and per-host
+connection limits apply.
+
+The FastAPI lifespan calls `http_clients.startup()` / `http_clients.close()`.
+Scripts and the MCP server that never run the lifespan still work: a pool is
+created lazily the first time it is requested.
+
+A pool's transport can be replaced with `http_clients.set_transport(name,
+factory)`: the factory receives the PoolConfig and returns the
+ClientSession to use (custom connector, resolver, proxy or a test double).
+With HTTP_TRUST_ENV=true sessions honour HTTP(S)_PROXY, so outbound API
+traffic can be routed through an egress or caching proxy.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for one named client"""
+    limit: int = 100
+    limit_per_host: int = 20
+    dns_ttl: int = 300
+    keepalive_timeout: float = 30.0
+    timeout: float = 5.0
+    trust_env: bool = False
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# "api" serves the Google/Wikipedia endpoints (few hosts, many requests);
+# "web" serves arbitrary page fetches for URL analysis (many hosts).
+DEFAULT_POOLS: Dict[str, PoolConfig] = {
+    "api": PoolConfig(
+        limit=_env_int("HTTP_POOL_LIMIT", 100),
+        limit_per_host=_env_int("HTTP_POOL_LIMIT_PER_HOST", 20),
+        dns_ttl=_env_int("HTTP_DNS_TTL", 300),
+        keepalive_timeout=_env_float("HTTP_KEEPALIVE_TIMEOUT", 30.0),
+        timeout=_env_float("HTTP_TIMEOUT", 5.0),
+        trust_env=os.getenv("HTTP_TRUST_ENV", "false").lower() == "true",
+    ),
+    "web": PoolConfig(
+        limit=_env_int("HTTP_WEB_POOL_LIMIT", 50),
+        limit_per_host=_env_int("HTTP_WEB_POOL_LIMIT_PER_HOST", 4),
+        dns_ttl=_env_int("HTTP_DNS_TTL", 300),
+        keepalive_timeout=_env_float("HTTP_KEEPALIVE_TIMEOUT", 30.0),
+        timeout=_env_float("HTTP_WEB_TIMEOUT", 8.0),
+        trust_env=os.getenv("HTTP_TRUST_ENV", "false").lower() == "true",
+    ),
+}
+
+# Builds the session for a pool in place of the default TCP connector
+TransportFactory = Callable[[PoolConfig], aiohttp.ClientSession]
+
+
+class HTTPClientRegistry:
+    """App-lifetime registry of pooled aiohttp sessions"""
+
+    def __init__(self, pools: Optional[Dict[str, PoolConfig]] = None):
+        self.pools = dict(pools or DEFAULT_POOLS)
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._transports: Dict[str, TransportFactory] = {}
+
+    def _create_session(self, name: str) -> aiohttp.ClientSession:
+        config = self.pools.get(name) or self.pools["api"]
+        factory = self._transports.get(name)
+        if factory is not None:
+            logger.info(f"HTTP pool '{name}' created from injected transport")
+            return factory(config)
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            ttl_dns_cache=config.dns_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=config.keepalive_timeout,
+        )
+        logger.info(
+            f"HTTP pool '{name}' created (limit={config.limit}, per_host={config.limit_per_host}, "
+            f"dns_ttl={config.dns_ttl}s)"
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+            trust_env=config.trust_env,
+        )
+
+    def get_session(self, name: str = "api") -> aiohttp.ClientSession:
+        """
+        Return the shared session for a pool, creating it on first use.
+
+        Args:
+            name (str): Pool name ("api" or "web")
+
+        Returns:
+            aiohttp.ClientSession: Long-lived session; callers must not close it
+        """
+        session = self._sessions.get(name)
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to the loop they were created on; scripts that call
+        # asyncio.run() repeatedly need a fresh session per loop.
+        if session is None or session.closed or self._loops.get(name) is not loop:
+            session = self._create_session(name)
+            self._sessions[name] = session
+            self._loops[name] = loop
+        return session
+
+    def set_transport(self, name: str, factory: Optional[TransportFactory]) -> None:
+        """
+        Inject (or with None, remove) a custom transport for a pool.
+
+        Args:
+            name (str): Pool name; unknown names use the "api" pool settings
+            factory (callable): Returns the ClientSession the pool should use
+
+        The pool's current session is dropped so the next request uses the new transport.
+        """
+        if factory is None:
+            self._transports.pop(name, None)
+        else:
+            self._transports[name] = factory
+        session = self._sessions.pop(name, None)
+        self._loops.pop(name, None)
+        if session is not None and not session.closed:
+            try:
+                # Closed in the background; in-flight requests on it finish first
+                asyncio.get_running_loop().create_task(session.close())
+            except RuntimeError:
+                pass
+
+    async def startup(self) -> None:
+        """Eagerly create all configured pools"""
+        for name in self.pools:
+            self.get_session(name)
+
+    async def close(self) -> None:
+        """Close every pool (called on application shutdown)"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._loops.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        # Give the connectors a moment to release SSL transports
+        await asyncio.sleep(0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool state for diagnostics"""
+        snapshot = {}
+        for name, session in self._sessions.items():
+            connector = session.connector
+            snapshot[name] = {
+                "closed": session.closed,
+                "injected": name in self._transports,
+                "limit": getattr(connector, "limit", None),
+                "limit_per_host": getattr(connector, "limit_per_host", None),
+            }
+        return snapshot
+
+
+# Global client registry instance
+http_clients = HTTPClientRegistry()
+
+
+def get_session(name: str = "api") -> aiohttp.ClientSession:
+    """Get the shared session for a named pool"""
+    return http_clients.get_session(name)
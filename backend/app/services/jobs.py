@@ -0,0 +1,439 @@
+# backend/app/services/jobs.py
+"""
+Asynchronous analysis jobs.
+
+A full analysis can take up to ~25s, which is too long to hold an HTTP
+request open behind most load balancers. Clients instead submit a job, get
+its id back immediately and poll for status/result while a pool of
+background workers runs `run_analysis`.
+
+Queues are pluggable:
+
+- MemoryJobQueue: in-process asyncio queue (jobs are lost on restart)
+- SQLiteJobQueue: jobs table in storage/jobs.db, shareable by several
+  processes; queued and interrupted jobs are picked up again after a
+  restart
+
+Completed analyses are written to `app.database.storage` exactly like
+synchronous /verify results; the job only keeps the analysis id.
+"""
+
+import os
+import json
+import uuid
+import time
+import asyncio
+import sqlite3
+import logging
+import socket
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+@dataclass
+class Job:
+    """One queued analysis request and its lifecycle state"""
+    content_type: str
+    content: str
+    language: str = "en"
+    user_id: Optional[str] = None
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = QUEUED
+    created_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    attempts: int = 0
+    analysis_id: Optional[str] = None
+    error: Optional[str] = None
+
+    def public(self) -> Dict[str, Any]:
+        """Status view returned by the API (without the submitted content)"""
+        data = asdict(self)
+        data.pop("content")
+        data["job_id"] = data.pop("id")
+        return data
+
+
+class JobQueue:
+    """
+    Interface every job queue implements.
+
+    The async methods run on the event loop and must not block it; the
+    synchronous maintenance calls (renew, recover) are run in a worker
+    thread by JobWorkerPool.
+    """
+
+    # Seconds a claim on a running job stays valid without renew()
+    lease_seconds: float = 60.0
+
+    async def put(self, job: Job) -> Job:
+        raise NotImplementedError
+
+    async def get(self) -> Job:
+        """Wait for the next queued job and mark it running"""
+        raise NotImplementedError
+
+    async def update(self, job: Job) -> None:
+        raise NotImplementedError
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    def renew(self) -> None:
+        """Keep the claims on this process's running jobs alive"""
+
+    def recover(self) -> int:
+        """Re-queue running jobs whose claim has expired; returns how many"""
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryJobQueue(JobQueue):
+    """In-process queue; finished jobs are kept in a bounded LRU for polling"""
+
+    def __init__(self, max_finished: int = 10000):
+        self.max_finished = max_finished
+        self._queue: Optional[asyncio.Queue] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def _pending(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def put(self, job: Job) -> Job:
+        self._jobs[job.id] = job
+        self._pending().put_nowait(job.id)
+        return job
+
+    async def get(self) -> Job:
+        while True:
+            job = self._jobs.get(await self._pending().get())
+            if job is not None and job.status == QUEUED:
+                job.status = RUNNING
+                job.started_at = _now()
+                job.attempts += 1
+                return job
+
+    async def update(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        if job.status in (DONE, FAILED):
+            # Finished jobs move to the end, so the oldest ones are evicted first
+            self._jobs.move_to_end(job.id)
+            for job_id in list(self._jobs):
+                if len(self._jobs) <= self.max_finished:
+                    break
+                if self._jobs[job_id].status in (DONE, FAILED):
+                    del self._jobs[job_id]
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"backend": "memory", **counts}
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Durable queue backed by a SQLite jobs table.
+
+    Several processes may share one jobs.db. A job is claimed inside a
+    BEGIN IMMEDIATE transaction, so exactly one process runs it, and the
+    claim records the owner and a lease that the owner's workers renew
+    while the job runs (renew()). A running job whose lease has expired
+    was interrupted (crash or restart) and is re-queued by recover(), up
+    to `max_attempts` runs per job; jobs of live processes are left alone.
+
+    Every transaction may wait up to 10s for another process's lock, so
+    the async methods run them in a worker thread.
+    """
+
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            data TEXT NOT NULL,
+            owner TEXT,
+            lease_until REAL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)",
+    ]
+    # Columns added after the first release, for tables created without them
+    MIGRATIONS = {"owner": "ALTER TABLE jobs ADD COLUMN owner TEXT",
+                  "lease_until": "ALTER TABLE jobs ADD COLUMN lease_until REAL"}
+
+    def __init__(
+        self,
+        storage_dir: str = "storage",
+        db_name: str = "jobs.db",
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        lease_seconds: float = 60.0,
+    ):
+        os.makedirs(storage_dir, exist_ok=True)
+        self.db_file = os.path.join(storage_dir, db_name)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        # Unique per queue instance, so a restarted process never inherits its old leases
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self._lock = threading.RLock()
+        # Autocommit mode: transactions are opened explicitly where they are needed
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column, statement in self.MIGRATIONS.items():
+                if column not in columns:
+                    self._conn.execute(statement)
+        self.recover()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that holds the database lock from its first statement"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def recover(self) -> int:
+        """Re-queue running jobs whose owner stopped renewing the lease, failing ones that keep crashing"""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT data FROM jobs WHERE status = ? AND COALESCE(lease_until, 0) < ?", (RUNNING, time.time())
+            ).fetchall()
+            for (data,) in rows:
+                job = Job(**json.loads(data))
+                if job.attempts >= self.max_attempts:
+                    job.status = FAILED
+                    job.finished_at = _now()
+                    job.error = f"Interrupted {job.attempts} times"
+                else:
+                    job.status = QUEUED
+                self._write(conn, job)
+        if rows:
+            logger.info(f"Recovered {len(rows)} interrupted jobs from {self.db_file}")
+        return len(rows)
+
+    def _event(self) -> asyncio.Event:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def _claim(self) -> Optional[Job]:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            job = Job(**json.loads(row[0]))
+            job.status = RUNNING
+            job.started_at = _now()
+            job.attempts += 1
+            claimed = conn.execute(
+                "UPDATE jobs SET status = ?, data = ?, owner = ?, lease_until = ? WHERE id = ? AND status = ?",
+                (RUNNING, json.dumps(asdict(job)), self.owner, time.time() + self.lease_seconds, job.id, QUEUED),
+            ).rowcount
+        return job if claimed == 1 else None
+
+    def _write(self, conn: sqlite3.Connection, job: Job) -> None:
+        # Only a running job keeps an owner; every other state releases the lease
+        owner = self.owner if job.status == RUNNING else None
+        lease_until = time.time() + self.lease_seconds if owner else None
+        conn.execute(
+            "INSERT OR REPLACE INTO jobs (id, status, created_at, data, owner, lease_until) VALUES (?, ?, ?, ?, ?, ?)",
+            (job.id, job.status, job.created_at, json.dumps(asdict(job)), owner, lease_until),
+        )
+
+    async def put(self, job: Job) -> Job:
+        await self.update(job)
+        self._event().set()
+        return job
+
+    async def get(self) -> Job:
+        while True:
+            event = self._event()
+            event.clear()
+            job = await asyncio.to_thread(self._claim)
+            if job is not None:
+                return job
+            try:
+                # Polling also picks up jobs queued (or recovered) by another process
+                await asyncio.wait_for(event.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def update(self, job: Job) -> None:
+        await asyncio.to_thread(self._update, job)
+
+    def _update(self, job: Job) -> None:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT status, owner FROM jobs WHERE id = ?", (job.id,)).fetchone()
+            if row is not None and row[0] == RUNNING and row[1] != self.owner:
+                # Our lease expired and another process took the job over; its result wins
+                logger.warning(f"Job {job.id} is now owned by {row[1]}; dropping update from {self.owner}")
+                return
+            self._write(conn, job)
+
+    def renew(self) -> None:
+        """Extend the leases of the jobs this process is running"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE status = ? AND owner = ?",
+                (time.time() + self.lease_seconds, RUNNING, self.owner),
+            )
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job(**json.loads(row[0])) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {"backend": "sqlite", **{status: count for status, count in rows}}
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+
+class JobWorkerPool:
+    """Background workers that drain a JobQueue through run_analysis"""
+
+    def __init__(self, queue: JobQueue, workers: int = 4):
+        self.queue = queue
+        self.workers = max(1, workers)
+        self._tasks: List[asyncio.Task] = []
+        self._renewer: Optional[asyncio.Task] = None
+        self._recoverer: Optional[asyncio.Task] = None
+
+    async def _run_job(self, job: Job) -> None:
+        # Imported lazily so importing the queue never pulls in the engine
+        from app.services.analysis_engine import run_analysis
+        from app.database import storage, analysis_record
+
+        started = time.time()
+        try:
+            result = await run_analysis(job.content_type, job.content, job.language)
+            storage.save_analysis(
+                result.id,
+                analysis_record(result, job.content_type, job.content, job.language, job.user_id),
+            )
+            job.analysis_id = result.id
+            job.status = DONE
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        job.finished_at = _now()
+        await self.queue.update(job)
+        logger.info(f"Job {job.id} {job.status} in {time.time() - started:.2f}s")
+
+    async def _worker(self, number: int) -> None:
+        while True:
+            job = await self.queue.get()
+            try:
+                await self._run_job(job)
+            except asyncio.CancelledError:
+                # Shutdown mid-job: the lease expires and the job is re-queued
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {number} error: {e}")
+
+    async def _renew_leases(self) -> None:
+        # Renewed three times per lease, so one slow tick never lets a live job expire
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.queue.renew)
+            except Exception as e:
+                logger.error(f"Job lease renewal failed: {e}")
+
+    async def _recover_leases(self) -> None:
+        # Same cadence as renewal: a crashed process's jobs wait at most a lease and a third
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.queue.recover)
+            except Exception as e:
+                logger.error(f"Job lease recovery failed: {e}")
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker(n)) for n in range(self.workers)]
+        self._renewer = asyncio.create_task(self._renew_leases())
+        self._recoverer = asyncio.create_task(self._recover_leases())
+        logger.info(f"Started {self.workers} analysis job workers")
+
+    async def stop(self) -> None:
+        tasks = self._tasks + [task for task in (self._renewer, self._recoverer) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._renewer = None
+        self._recoverer = None
+
+    async def submit(self, content_type: str, content: str, language: str = "en", user_id: Optional[str] = None) -> Job:
+        """Queue an analysis and return the job immediately"""
+        return await self.queue.put(Job(content_type, content, language or "en", user_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": len(self._tasks), **self.queue.stats()}
+
+
+def create_job_queue(backend: Optional[str] = None, storage_dir: str = "storage") -> JobQueue:
+    """Build the configured job queue (JOB_QUEUE_BACKEND=sqlite|memory)"""
+    backend = (backend or os.getenv("JOB_QUEUE_BACKEND", "sqlite")).lower()
+    if backend == "memory":
+        return MemoryJobQueue()
+    return SQLiteJobQueue(
+        storage_dir,
+        poll_interval=float(os.getenv("JOB_POLL_INTERVAL", 1.0)),
+        max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", 3)),
+        lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", 60.0)),
+    )
+
+
+# Global job queue and worker pool
+job_queue = create_job_queue()
+job_workers = JobWorkerPool(job_queue, workers=int(os.getenv("JOB_WORKERS", 4)))
@@ -0,0 +1,281 @@
+# backend/app/services/metrics.py
+"""
+Latency and outcome metrics for the analysis pipeline.
+
+Two views of the same measurements:
+
+- process-wide histograms/counters, rendered in the Prometheus text
+  exposition format by `GET /metrics`
+- a per-analysis breakdown (stage and outbound API timings) attached to
+  `Result.audit["metrics"]`, so one slow response can be explained on its own
+
+The per-analysis breakdown is carried in a ContextVar: asyncio tasks
+created inside an analysis (gather, wait_for) inherit it, so API helpers
+record into the right analysis without any extra arguments.
+"""
+
+import time
+import asyncio
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.services.deadline import Deadline
+
+# Seconds; tuned for API calls (tens of ms) up to whole analyses (~20s)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels"""
+
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label key -> (bucket counts, sum, count)
+        self._series: Dict[LabelKey, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{self.name}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(round(total, 6))}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class AnalysisTimings:
+    """Stage and API timings for a single analysis (the audit view)"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        # One entry per request: an API can be called once per claim in a single analysis
+        self.apis: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add_api(self, api: str, ms: float, outcome: str) -> None:
+        self.apis.setdefault(api, []).append({"ms": ms, "outcome": outcome})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stages_ms": {stage: round(seconds * 1000, 1) for stage, seconds in self.stages.items()},
+            "apis": self.apis,
+        }
+
+
+class ApiCall:
+    """Outcome holder yielded by `Metrics.api_call`; set `.outcome` on non-success"""
+
+    def __init__(self):
+        self.outcome = "ok"
+        self.code: Optional[int] = None
+
+    def status(self, code: int) -> None:
+        self.code = code
+        if code >= 400:
+            self.outcome = "not_found" if code == 404 else "http_error"
+
+
+class Metrics:
+    """Process-wide pipeline metrics registry"""
+
+    def __init__(self):
+        self.stage_seconds = Histogram(
+            "crediscope_stage_duration_seconds", "Duration of analysis pipeline stages"
+        )
+        self.api_seconds = Histogram(
+            "crediscope_api_request_duration_seconds", "Duration of outbound API requests"
+        )
+        self.api_requests = Counter(
+            "crediscope_api_requests_total", "Outbound API requests by outcome (ok, not_found, http_error, timeout, cancelled, error, circuit_open, quota)"
+        )
+        self.analyses = Counter(
+            "crediscope_analyses_total", "Analysis requests by content type and how they were served"
+        )
+        self.hedged_requests = Counter(
+            "crediscope_hedged_requests_total", "Hedged API requests (fired, won, no_budget)"
+        )
+        self.quota_events = Counter(
+            "crediscope_quota_events_total", "Client-side quota events (queued, rate_limited, daily_exhausted, upstream_429)"
+        )
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._current: contextvars.ContextVar = contextvars.ContextVar("analysis_timings", default=None)
+        self._hedge: contextvars.ContextVar = contextvars.ContextVar("hedge_attempt", default=False)
+
+    # -- per-analysis context --------------------------------------------
+
+    def begin_analysis(self) -> AnalysisTimings:
+        """Start collecting timings for the analysis running in this context"""
+        timings = AnalysisTimings()
+        self._current.set(timings)
+        return timings
+
+    def current(self) -> Optional[AnalysisTimings]:
+        return self._current.get()
+
+    def mark_hedge(self) -> None:
+        """Flag API calls made from the current task as hedge attempts"""
+        self._hedge.set(True)
+
+    # -- recording ---------------------------------------------------------
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a pipeline stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - started)
+
+    def record_stage(self, name: str, seconds: float) -> None:
+        """Record a stage timed elsewhere (e.g. one spanning several concurrent tasks)"""
+        self.stage_seconds.observe(seconds, stage=name)
+        timings = self.current()
+        if timings is not None:
+            timings.stages[name] = timings.stages.get(name, 0.0) + seconds
+
+    @contextmanager
+    def api_call(self, api: str, deadline: Optional[Deadline] = None) -> Iterator[ApiCall]:
+        """
+        Time one outbound API request and count its outcome.
+
+        A cancelled request (a hedge loser, a departed caller) counts as
+        "cancelled"; only a timeout error or an expired `deadline` counts as
+        "timeout".
+        """
+        call = ApiCall()
+        started = time.perf_counter()
+        try:
+            yield call
+        except asyncio.TimeoutError:
+            call.outcome = "timeout"
+            raise
+        except asyncio.CancelledError:
+            call.outcome = "timeout" if deadline is not None and deadline.expired else "cancelled"
+            raise
+        except BaseException:
+            call.outcome = "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.api_seconds.observe(elapsed, api=api)
+            self.api_requests.inc(api=api, outcome=call.outcome)
+            timings = self.current()
+            if timings is not None:
+                key = f"{api}_hedge" if self._hedge.get() else api
+                timings.add_api(key, round(elapsed * 1000, 1), call.outcome)
+
+    def api_cache_hit(self, api: str) -> None:
+        """Note in the audit that an API answer came from the evidence cache"""
+        timings = self.current()
+        if timings is not None:
+            timings.add_api(api, 0.0, "cache_hit")
+
+    def api_rejected(self, api: str, reason: str) -> None:
+        """Count a request that was never sent (e.g. circuit open)"""
+        self.api_requests.inc(api=api, outcome=reason)
+        timings = self.current()
+        if timings is not None:
+            timings.add_api(api, 0.0, reason)
+
+    def count_analysis(self, content_type: str, served: str) -> None:
+        self.analyses.inc(content_type=content_type, served=served)
+
+    # -- exposition --------------------------------------------------------
+
+    def register_collector(self, collector: Callable[[], List[str]]) -> None:
+        """Add a callable returning extra exposition lines at scrape time"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        registered = (
+            self.stage_seconds, self.api_seconds, self.api_requests,
+            self.analyses, self.hedged_requests, self.quota_events,
+        )
+        for metric in registered:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                lines.append(f"# collector failed: {type(e).__name__}")
+        return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, documentation: str, samples: List[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Render a gauge computed at scrape time"""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(_label_key(labels))} {_format_value(value)}")
+    return lines
+
+
+# Global metrics registry
+metrics = Metrics()
@@ -0,0 +1,384 @@
+# backend/app/services/page_fetch.py
+"""
+Streaming page fetch and text extraction for URL analysis.
+
+The body is read in chunks and decoded incrementally. The decoded text
+goes straight into an incremental HTML tokenizer (html.parser), so a page
+is never held in memory in full:
+
+- non-text content types are refused before the body is read
+- at most PAGE_FETCH_MAX_BYTES are read
+- script, style, navigation, headers, footers, forms and similar chrome
+  are dropped while parsing
+- text inside <article>/<main> is preferred over the rest of the page
+- reading stops as soon as enough main-content text has been collected
+
+Memory and CPU per URL are bounded by the byte cap whatever the page
+size.
+
+get_page_text() puts the page cache (app.services.cache.PageCache) in
+front of the fetch. A fresh entry is used without a request. A stale
+one is revalidated with If-None-Match/If-Modified-Since, and on
+304 Not Modified the stored extraction is reused.
+"""
+
+import os
+import re
+import codecs
+import logging
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.http_client import get_session
+from app.services.cache import page_cache
+from app.services.metrics import metrics
+from app.services.deadline import Deadline, client_timeout
+
+logger = logging.getLogger(__name__)
+
+PAGE_FETCH_MAX_BYTES = int(os.getenv("PAGE_FETCH_MAX_BYTES", str(1024 * 1024)))
+PAGE_TEXT_MAX_CHARS = int(os.getenv("PAGE_TEXT_MAX_CHARS", "5000"))
+PAGE_FETCH_TIMEOUT = 8.0
+CHUNK_SIZE = 16 * 1024
+
+HTML_TYPES = {"text/html", "application/xhtml+xml"}
+TEXT_TYPES = HTML_TYPES | {"text/plain"}
+
+# Elements whose content is never page text
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe", "object",
+    "nav", "header", "footer", "aside", "form", "button", "select", "textarea", "menu",
+}
+# Elements holding the main content when a page marks it up
+MAIN_TAGS = {"article", "main"}
+# Elements that end a line of text
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "dd", "dt", "blockquote", "pre", "section", "article", "main",
+    "h1", "h2", "h3", "h4", "h5", "h6", "tr", "td", "th", "table", "figcaption", "title", "hr",
+}
+# Main-content text below this length is treated as a mis-marked page
+MIN_MAIN_CHARS = 200
+# Unparsed input the tokenizer may hold (an unterminated tag is rescanned on every feed)
+MAX_PENDING_CHARS = 256 * 1024
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_\-]+)""", re.IGNORECASE)
+_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+_MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+class TextBuffer:
+    """Text collected line by line up to a character limit"""
+
+    __slots__ = ("lines", "line", "length", "limit")
+
+    def __init__(self, limit: int):
+        self.lines: List[str] = []
+        self.line: List[str] = []
+        self.length = 0
+        self.limit = limit
+
+    @property
+    def full(self) -> bool:
+        return self.length >= self.limit
+
+    def add(self, text: str) -> None:
+        if not self.full:
+            self.line.append(text)
+            self.length += len(text)
+
+    def end_line(self) -> None:
+        if self.line:
+            line = _SPACES.sub(" ", "".join(self.line)).strip()
+            if line:
+                self.lines.append(line)
+            self.line = []
+
+    def text(self) -> str:
+        self.end_line()
+        return "\n".join(self.lines)[:self.limit]
+
+
+class PageTextExtractor(HTMLParser):
+    """Incremental HTML-to-text tokenizer; feed() decoded chunks as they arrive"""
+
+    def __init__(self, max_chars: int = PAGE_TEXT_MAX_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self._skip_depth: Dict[str, int] = {}
+        self._main_depth = 0
+        self._in_title = False
+        self.title = ""
+        self.main = TextBuffer(max_chars)
+        # The whole page is kept up to a few times the limit in case no main content is marked up
+        self.page = TextBuffer(max_chars * 4)
+        self.malformed = False
+
+    @property
+    def done(self) -> bool:
+        """Enough text collected (or the markup is broken); the rest of the document can be skipped"""
+        return self.main.full or self.page.full or self.malformed
+
+    def feed(self, data: str) -> None:
+        super().feed(data)
+        # HTMLParser buffers everything after a construct it has not seen the end of
+        if len(self.rawdata) > MAX_PENDING_CHARS:
+            if self.cdata_elem:
+                # Inside <script>/<style>: the content is dropped anyway, keep enough to spot the end tag
+                self.rawdata = self.rawdata[-16:]
+            elif self.rawdata.startswith("<!--"):
+                self.rawdata = "<!--" + self.rawdata[-2:]
+            else:
+                # An unterminated tag; give up rather than rescan an ever-growing tail
+                self.malformed = True
+                self.rawdata = ""
+
+    def close(self) -> None:
+        if self.rawdata.startswith("<"):
+            # A tag or comment cut off by the end of input (or the byte cap) is not page text
+            self.rawdata = ""
+        super().close()
+
+    def handle_starttag(self, tag: str, attrs: List[Any]) -> None:
+        if tag in SKIP_TAGS:
+            self._skip_depth[tag] = self._skip_depth.get(tag, 0) + 1
+        elif tag in MAIN_TAGS:
+            self._main_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        if tag in BLOCK_TAGS:
+            self._end_line()
+
+    def handle_startendtag(self, tag: str, attrs: List[Any]) -> None:
+        if tag in BLOCK_TAGS:
+            self._end_line()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIP_TAGS:
+            if self._skip_depth.get(tag):
+                self._skip_depth[tag] -= 1
+        elif tag in MAIN_TAGS:
+            self._main_depth = max(0, self._main_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        if tag in BLOCK_TAGS:
+            self._end_line()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+            return
+        if any(self._skip_depth.values()):
+            return
+        self.page.add(data)
+        if self._main_depth:
+            self.main.add(data)
+
+    def _end_line(self) -> None:
+        self.page.end_line()
+        self.main.end_line()
+
+    def text(self) -> str:
+        """Main content if the page marks any up, otherwise all page text; title first"""
+        main = self.main.text()
+        body = main if len(main) >= MIN_MAIN_CHARS else self.page.text()
+        title = _SPACES.sub(" ", self.title).strip()
+        if title and not body.startswith(title):
+            body = f"{title}\n{body}"
+        return body[:self.max_chars]
+
+
+@dataclass
+class PageText:
+    """Extracted text of a fetched page and how it was obtained"""
+    text: str = ""
+    status: int = 0
+    content_type: str = ""
+    bytes_read: int = 0
+    stopped_early: bool = False     # enough text before the end of the document
+    truncated: bool = False         # hit PAGE_FETCH_MAX_BYTES
+    skipped: Optional[str] = None   # why no text was extracted
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cache_control: str = ""
+    cache: Optional[str] = None     # page cache outcome: miss, fresh, revalidated or changed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "content_type": self.content_type,
+            "bytes_read": self.bytes_read,
+            "characters": len(self.text),
+            "stopped_early": self.stopped_early,
+            "truncated": self.truncated,
+            "skipped": self.skipped,
+            "cache": self.cache,
+        }
+
+    def cache_entry(self) -> Dict[str, Any]:
+        """What the page cache keeps of this page"""
+        return {
+            "text": self.text,
+            "content_type": self.content_type,
+            "bytes_read": self.bytes_read,
+            "stopped_early": self.stopped_early,
+            "truncated": self.truncated,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+    @classmethod
+    def from_cache_entry(cls, entry: Dict[str, Any], status: int, cache: str) -> "PageText":
+        return cls(
+            text=entry.get("text", ""),
+            status=status,
+            content_type=entry.get("content_type", ""),
+            bytes_read=entry.get("bytes_read", 0),
+            stopped_early=entry.get("stopped_early", False),
+            truncated=entry.get("truncated", False),
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            cache=cache,
+        )
+
+
+def _sniff_charset(head: bytes) -> Optional[str]:
+    match = _META_CHARSET.search(head[:2048])
+    if not match:
+        return None
+    name = match.group(1).decode("ascii", "ignore")
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def _freshness(cache_control: str) -> Tuple[bool, Optional[float]]:
+    """(storable, freshness in seconds or None for the default) from a Cache-Control header"""
+    directives = cache_control.lower()
+    if "no-store" in directives:
+        return False, None
+    if "no-cache" in directives:
+        return True, 0.0
+    match = _MAX_AGE.search(directives)
+    return True, float(match.group(1)) if match else None
+
+
+def _conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+async def fetch_page_text(url: str, deadline: Optional[Deadline] = None,
+                          max_bytes: int = PAGE_FETCH_MAX_BYTES, max_chars: int = PAGE_TEXT_MAX_CHARS,
+                          headers: Optional[Dict[str, str]] = None) -> PageText:
+    """
+    Download a page as a stream and extract its readable text.
+
+    Args:
+        url (str): Page URL
+        deadline (Deadline): Analysis deadline bounding the request
+        max_bytes (int): Most body bytes read
+        max_chars (int): Most characters of text returned
+        headers (dict): Extra request headers (conditional GET validators)
+
+    Returns:
+        PageText: Extracted text (empty when the page is unusable, or on 304) and fetch details
+    """
+    page = PageText()
+    session = get_session("web")
+    with metrics.api_call("page_fetch", deadline) as call:
+        async with session.get(url, headers=headers, timeout=client_timeout(deadline, PAGE_FETCH_TIMEOUT)) as resp:
+            call.status(resp.status)
+            page.status = resp.status
+            page.content_type = resp.content_type or ""
+            page.etag = resp.headers.get("ETag")
+            page.last_modified = resp.headers.get("Last-Modified")
+            page.cache_control = resp.headers.get("Cache-Control", "")
+            if resp.status == 304:
+                return page
+            if resp.status != 200:
+                page.skipped = f"http_{resp.status}"
+                return page
+            if page.content_type not in TEXT_TYPES:
+                page.skipped = "unsupported_content_type"
+                return page
+
+            extractor = PageTextExtractor(max_chars) if page.content_type in HTML_TYPES else None
+            plain = TextBuffer(max_chars) if extractor is None else None
+            decoder = None
+            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                if decoder is None:
+                    charset = resp.charset or _sniff_charset(chunk) or "utf-8"
+                    try:
+                        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+                    except LookupError:
+                        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                chunk = chunk[:max_bytes - page.bytes_read]
+                page.bytes_read += len(chunk)
+                text = decoder.decode(chunk)
+                if extractor is not None:
+                    extractor.feed(text)
+                    if extractor.done:
+                        page.stopped_early = True
+                        break
+                else:
+                    plain.add(text)
+                    if plain.full:
+                        page.stopped_early = True
+                        break
+                if page.bytes_read >= max_bytes:
+                    page.truncated = True
+                    break
+
+            if extractor is not None:
+                extractor.close()
+                page.text = extractor.text()
+            else:
+                page.text = plain.text()
+    return page
+
+
+async def get_page_text(url: str, deadline: Optional[Deadline] = None) -> PageText:
+    """
+    Page text through the page cache.
+
+    A fresh cache entry is returned without a request. A stale entry is
+    revalidated with its ETag/Last-Modified; on 304 its extraction is
+    reused and its freshness renewed. Anything else is fetched, extracted
+    and stored (unless the page says no-store).
+
+    Args:
+        url (str): Page URL
+        deadline (Deadline): Analysis deadline bounding the request
+
+    Returns:
+        PageText: Extracted text and how it was obtained (see PageText.cache)
+    """
+    entry = page_cache.get(url)
+    if entry is not None and page_cache.is_fresh(entry):
+        page_cache.count("fresh_hits")
+        metrics.api_cache_hit("page_fetch")
+        return PageText.from_cache_entry(entry, 200, "fresh")
+
+    page = await fetch_page_text(url, deadline, headers=_conditional_headers(entry))
+    storable, fresh_ttl = _freshness(page.cache_control)
+
+    if page.status == 304 and entry is not None:
+        page_cache.count("revalidated")
+        # A 304 may carry updated validators; keep the old ones otherwise
+        entry = dict(entry, etag=page.etag or entry.get("etag"), last_modified=page.last_modified or entry.get("last_modified"))
+        if storable:
+            page_cache.put(url, entry, fresh_ttl)
+        return PageText.from_cache_entry(entry, 304, "revalidated")
+
+    page.cache = "changed" if entry is not None else "miss"
+    page_cache.count("changed" if entry is not None else "misses")
+    if storable and page.status == 200 and page.text and not page.skipped:
+        page_cache.put(url, page.cache_entry(), fresh_ttl)
+    return page
@@ -0,0 +1,307 @@
+# backend/app/services/quota.py
+"""
+Client-side quota manager for quota-limited Google APIs.
+
+Custom Search and Fact Check enforce per-minute and per-day quotas. Under
+burst traffic they answer 429, and the lookup ended up as empty evidence.
+This module rations requests before they are sent:
+
+- per endpoint: a per-minute token bucket plus a daily counter
+  (`<PREFIX>_QUOTA_PER_MINUTE`, `<PREFIX>_QUOTA_PER_DAY`, e.g.
+  CUSTOM_SEARCH_QUOTA_PER_DAY=100)
+- per API key: the same pair shared by every endpoint using that key
+  (API_KEY_QUOTA_PER_MINUTE, API_KEY_QUOTA_PER_DAY), for project-level
+  quotas
+
+A limit of 0 means unlimited. When the per-minute budget is empty, a caller
+queues for the next token if it arrives within QUOTA_MAX_WAIT seconds (and
+within the analysis deadline). Otherwise the request is refused with
+QuotaExceeded and the caller serves stale cached evidence instead. A 429
+from upstream empties the endpoint's bucket until Retry-After has passed.
+Daily counters reset at midnight in QUOTA_DAY_TIMEZONE, which is Pacific
+time by default, matching Google's quota day.
+
+The daily check, the daily take and the token reservation happen together
+under one lock, so concurrent callers cannot overrun a cap. A caller that
+is cancelled (or fails) while queued gives its tokens and its daily slot
+back.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime, date, timezone, tzinfo
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Environment prefixes of the endpoints quotas are enforced for
+QUOTA_ENDPOINTS = {
+    "factcheck": "FACTCHECK",
+    "custom_search": "CUSTOM_SEARCH",
+}
+
+# Google's default per-minute query limit for Custom Search
+DEFAULT_LIMITS = {
+    "custom_search": (100, 0),
+}
+
+
+class QuotaExceeded(Exception):
+    """Raised when a request cannot be sent without exceeding a quota"""
+
+
+class TokenBucket:
+    """Per-minute rate limit; tokens can be reserved ahead so waiters queue in order"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Take a token; returns the wait until it is valid, or None if that exceeds max_wait"""
+        self._refill()
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        if wait > max_wait:
+            return None
+        self.tokens -= 1
+        return wait
+
+    def refund(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def drain(self, seconds: float) -> None:
+        """Hold the next token back for `seconds` (upstream said we are over quota)"""
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def remaining(self) -> int:
+        self._refill()
+        return max(0, int(self.tokens))
+
+
+class DailyQuota:
+    """Requests per quota day"""
+
+    def __init__(self, per_day: int, tz: tzinfo):
+        self.limit = per_day
+        self.tz = tz
+        self.used = 0
+        self._day = self._today()
+
+    def _today(self) -> date:
+        return datetime.now(self.tz).date()
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self.used = 0
+
+    def available(self) -> bool:
+        self._roll()
+        return self.used < self.limit
+
+    def take(self) -> None:
+        self._roll()
+        self.used += 1
+
+    def refund(self) -> None:
+        self._roll()
+        self.used = max(0, self.used - 1)
+
+    def exhaust(self) -> None:
+        self._roll()
+        self.used = max(self.used, self.limit)
+
+    def remaining(self) -> int:
+        self._roll()
+        return max(0, self.limit - self.used)
+
+
+class QuotaBucket:
+    """Per-minute and per-day limits for one endpoint or API key"""
+
+    def __init__(self, name: str, per_minute: float, per_day: int, tz: tzinfo):
+        self.name = name
+        self.minute = TokenBucket(per_minute) if per_minute > 0 else None
+        self.day = DailyQuota(per_day, tz) if per_day > 0 else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "per_minute": self.minute.capacity if self.minute else None,
+            "remaining_minute": self.minute.remaining() if self.minute else None,
+            "per_day": self.day.limit if self.day else None,
+            "remaining_day": self.day.remaining() if self.day else None,
+        }
+
+
+def _key_id(api_key: str) -> str:
+    """Stable, non-secret label for an API key"""
+    return "key:" + hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+class QuotaManager:
+    """Token buckets per endpoint and per API key"""
+
+    def __init__(
+        self,
+        endpoint_limits: Dict[str, Tuple[float, int]],
+        key_limits: Tuple[float, int] = (0, 0),
+        max_wait: float = 2.0,
+        tz: tzinfo = timezone.utc,
+    ):
+        self.max_wait = max_wait
+        self.key_limits = key_limits
+        self.tz = tz
+        self._buckets: Dict[str, QuotaBucket] = {
+            name: QuotaBucket(name, per_minute, per_day, tz)
+            for name, (per_minute, per_day) in endpoint_limits.items()
+            if per_minute > 0 or per_day > 0
+        }
+        self.events: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _buckets_for(self, api: str, api_key: Optional[str]) -> List[QuotaBucket]:
+        buckets = []
+        if api in self._buckets:
+            buckets.append(self._buckets[api])
+        per_minute, per_day = self.key_limits
+        if api_key and (per_minute > 0 or per_day > 0):
+            key = _key_id(api_key)
+            if key not in self._buckets:
+                self._buckets[key] = QuotaBucket(key, per_minute, per_day, self.tz)
+            buckets.append(self._buckets[key])
+        return buckets
+
+    def _event(self, api: str, event: str) -> None:
+        counters = self.events.setdefault(api, {})
+        counters[event] = counters.get(event, 0) + 1
+        metrics.quota_events.inc(api=api, event=event)
+
+    def _refuse(self, api: str, event: str, reason: str) -> QuotaExceeded:
+        self._event(api, event)
+        metrics.api_rejected(api, "quota")
+        return QuotaExceeded(reason)
+
+    async def acquire(self, api: str, api_key: Optional[str] = None, max_wait: Optional[float] = None) -> None:
+        """
+        Wait for permission to send one request.
+
+        Args:
+            api (str): Endpoint name (e.g. "custom_search")
+            api_key (str): Key the request is sent with (shares the key's quota)
+            max_wait (float): Longest acceptable queueing delay (default QUOTA_MAX_WAIT)
+
+        Raises:
+            QuotaExceeded: The daily quota is spent, or no token frees up within max_wait
+        """
+        max_wait = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        with self._lock:
+            buckets = self._buckets_for(api, api_key)
+            if not buckets:
+                return
+            if any(b.day is not None and not b.day.available() for b in buckets):
+                raise self._refuse(api, "daily_exhausted", f"Daily quota exhausted for '{api}'")
+
+            reserved: List[TokenBucket] = []
+            wait = 0.0
+            for bucket in buckets:
+                if bucket.minute is None:
+                    continue
+                bucket_wait = bucket.minute.reserve(max_wait)
+                if bucket_wait is None:
+                    for taken in reserved:
+                        taken.refund()
+                    raise self._refuse(api, "rate_limited", f"Per-minute quota exhausted for '{api}'")
+                reserved.append(bucket.minute)
+                wait = max(wait, bucket_wait)
+            # The daily slot is taken with the check, before any waiting
+            days = [bucket.day for bucket in buckets if bucket.day is not None]
+            for day in days:
+                day.take()
+
+        if wait > 0:
+            self._event(api, "queued")
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # Cancelled while queued: the request is never sent, so nothing was spent
+                with self._lock:
+                    for taken in reserved:
+                        taken.refund()
+                    for day in days:
+                        day.refund()
+                raise
+
+    def upstream_throttled(self, api: str, api_key: Optional[str] = None, retry_after: Optional[str] = None) -> None:
+        """Record a 429 and hold the endpoint's bucket back until Retry-After"""
+        self._event(api, "upstream_429")
+        try:
+            hold = float(retry_after) if retry_after else 60.0
+        except ValueError:
+            hold = 60.0
+        with self._lock:
+            for bucket in self._buckets_for(api, api_key):
+                if bucket.minute is not None:
+                    bucket.minute.drain(hold)
+                elif bucket.day is not None and hold >= 3600:
+                    bucket.day.exhaust()
+        logger.warning(f"'{api}' answered 429; holding requests for {hold:.0f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """Remaining quota per bucket and throttle events per API"""
+        with self._lock:
+            buckets = {name: bucket.as_dict() for name, bucket in sorted(self._buckets.items())}
+        return {
+            "max_wait_seconds": self.max_wait,
+            "buckets": buckets,
+            "events": self.events,
+        }
+
+
+def _env_limit(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _quota_timezone() -> tzinfo:
+    name = os.getenv("QUOTA_DAY_TIMEZONE", "America/Los_Angeles")
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        logger.warning(f"Unknown QUOTA_DAY_TIMEZONE '{name}', using UTC")
+        return timezone.utc
+
+
+# Global quota manager
+quotas = QuotaManager(
+    endpoint_limits={
+        name: (
+            _env_limit(f"{prefix}_QUOTA_PER_MINUTE", DEFAULT_LIMITS.get(name, (0, 0))[0]),
+            int(_env_limit(f"{prefix}_QUOTA_PER_DAY", DEFAULT_LIMITS.get(name, (0, 0))[1])),
+        )
+        for name, prefix in QUOTA_ENDPOINTS.items()
+    },
+    key_limits=(
+        _env_limit("API_KEY_QUOTA_PER_MINUTE", 0),
+        int(_env_limit("API_KEY_QUOTA_PER_DAY", 0)),
+    ),
+    max_wait=_env_limit("QUOTA_MAX_WAIT", 2.0),
+    tz=_quota_timezone(),
+)
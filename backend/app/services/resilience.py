@@ -0,0 +1,266 @@
+# backend/app/services/resilience.py
+"""
+Circuit breakers and adaptive concurrency limits for external APIs.
+
+Every upstream (translation, factcheck, custom_search, wikipedia, gemini,
+vision) gets its own guard:
+
+- a circuit breaker (closed -> open -> half-open). After
+  CIRCUIT_FAILURE_THRESHOLD consecutive failures (timeouts, connection
+  errors, 5xx or 429) the circuit opens and calls fail instantly with
+  CircuitOpenError, so the pipeline skips that source without waiting.
+  After CIRCUIT_RESET_TIMEOUT seconds one probe request is let through; if
+  it succeeds the circuit closes again.
+- an AIMD concurrency limit. Each success raises the limit by 1/limit
+  (about +1 per round of requests), and each failure halves it. Requests
+  over the limit wait for a slot (bounded by the caller's deadline) instead
+  of piling more load onto a struggling API.
+
+Clients wrap their request in `async with upstreams.call(api) as call:`,
+which replaces `metrics.api_call(api)` and yields the same ApiCall, so the
+breaker sees the status the client reports with `call.status(code)`.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from app.services.deadline import Deadline
+from app.services.metrics import metrics, ApiCall
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Outcomes reported to breaker and limiter
+SUCCESS = "success"
+FAILURE = "failure"
+IGNORED = "ignored"  # cancelled by the caller (deadline, losing hedge): says nothing about the API
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.times_opened = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """Whether a request may go out now (claims the probe when half-open)"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record(self, outcome: str) -> None:
+        if outcome == SUCCESS:
+            if self._opened_at is not None:
+                logger.info("Circuit closed after successful probe")
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+        elif outcome == FAILURE:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+            self._probing = False
+        else:
+            # A cancelled probe proved nothing; let the next request probe
+            self._probing = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        state = self.state
+        retry_in = None
+        if state == OPEN:
+            retry_in = round(self._opened_at + self.reset_timeout - time.monotonic(), 1)
+        return {
+            "state": state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "retry_in_seconds": retry_in,
+        }
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit: additive increase on success, halve on failure"""
+
+    def __init__(self, initial: float = 20, minimum: float = 1, maximum: float = 200, backoff: float = 0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self, outcome: str) -> None:
+        self.in_flight -= 1
+        if outcome == SUCCESS:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+        elif outcome == FAILURE:
+            self.limit = max(self.minimum, self.limit * self.backoff)
+        # Wake as many waiters as there are free slots; each re-checks the limit
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"limit": round(self.limit, 2), "in_flight": self.in_flight, "waiting": len(self._waiters)}
+
+
+class UpstreamGuard:
+    """Breaker and concurrency limit for one upstream API"""
+
+    def __init__(self, name: str, breaker: CircuitBreaker, limiter: AdaptiveLimiter):
+        self.name = name
+        self.breaker = breaker
+        self.limiter = limiter
+        self.rejected = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self.breaker.as_dict(), "concurrency": self.limiter.as_dict(), "rejected": self.rejected}
+
+
+def _call_outcome(call: ApiCall) -> str:
+    """Whether a completed call counts against the upstream"""
+    if call.outcome in ("timeout", "error"):
+        return FAILURE
+    if call.code is not None and (call.code >= 500 or call.code == 429):
+        return FAILURE
+    # Other 4xx answers (bad query, no article) mean the API itself is fine
+    return SUCCESS
+
+
+class UpstreamRegistry:
+    """Per-upstream guards, created on first use"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        initial_limit: float = 20,
+        min_limit: float = 1,
+        max_limit: float = 200,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._guards: Dict[str, UpstreamGuard] = {}
+
+    def get(self, name: str) -> UpstreamGuard:
+        guard = self._guards.get(name)
+        if guard is None:
+            guard = self._guards[name] = UpstreamGuard(
+                name,
+                CircuitBreaker(self.failure_threshold, self.reset_timeout),
+                AdaptiveLimiter(self.initial_limit, self.min_limit, self.max_limit),
+            )
+        return guard
+
+    def is_open(self, name: str) -> bool:
+        """True while calls to an upstream are being refused"""
+        return name in self._guards and self._guards[name].breaker.state == OPEN
+
+    @asynccontextmanager
+    async def call(
+        self, api: str, upstream: Optional[str] = None, deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[ApiCall]:
+        """
+        Guard and time one request.
+
+        Args:
+            api (str): Metrics name of the call (e.g. "language_detection")
+            upstream (str): Breaker/limit to use when it differs from `api`
+                (e.g. "translation" for detection and translation calls)
+            deadline (Deadline): Analysis deadline; a call cancelled after it
+                expired counts as a timeout rather than "cancelled"
+
+        Yields:
+            ApiCall: Report the HTTP status with `call.status(code)`
+
+        Raises:
+            CircuitOpenError: The upstream's circuit is open
+        """
+        guard = self.get(upstream or api)
+        if not guard.breaker.allow():
+            guard.rejected += 1
+            metrics.api_rejected(api, "circuit_open")
+            raise CircuitOpenError(f"Circuit open for '{guard.name}'")
+
+        try:
+            await guard.limiter.acquire()
+        except BaseException:
+            guard.breaker.record(IGNORED)
+            raise
+
+        outcome = IGNORED
+        try:
+            with metrics.api_call(api, deadline) as call:
+                yield call
+            outcome = _call_outcome(call)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            outcome = FAILURE
+            raise
+        finally:
+            guard.limiter.release(outcome)
+            previous = guard.breaker.state
+            guard.breaker.record(outcome)
+            if guard.breaker.state == OPEN and previous != OPEN:
+                logger.warning(f"Circuit opened for '{guard.name}' after {guard.breaker.failures} failures")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Breaker state and concurrency limit per upstream"""
+        return {name: guard.as_dict() for name, guard in sorted(self._guards.items())}
+
+
+# Global upstream guards
+upstreams = UpstreamRegistry(
+    failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+    initial_limit=float(os.getenv("UPSTREAM_CONCURRENCY_INITIAL", "20")),
+    min_limit=float(os.getenv("UPSTREAM_CONCURRENCY_MIN", "1")),
+    max_limit=float(os.getenv("UPSTREAM_CONCURRENCY_MAX", "200")),
+)
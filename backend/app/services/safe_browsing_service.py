@@ -1,9 +1,10 @@
 # backend/app/services/safe_browsing_service.py
 
 import os
-import aiohttp
 from typing import Dict, Any
 
+from app.services.endpoints import endpoints
+
 SAFE_BROWSING_API_KEY = os.getenv("SAFE_BROWSING_API_KEY")
 
 async def check_url_safety(url: str) -> Dict[str, Any]:
@@ -14,7 +15,7 @@ async def check_url_safety(url: str) -> Dict[str, Any]:
     if not SAFE_BROWSING_API_KEY:
         return {"status": "not_configured"}
 
-    endpoint = f"https://safebrowsing.googleapis.com/v4/threatMatches:find?key={SAFE_BROWSING_API_KEY}"
+    endpoint = endpoints.url("safe_browsing", f"?key={SAFE_BROWSING_API_KEY}")
     body = {
         "client": {"clientId": "crediscope", "clientVersion": "1.0"},
         "threatInfo": {
@@ -24,6 +25,6 @@ async def check_url_safety(url: str) -> Dict[str, Any]:
             "threatEntries": [{"url": url}],
         },
     }
-    async with aiohttp.ClientSession() as session:
-        async with session.post(endpoint, json=body) as resp:
-            return await resp.json()
+    session = endpoints.session("safe_browsing")
+    async with session.post(endpoint, json=body) as resp:
+        return await resp.json()
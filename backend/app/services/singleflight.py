@@ -0,0 +1,103 @@
+# backend/app/services/singleflight.py
+"""
+Single-flight request coalescing.
+
+When a claim goes viral many identical analyses arrive at once. Instead of
+each caller fanning out to every external API, the first caller for a key
+starts the work as a background task and everyone else with the same key
+awaits that same task.
+
+The shared task is shielded from its callers: a client disconnecting (its
+request task being cancelled) or a caller-side timeout only abandons that
+caller's wait, never the work other callers are waiting on.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Registry of in-flight tasks keyed by request fingerprint"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.started = 0
+        self.coalesced = 0
+        self.abandoned = 0
+        self.failed = 0
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            # Retrieved here so an exception nobody awaited is not reported as lost
+            self.failed += 1
+
+    async def do(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Run `factory()` once per key among concurrent callers.
+
+        Args:
+            key (str): Coalescing key (e.g. content fingerprint)
+            factory (callable): Zero-arg coroutine function doing the work
+            timeout (float): Optional per-caller wait limit; the shared work keeps running
+
+        Returns:
+            Tuple[Any, bool]: (result, joined) where joined is True when this
+            caller attached to work started by another caller
+        """
+        task = self._inflight.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._on_done(key, t))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"Coalesced request onto in-flight work ({key[:24]}...)")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            if timeout is not None:
+                result = await asyncio.wait_for(asyncio.shield(task), timeout)
+            else:
+                result = await asyncio.shield(task)
+            return result, joined
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if not task.done():
+                self.abandoned += 1
+            raise
+        finally:
+            if self._inflight.get(key) is task:
+                self._waiters[key] = max(0, self._waiters.get(key, 1) - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters and current in-flight keys"""
+        total = self.started + self.coalesced
+        return {
+            "in_flight": len(self._inflight),
+            "waiters": sum(self._waiters.values()),
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "abandoned_waits": self.abandoned,
+            "failed": self.failed,
+            "coalesce_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+# Global in-flight registry for run_analysis
+analysis_flights = SingleFlight()
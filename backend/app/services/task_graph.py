@@ -0,0 +1,112 @@
+# backend/app/services/task_graph.py
+"""
+Dependency-graph executor for pipeline stages.
+
+Stages are registered with the names of the stages whose results they
+need. Every stage starts as soon as its own dependencies have finished, so
+independent work overlaps and total latency tracks the critical path
+rather than the sum of all stages.
+
+    graph = TaskGraph()
+    graph.add("detect", detect)
+    graph.add("text", translate_if_needed, deps=("detect",))
+    graph.add("fact_checks", search, deps=("text",))
+    results, unfinished = await graph.run(timeout=5.0)
+
+A stage receives its dependencies' results as keyword arguments. Stages can
+also look at (or cancel) another stage's task through `graph.task(name)`
+without depending on it, which is how speculative work is consumed.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+StageFn = Callable[..., Awaitable[Any]]
+
+
+class TaskGraph:
+    """Runs named async stages as soon as their dependencies complete"""
+
+    def __init__(self):
+        self._stages: Dict[str, Tuple[StageFn, Tuple[str, ...]]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add(self, name: str, fn: StageFn, deps: Sequence[str] = ()) -> None:
+        """
+        Register a stage.
+
+        Args:
+            name (str): Stage name (also the keyword its result is passed as)
+            fn (callable): Coroutine function taking the dependency results as kwargs
+            deps (sequence): Names of stages that must finish first
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' registered twice")
+        self._stages[name] = (fn, tuple(deps))
+
+    def task(self, name: str) -> asyncio.Task:
+        """The running task of a stage (only valid inside `run`)"""
+        return self._tasks[name]
+
+    def _check(self) -> None:
+        """Reject unknown dependencies and cycles before starting anything"""
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in self._stages[name][1]:
+                if dep not in self._stages:
+                    raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+                visit(dep, path + (name,))
+            state[name] = 2
+
+        for name in self._stages:
+            visit(name, ())
+
+    async def _run_stage(self, name: str) -> Any:
+        fn, deps = self._stages[name]
+        values = {}
+        for dep in deps:
+            # Shielded so one dependent being cancelled never cancels shared work
+            values[dep] = await asyncio.shield(self._tasks[dep])
+        return await fn(**values)
+
+    async def run(self, timeout: Optional[float] = None) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run every stage, overlapping whatever the dependencies allow.
+
+        Args:
+            timeout (float): Overall time limit; stages still running are cancelled
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: (results of stages that succeeded,
+            names of stages that did not finish in time)
+        """
+        self._check()
+        self._tasks = {name: asyncio.ensure_future(self._run_stage(name)) for name in self._stages}
+        try:
+            done, pending = await asyncio.wait(self._tasks.values(), timeout=timeout)
+        finally:
+            for task in self._tasks.values():
+                if not task.done():
+                    task.cancel()
+
+        results: Dict[str, Any] = {}
+        unfinished: List[str] = []
+        for name, task in self._tasks.items():
+            if task not in done:
+                unfinished.append(name)
+            elif task.cancelled():
+                continue
+            elif task.exception() is not None:
+                logger.warning(f"Pipeline stage '{name}' failed: {task.exception()}")
+            else:
+                results[name] = task.result()
+        return results, unfinished
@@ -0,0 +1,234 @@
+# backend/app/services/templates.py
+"""
+Precompiled result templates (explanations, quick analysis, checklists,
+intelligence reports).
+
+The texts live in app/data/templates/<lang>.json, or in the directory named
+by RESULT_TEMPLATES_DIR. Every file is loaded and compiled once at import.
+Keys a translation lacks are filled from en.json at that point, so a
+request never falls back across files.
+
+Sections are keyed by claim type, optionally narrowed to a verdict
+("vaccine_conspiracy/false"). A lookup tries claim type + verdict, then
+claim type, then the fallback type with and without the verdict, and
+remembers the answer per (language, claim type, verdict).
+
+Templates use str.format-style {fields}. They are split into literal and
+field parts up front, so rendering is one join. A template without fields
+is returned as the shared string itself.
+"""
+
+import os
+import re
+import json
+import logging
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "templates")
+DEFAULT_LANGUAGE = "en"
+FALLBACK_CLAIM_TYPE = "general_misinformation"
+
+_VERDICT_WORD = re.compile(r"[a-z]+")
+
+
+class Template:
+    """A text split once into literal and {field} parts"""
+
+    __slots__ = ("parts", "static")
+
+    def __init__(self, text: str):
+        parts = []
+        for literal, field, _spec, _conversion in Formatter().parse(text):
+            if literal:
+                parts.append((literal, False))
+            if field is not None:
+                parts.append((field, True))
+        self.parts: Tuple[Tuple[str, bool], ...] = tuple(parts)
+        # Texts without fields render to this shared string
+        self.static: Optional[str] = "".join(p for p, _ in parts) if not any(f for _, f in parts) else None
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        if self.static is not None:
+            return self.static
+        return "".join(str(values[part]) if is_field else part for part, is_field in self.parts)
+
+
+class Phrase:
+    """A fragment with a variant for zero and for a positive count"""
+
+    __slots__ = ("count", "some", "none")
+
+    def __init__(self, spec: Dict[str, str]):
+        self.count = spec["count"]
+        self.some = Template(spec["some"])
+        self.none = Template(spec["none"])
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        return (self.some if values.get(self.count) else self.none).render(values)
+
+
+class Explanation:
+    __slots__ = ("body", "phrases")
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.body = Template(spec["text"])
+        self.phrases = {name: Phrase(phrase) for name, phrase in spec.get("phrases", {}).items()}
+
+    def render(self, values: Dict[str, Any]) -> str:
+        if self.phrases:
+            values = dict(values)
+            for name, phrase in self.phrases.items():
+                values[name] = phrase.render(values)
+        return self.body.render(values)
+
+
+ChecklistItems = Tuple[Tuple[str, str], ...]
+IntelligenceTexts = Mapping[str, str]
+
+
+def verdict_key(verdict_label: str) -> str:
+    """Template key of a verdict label ("❌ False" -> "false")"""
+    return "_".join(_VERDICT_WORD.findall(verdict_label.lower())) if verdict_label else ""
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Translation over English, section by section and key by key"""
+    merged = dict(base)
+    for key, value in override.items():
+        if key.startswith("_"):
+            continue
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            merged[key] = _merge(base[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class TemplateSet:
+    """The compiled templates of one language"""
+
+    def __init__(self, language: str, data: Dict[str, Any]):
+        self.language = language
+        self.explanations = {key: Explanation(spec) for key, spec in data["explanation"].items()}
+        quick = data["quick_analysis"]
+        self.quick_layout = Template(quick["layout"])
+        self.quick_pattern = {key: Template(text) for key, text in quick["pattern"].items()}
+        self.quick_evidence = {key: Template(text) for key, text in quick["evidence"].items()}
+        self.quick_consensus = {key: Template(text) for key, text in quick["consensus"].items()}
+        checklist = data["checklist"]
+        self.checklist_base: ChecklistItems = tuple((item["point"], item["explanation"]) for item in checklist["base"])
+        self.checklists: Dict[str, ChecklistItems] = {
+            key: tuple((item["point"], item["explanation"]) for item in items)
+            for key, items in checklist.items() if key != "base"
+        }
+        self.intelligence: Dict[str, IntelligenceTexts] = {
+            key: MappingProxyType(dict(texts)) for key, texts in data["intelligence"].items()
+        }
+        self._resolved: Dict[Tuple[str, str, str], str] = {}
+
+    def key(self, section: Mapping[str, Any], name: str, claim_type: str, verdict: str) -> str:
+        """Most specific key of a section for this claim type and verdict (memoized)"""
+        memo_key = (name, claim_type, verdict)
+        found = self._resolved.get(memo_key)
+        if found is None:
+            candidates = (f"{claim_type}/{verdict}", claim_type, f"{FALLBACK_CLAIM_TYPE}/{verdict}", FALLBACK_CLAIM_TYPE)
+            found = next(c for c in candidates if c in section)
+            self._resolved[memo_key] = found
+        return found
+
+
+class TemplateRegistry:
+    """Compiled template sets by language"""
+
+    def __init__(self, sets: Dict[str, TemplateSet]):
+        self._sets = sets
+
+    @classmethod
+    def from_directory(cls, directory: str) -> "TemplateRegistry":
+        raw: Dict[str, Dict[str, Any]] = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                    raw[name[:-len(".json")].lower()] = json.load(f)
+        base = raw[DEFAULT_LANGUAGE]
+        sets = {
+            language: TemplateSet(language, base if language == DEFAULT_LANGUAGE else _merge(base, data))
+            for language, data in raw.items()
+        }
+        return cls(sets)
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(self._sets)
+
+    def for_language(self, language: Optional[str]) -> TemplateSet:
+        """Templates for "hi-IN", falling back to "hi", then English"""
+        language = (language or DEFAULT_LANGUAGE).lower().replace("_", "-")
+        return self._sets.get(language) or self._sets.get(language.split("-")[0]) or self._sets[DEFAULT_LANGUAGE]
+
+    def explanation(self, claim_type: str, verdict_label: str = "", language: str = DEFAULT_LANGUAGE,
+                    fact_checks: int = 0, sources: int = 0) -> str:
+        """
+        Render the long-form explanation.
+
+        Args:
+            claim_type (str): Detected claim type
+            verdict_label (str): Verdict label (e.g. "❌ False")
+            language (str): Output language
+            fact_checks (int): Number of fact-check reports found
+            sources (int): Number of search results found
+
+        Returns:
+            str: Explanation text
+        """
+        templates = self.for_language(language)
+        key = templates.key(templates.explanations, "explanation", claim_type, verdict_key(verdict_label))
+        return templates.explanations[key].render({"fact_checks": fact_checks, "sources": sources})
+
+    def quick_analysis(self, claim_type: str, verdict_label: str = "", language: str = DEFAULT_LANGUAGE,
+                       fact_checks: int = 0, sources: int = 0) -> str:
+        """Render the pattern / evidence / consensus bullets"""
+        templates = self.for_language(language)
+        verdict = verdict_key(verdict_label)
+        if fact_checks and sources:
+            evidence = "both"
+        elif fact_checks:
+            evidence = "fact_checks_only"
+        elif sources:
+            evidence = "sources_only"
+        else:
+            evidence = "none"
+        counts = {"fact_checks": fact_checks, "sources": sources}
+        pattern = templates.quick_pattern[templates.key(templates.quick_pattern, "pattern", claim_type, verdict)]
+        consensus = templates.quick_consensus[templates.key(templates.quick_consensus, "consensus", claim_type, verdict)]
+        return templates.quick_layout.render({
+            "pattern": pattern.render(counts),
+            "evidence": templates.quick_evidence[evidence].render(counts),
+            "consensus": consensus.render(counts),
+        })
+
+    def checklist(self, claim_type: str, verdict_label: str = "", language: str = DEFAULT_LANGUAGE) -> Tuple[ChecklistItems, ChecklistItems]:
+        """Shared (base items, claim-specific items) as (point, explanation) pairs"""
+        templates = self.for_language(language)
+        key = templates.key(templates.checklists, "checklist", claim_type, verdict_key(verdict_label))
+        return templates.checklist_base, templates.checklists[key]
+
+    def intelligence(self, claim_type: str, verdict_label: str = "", language: str = DEFAULT_LANGUAGE) -> IntelligenceTexts:
+        """Shared intelligence texts by perspective (psychological, scientific, ...)"""
+        templates = self.for_language(language)
+        return templates.intelligence[templates.key(templates.intelligence, "intelligence", claim_type, verdict_key(verdict_label))]
+
+
+def _load_registry() -> TemplateRegistry:
+    directory = os.getenv("RESULT_TEMPLATES_DIR", DEFAULT_TEMPLATES_DIR)
+    registry = TemplateRegistry.from_directory(directory)
+    logger.info(f"Result templates loaded: {', '.join(registry.languages)}")
+    return registry
+
+
+# Global registry compiled from the template files
+result_templates = _load_registry()
@@ -5,18 +5,23 @@ import aiohttp
 import logging
 from typing import Optional, Dict, Any, List
 
+from app.services.endpoints import endpoints
+
 logger = logging.getLogger(__name__)
 
 # Environment configuration (CORRECTED)
 TRANSLATION_API_KEY = os.getenv("TRANSLATION_API_KEY")  # Matches your .env
-TRANSLATION_API_URL = "https://translation.googleapis.com/language/translate/v2"
 
 class TranslationService:
     """Google Cloud Translation API wrapper service"""
     
     def __init__(self):
         self.api_key = TRANSLATION_API_KEY
-        self.base_url = TRANSLATION_API_URL
+        
+    @property
+    def base_url(self) -> str:
+        """Translation API base URL (resolved per call so overrides apply)"""
+        return endpoints.url("translation")
         
     def _get_headers(self) -> Dict[str, str]:
         """Get common headers for all API requests"""
@@ -52,24 +57,24 @@ class TranslationService:
             
             headers = self._get_headers()
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        detections = data.get("data", {}).get("detections", [])
+            session = endpoints.session("translation")
+            async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    detections = data.get("data", {}).get("detections", [])
+                    
+                    if detections and isinstance(detections[0], list) and detections[0]:
+                        detected_lang = detections[0][0].get("language", "en")
+                        confidence = detections[0][0].get("confidence", 0.0)
                         
-                        if detections and isinstance(detections[0], list) and detections[0]:
-                            detected_lang = detections[0][0].get("language", "en")
-                            confidence = detections[0][0].get("confidence", 0.0)
-                            
-                            logger.info(f"Detected language: {detected_lang} (confidence: {confidence})")
-                            return detected_lang
-                            
-                    else:
-                        logger.error(f"Language detection failed: HTTP {response.status}")
-                        error_data = await response.text()
-                        logger.error(f"Error details: {error_data}")
+                        logger.info(f"Detected language: {detected_lang} (confidence: {confidence})")
+                        return detected_lang
                         
+                else:
+                    logger.error(f"Language detection failed: HTTP {response.status}")
+                    error_data = await response.text()
+                    logger.error(f"Error details: {error_data}")
+                    
         except Exception as e:
             logger.error(f"Language detection error: {str(e)}")
             
@@ -113,24 +118,24 @@ class TranslationService:
             
             headers = self._get_headers()
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        translations = data.get("data", {}).get("translations", [])
+            session = endpoints.session("translation")
+            async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    translations = data.get("data", {}).get("translations", [])
+                    
+                    if translations:
+                        translated_text = translations[0].get("translatedText", text)
+                        detected_source = translations[0].get("detectedSourceLanguage")
                         
-                        if translations:
-                            translated_text = translations[0].get("translatedText", text)
-                            detected_source = translations[0].get("detectedSourceLanguage")
-                            
-                            logger.info(f"Translation successful: {detected_source or source_language} -> {target_language}")
-                            return translated_text
-                            
-                    else:
-                        logger.error(f"Translation failed: HTTP {response.status}")
-                        error_data = await response.text()
-                        logger.error(f"Error details: {error_data}")
+                        logger.info(f"Translation successful: {detected_source or source_language} -> {target_language}")
+                        return translated_text
                         
+                else:
+                    logger.error(f"Translation failed: HTTP {response.status}")
+                    error_data = await response.text()
+                    logger.error(f"Error details: {error_data}")
+                    
         except Exception as e:
             logger.error(f"Translation error: {str(e)}")
             
@@ -175,21 +180,21 @@ class TranslationService:
             
             headers = self._get_headers()
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        translations = data.get("data", {}).get("translations", [])
-                        
-                        translated_texts = [t.get("translatedText", texts[i]) for i, t in enumerate(translations)]
-                        logger.info(f"Batch translation successful: {len(translated_texts)} texts translated")
-                        return translated_texts
-                        
-                    else:
-                        logger.error(f"Batch translation failed: HTTP {response.status}")
-                        error_data = await response.text()
-                        logger.error(f"Error details: {error_data}")
-                        
+            session = endpoints.session("translation")
+            async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    translations = data.get("data", {}).get("translations", [])
+                    
+                    translated_texts = [t.get("translatedText", texts[i]) for i, t in enumerate(translations)]
+                    logger.info(f"Batch translation successful: {len(translated_texts)} texts translated")
+                    return translated_texts
+                    
+                else:
+                    logger.error(f"Batch translation failed: HTTP {response.status}")
+                    error_data = await response.text()
+                    logger.error(f"Error details: {error_data}")
+                    
         except Exception as e:
             logger.error(f"Batch translation error: {str(e)}")
             
@@ -212,15 +217,15 @@ class TranslationService:
             params = {"target": "en"}
             headers = self._get_headers()
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"Get languages failed: HTTP {response.status}")
-                        error_data = await response.text()
-                        logger.error(f"Error details: {error_data}")
-                        
+            session = endpoints.session("translation")
+            async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    logger.error(f"Get languages failed: HTTP {response.status}")
+                    error_data = await response.text()
+                    logger.error(f"Error details: {error_data}")
+                    
         except Exception as e:
             logger.error(f"Failed to get supported languages: {str(e)}")
             
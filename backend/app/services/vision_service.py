@@ -7,18 +7,24 @@ import logging
 from typing import Optional, Dict, Any, List, Tuple
 from io import BytesIO
 
+from app.services.endpoints import endpoints
+from app.services.resilience import upstreams
+
 logger = logging.getLogger(__name__)
 
 # Environment configuration
 VISION_API_KEY = os.getenv("VISION_API_KEY") or os.getenv("GOOGLE_VISION_API_KEY")
-VISION_API_URL = "https://vision.googleapis.com/v1/images:annotate"
 
 class VisionService:
     """Google Cloud Vision API wrapper service"""
     
     def __init__(self):
         self.api_key = VISION_API_KEY
-        self.base_url = VISION_API_URL
+        
+    @property
+    def base_url(self) -> str:
+        """Vision annotate URL (resolved per call so overrides apply)"""
+        return endpoints.url("vision")
         
     async def detect_text(self, image_base64: str, max_results: int = 50) -> Dict[str, Any]:
         """
@@ -56,8 +62,10 @@ class VisionService:
             
             url = f"{self.base_url}?key={self.api_key}"
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.post(url, json=request_payload) as response:
+            session = endpoints.session("vision")
+            async with upstreams.call("vision") as call:
+                async with session.post(url, json=request_payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    call.status(response.status)
                     if response.status == 200:
                         data = await response.json()
                         return self._process_text_detection_response(data)
@@ -65,7 +73,7 @@ class VisionService:
                         error_text = await response.text()
                         logger.error(f"Vision API error: HTTP {response.status} - {error_text}")
                         return {"texts": [], "full_text": "", "error": f"HTTP {response.status}"}
-                        
+                    
         except Exception as e:
             logger.error(f"Text detection error: {str(e)}")
             return {"texts": [], "full_text": "", "error": str(e)}
@@ -102,8 +110,10 @@ class VisionService:
             
             url = f"{self.base_url}?key={self.api_key}"
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20)) as session:
-                async with session.post(url, json=request_payload) as response:
+            session = endpoints.session("vision")
+            async with upstreams.call("vision") as call:
+                async with session.post(url, json=request_payload, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                    call.status(response.status)
                     if response.status == 200:
                         data = await response.json()
                         return self._process_label_detection_response(data)
@@ -111,7 +121,7 @@ class VisionService:
                         error_text = await response.text()
                         logger.error(f"Label detection error: HTTP {response.status} - {error_text}")
                         return {"labels": [], "error": f"HTTP {response.status}"}
-                        
+                    
         except Exception as e:
             logger.error(f"Label detection error: {str(e)}")
             return {"labels": [], "error": str(e)}
@@ -147,8 +157,10 @@ class VisionService:
             
             url = f"{self.base_url}?key={self.api_key}"
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
-                async with session.post(url, json=request_payload) as response:
+            session = endpoints.session("vision")
+            async with upstreams.call("vision") as call:
+                async with session.post(url, json=request_payload, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    call.status(response.status)
                     if response.status == 200:
                         data = await response.json()
                         return self._process_safe_search_response(data)
@@ -156,7 +168,7 @@ class VisionService:
                         error_text = await response.text()
                         logger.error(f"Safe search error: HTTP {response.status} - {error_text}")
                         return {"safe_search": {}, "error": f"HTTP {response.status}"}
-                        
+                    
         except Exception as e:
             logger.error(f"Safe search error: {str(e)}")
             return {"safe_search": {}, "error": str(e)}
@@ -191,8 +203,10 @@ class VisionService:
             
             url = f"{self.base_url}?key={self.api_key}"
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.post(url, json=request_payload) as response:
+            session = endpoints.session("vision")
+            async with upstreams.call("vision") as call:
+                async with session.post(url, json=request_payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    call.status(response.status)
                     if response.status == 200:
                         data = await response.json()
                         return self._process_comprehensive_response(data)
@@ -200,7 +214,7 @@ class VisionService:
                         error_text = await response.text()
                         logger.error(f"Comprehensive analysis error: HTTP {response.status} - {error_text}")
                         return {"error": f"HTTP {response.status}"}
-                        
+                    
         except Exception as e:
             logger.error(f"Comprehensive analysis error: {str(e)}")
             return {"error": str(e)}
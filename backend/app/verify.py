@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi.responses import StreamingResponse, JSONResponse
 from typing import Optional
+from datetime import datetime
 import base64
 import uuid
 import json
@@ -10,7 +11,8 @@ import re
 from pydantic import BaseModel
 from app.models import Result  # ✅ FIXED: Using Result instead of AnalysisResponse
 from app.services.analysis_engine import run_analysis  # ✅ FIXED: Direct import from analysis_engine
-from app.database import storage
+from app.database import storage, analysis_record, ArchiveFilters, ArchiveKey
+from app.services.jobs import job_workers, DONE, FAILED
 
 router = APIRouter()
 
@@ -20,13 +22,7 @@ class VerifyRequest(BaseModel):
     language: Optional[str] = "en"
     user_id: Optional[str] = None
 
-@router.post("/verify", response_model=Result)  # ✅ FIXED: Using Result response model
-async def verify_content(request: VerifyRequest):
-    content_type = request.content_type
-    content = request.content
-    language = request.language
-    user_id = request.user_id
-
+def validate_request(content_type: str, content: str) -> None:
     if content_type not in {"text", "url", "image"}:
         raise HTTPException(status_code=400, detail="Invalid content_type.")
 
@@ -38,23 +34,21 @@ async def verify_content(request: VerifyRequest):
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid base64 image data")
 
+@router.post("/verify", response_model=Result)  # ✅ FIXED: Using Result response model
+async def verify_content(request: VerifyRequest):
+    content_type = request.content_type
+    content = request.content
+    language = request.language
+    user_id = request.user_id
+
+    validate_request(content_type, content)
+
     try:
         # ✅ FIXED: Call real analysis_engine instead of mock services
         result = await run_analysis(content_type, content, language)
         
         # ✅ FIXED: Store Result object directly (no transformation needed)
-        storage.save_analysis(result.id, {
-            "analysis_id": result.id,
-            "content_type": content_type,
-            "content": "[IMAGE]" if content_type == "image" else content[:500],
-            "language": language,
-            "user_id": user_id,
-            "verdict": result.verdict.label,
-            "confidence_score": result.verdict.confidence,
-            "summary": result.verdict.summary,
-            "processing_time": result.audit.get("processing_time", "0s"),
-            "result": result.dict()  # Store complete Result object
-        })
+        storage.save_analysis(result.id, analysis_record(result, content_type, content, language, user_id))
         
         return result  # ✅ FIXED: Return Result object directly
         
@@ -75,16 +69,31 @@ async def verify_content_stream(request: Request):
     content_type = body.get("content_type", "text")  # ✅ ADDED: content_type support
 
     async def event_stream():
+        events: asyncio.Queue = asyncio.Queue()
+        analysis = None
         try:
             yield f"data: {json.dumps({'type':'message','content':'🚀 Starting analysis...'})}\n\n"
-            await asyncio.sleep(1)
-            
             yield f"data: {json.dumps({'type':'message','content':'🧠 Analyzing content...'})}\n\n"
             
-            # ✅ FIXED: Use real analysis_engine
-            result = await run_analysis(content_type, content, language)
+            # Forward pipeline stage events as they happen
+            analysis = asyncio.create_task(run_analysis(
+                content_type, content, language,
+                on_event=lambda stage, data: events.put_nowait((stage, data))
+            ))
+            while True:
+                getter = asyncio.create_task(events.get())
+                done, _ = await asyncio.wait({getter, analysis}, return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    stage, data = getter.result()
+                    yield f"data: {json.dumps({'type':'stage','stage':stage,**data}, default=str)}\n\n"
+                    continue
+                getter.cancel()
+                break
+            while not events.empty():
+                stage, data = events.get_nowait()
+                yield f"data: {json.dumps({'type':'stage','stage':stage,**data}, default=str)}\n\n"
             
-            await asyncio.sleep(0.5)
+            result = analysis.result()
 
             # ✅ FIXED: Extract data from Result object structure
             sections = [
@@ -96,7 +105,6 @@ async def verify_content_stream(request: Request):
 
             for key, title in sections:
                 yield f"data: {json.dumps({'type':'section_start','section':key,'title':title})}\n\n"
-                await asyncio.sleep(0.5)
                 
                 if key == "verdict":
                     yield f"data: {json.dumps({'type':'line','section':key,'content':f'Confidence: {result.verdict.confidence}%'})}\n\n"
@@ -105,24 +113,24 @@ async def verify_content_stream(request: Request):
                     lines = split_lines(result.quick_analysis)
                     for line in lines:
                         yield f"data: {json.dumps({'type':'line','section':key,'content':line})}\n\n"
-                        await asyncio.sleep(0.15)
                 elif key == "evidence":
                     for evidence in result.evidence[:3]:  # Show top 3 evidence
                         yield f"data: {json.dumps({'type':'line','section':key,'content':f'{evidence.source}: {evidence.snippet[:100]}...'})}\n\n"
-                        await asyncio.sleep(0.15)
                 elif key == "checklist":
                     for item in result.checklist[:3]:  # Show top 3 checklist items
                         yield f"data: {json.dumps({'type':'line','section':key,'content':f'✓ {item.point}'})}\n\n"
-                        await asyncio.sleep(0.15)
                 
                 yield f"data: {json.dumps({'type':'section_end','section':key})}\n\n"
-                await asyncio.sleep(1)
 
             yield f"data: {json.dumps({'type':'complete','content':'✅ Analysis complete!'})}\n\n"
             
         except Exception as e:
             print(f"🚨 Streaming error: {e}")
             yield f"data: {json.dumps({'type':'error','content':str(e)})}\n\n"
+        finally:
+            # Client went away: stop waiting (shared analysis work keeps running)
+            if analysis is not None and not analysis.done():
+                analysis.cancel()
 
     return StreamingResponse(
         event_stream(),
@@ -134,6 +142,44 @@ async def verify_content_stream(request: Request):
         }
     )
 
+@router.post("/jobs", status_code=202)
+async def submit_job(request: VerifyRequest):
+    """
+    Queue an analysis and return its job id immediately.
+
+    Poll `GET /jobs/{job_id}` for status and fetch the analysis from
+    `GET /jobs/{job_id}/result` once it is done.
+    """
+    validate_request(request.content_type, request.content)
+    job = await job_workers.submit(request.content_type, request.content, request.language, request.user_id)
+    return {
+        **job.public(),
+        "status_url": f"/api/v1/jobs/{job.id}",
+        "result_url": f"/api/v1/jobs/{job.id}/result"
+    }
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    job = job_workers.queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.public()
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    job = job_workers.queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=job.error or "Job failed")
+    if job.status != DONE:
+        # Not ready yet: 202 with the current status so clients keep polling
+        return JSONResponse(status_code=202, content=job.public())
+    res = storage.get_analysis(job.analysis_id)
+    if not res:
+        raise HTTPException(status_code=404, detail="Result not found")
+    return res
+
 @router.get("/results/{analysis_id}")
 async def get_analysis_results(analysis_id: str):
     res = storage.get_analysis(analysis_id)
@@ -141,9 +187,55 @@ async def get_analysis_results(analysis_id: str):
         raise HTTPException(status_code=404, detail="Not found")
     return res
 
+def encode_cursor(key: ArchiveKey) -> str:
+    raw = json.dumps([key[0], key[1]], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> ArchiveKey:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, analysis_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return str(timestamp), str(analysis_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
 @router.get("/archive")
-async def get_archive(limit: int = 20, user_id: Optional[str] = None):
-    entries = storage.get_all_analyses(limit)
-    if user_id:
-        entries = [e for e in entries if e.get("user_id") == user_id]
-    return {"analyses": entries, "total": len(entries)}
+async def get_archive(
+    limit: int = Query(20, ge=1, le=500),
+    user_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    verdict: Optional[str] = None,
+    content_type: Optional[str] = None,
+    language: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+):
+    """
+    Newest-first analysis history with keyset pagination.
+
+    Pass the returned `next_cursor` as `cursor` to fetch the next page;
+    `next_cursor` is null on the last page.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    filters = ArchiveFilters(
+        user_id=user_id,
+        verdict=verdict,
+        content_type=content_type,
+        language=language,
+        since=since.isoformat() if since else None,
+        until=until.isoformat() if until else None,
+        min_confidence=min_confidence,
+        max_confidence=max_confidence,
+    )
+    entries, next_key = storage.page_analyses(limit=limit, after=after, filters=filters)
+    return {
+        "analyses": entries,
+        "total": len(entries),
+        "next_cursor": encode_cursor(next_key) if next_key else None
+    }
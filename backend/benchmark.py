@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# benchmark.py - Offline load benchmark with local stub APIs
+"""
+Benchmarks the analysis endpoints without touching real Google APIs.
+
+Starts one local stub HTTP server per external API (Translation, Fact Check
+Tools, Custom Search, Wikipedia REST, Gemini generateContent, Vision
+annotate, Safe Browsing), each with its own latency distribution and error
+rate, points the engine's *_API_URL settings at them and drives the FastAPI
+app in-process at several concurrency levels.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --concurrency 1 8 32 --requests 200
+    python benchmark.py --latency factcheck=250 --error-rate gemini=0.05
+    python benchmark.py --endpoints verify stream --keep-caches
+    python benchmark.py --stubs-only    # print stub env vars and keep stubs running
+
+Latencies are log-normal: --latency sets the median in ms, --jitter the
+sigma (0 = constant). Analysis and evidence caches are disabled unless
+--keep-caches is given, and every request sends distinct content so
+coalescing does not hide pipeline latency.
+
+Time-to-first-stage-event for /verify-stream is only reported with
+--base-url: httpx's in-process ASGI transport buffers streamed bodies.
+"""
+
+import os
+import sys
+import json
+import time
+import math
+import random
+import asyncio
+import argparse
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+# Median latency (ms) and error rate per stub, roughly matching production
+DEFAULT_STUBS: Dict[str, Dict[str, float]] = {
+    "translation": {"latency_ms": 60, "error_rate": 0.0},
+    "factcheck": {"latency_ms": 180, "error_rate": 0.0},
+    "custom_search": {"latency_ms": 250, "error_rate": 0.0},
+    "wikipedia": {"latency_ms": 90, "error_rate": 0.0},
+    "gemini": {"latency_ms": 900, "error_rate": 0.0},
+    "vision": {"latency_ms": 400, "error_rate": 0.0},
+    "safe_browsing": {"latency_ms": 50, "error_rate": 0.0},
+}
+
+# Environment variable each stub's base URL is exported under
+STUB_ENV = {
+    "translation": "TRANSLATION_API_URL",
+    "factcheck": "FACTCHECK_API_URL",
+    "custom_search": "CUSTOM_SEARCH_API_URL",
+    "wikipedia": "WIKIPEDIA_API_URL",
+    "gemini": "GEMINI_API_URL",
+    "vision": "VISION_API_URL",
+    "safe_browsing": "SAFE_BROWSING_API_URL",
+}
+
+# Dummy keys so every client is "configured" and actually calls its stub
+STUB_KEYS = {
+    "TRANSLATION_API_KEY": "bench",
+    "FACT_CHECK_API_KEY": "bench",
+    "CUSTOM_SEARCH_API_KEY": "bench",
+    "CUSTOM_SEARCH_CX": "bench",
+    "GENAI_API_KEY": "bench",
+    "VISION_API_KEY": "bench",
+    "SAFE_BROWSING_API_KEY": "bench",
+}
+
+ENDPOINTS = ("analyze", "verify", "batch", "stream")
+
+
+# ---------------------------
+# Stub servers
+# ---------------------------
+def stub_payload(api: str, request: web.Request) -> Dict[str, Any]:
+    """Canned, structurally valid response for each API"""
+    if api == "translation":
+        if request.path.endswith("/detect"):
+            return {"data": {"detections": [[{"language": "en", "confidence": 0.98}]]}}
+        return {"data": {"translations": [{"translatedText": "translated text"}]}}
+    if api == "factcheck":
+        return {"claims": [
+            {
+                "text": "Example claim",
+                "claimReview": [{
+                    "publisher": {"name": "Reuters", "site": "reuters.com"},
+                    "url": "https://www.reuters.com/fact-check/example",
+                    "title": "Fact check: example",
+                    "textualRating": "False",
+                }],
+            }
+            for _ in range(3)
+        ]}
+    if api == "custom_search":
+        return {"items": [
+            {"title": f"Result {i}", "link": f"https://www.who.int/example/{i}", "snippet": "Example snippet " * 8}
+            for i in range(5)
+        ]}
+    if api == "wikipedia":
+        return {
+            "title": "Example",
+            "extract": "Example article extract. " * 10,
+            "content_urls": {"desktop": {"page": "https://en.wikipedia.org/wiki/Example"}},
+        }
+    if api == "gemini":
+        text = json.dumps({"verdict_label": "⚠️ Caution", "confidence": 70, "summary": "stub"})
+        return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    if api == "vision":
+        return {"responses": [{"textAnnotations": [], "labelAnnotations": [], "safeSearchAnnotation": {}}]}
+    return {}
+
+
+class StubServer:
+    """One stub API on its own port with a log-normal latency and an error rate"""
+
+    def __init__(self, api: str, latency_ms: float, error_rate: float, jitter: float, seed: int):
+        self.api = api
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.port: Optional[int] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def _delay(self) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return self.latency_ms / 1000
+        return self.random.lognormvariate(math.log(self.latency_ms), self.jitter) / 1000
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self._delay())
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"error": {"code": 503, "message": "stub error"}}, status=503)
+        return web.json_response(stub_payload(self.api, request))
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+
+class StubCluster:
+    """Runs all stub servers on a dedicated event loop thread"""
+
+    def __init__(self, profiles: Dict[str, Dict[str, float]], jitter: float, seed: int):
+        self.servers = [
+            StubServer(api, p["latency_ms"], p["error_rate"], jitter, seed + i)
+            for i, (api, p) in enumerate(profiles.items())
+        ]
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self) -> Dict[str, str]:
+        self._thread.start()
+        for server in self.servers:
+            asyncio.run_coroutine_threadsafe(server.start(), self._loop).result()
+        return {STUB_ENV[s.api]: s.url for s in self.servers}
+
+    def stop(self) -> None:
+        for server in self.servers:
+            asyncio.run_coroutine_threadsafe(server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {s.api: {"requests": s.requests, "errors": s.errors} for s in self.servers}
+
+
+# ---------------------------
+# Load generation
+# ---------------------------
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def one_request(client, endpoint: str, n: int, batch_size: int, measure_first_event: bool = False) -> Tuple[bool, Optional[float]]:
+    """Send one request; returns (ok, time_to_first_event) - the latter only for streams"""
+    content = f"Benchmark claim {n}: scientists say {random.random():.6f} vaccines contain microchips"
+    if endpoint == "analyze":
+        r = await client.post("/api/v1/analyze", json={"content_type": "text", "content": content})
+        return r.status_code == 200, None
+    if endpoint == "verify":
+        r = await client.post("/api/v1/verify", json={"content_type": "text", "content": content})
+        return r.status_code == 200, None
+    if endpoint == "batch":
+        items = [{"content": f"{content} (item {i})"} for i in range(batch_size)]
+        r = await client.post("/api/v1/analyze-batch/text", json=items)
+        return r.status_code == 200 and all(x["success"] for x in r.json()["results"]), None
+
+    started = time.perf_counter()
+    first_event = None
+    ok = False
+    async with client.stream("POST", "/api/v1/verify-stream", json={"content": content}) as r:
+        async for line in r.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            message = json.loads(line[5:])
+            if first_event is None and message.get("type") == "stage" and measure_first_event:
+                first_event = time.perf_counter() - started
+            if message.get("type") == "complete":
+                ok = True
+            elif message.get("type") == "error":
+                ok = False
+    return ok, first_event
+
+
+async def run_level(client, endpoint: str, concurrency: int, total: int, batch_size: int, streaming: bool = False) -> Dict[str, Any]:
+    latencies: List[float] = []
+    first_events: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for n in counter:
+            started = time.perf_counter()
+            try:
+                ok, first_event = await one_request(client, endpoint, n, batch_size, streaming)
+            except Exception:
+                ok, first_event = False, None
+            latencies.append(time.perf_counter() - started)
+            if first_event is not None:
+                first_events.append(first_event)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    row = {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+    if first_events:
+        row["first_event_p50_ms"] = round(percentile(first_events, 50) * 1000, 1)
+        row["first_event_p99_ms"] = round(percentile(first_events, 99) * 1000, 1)
+    return row
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    columns = ["endpoint", "concurrency", "requests", "errors", "throughput_rps", "p50_ms", "p95_ms", "p99_ms",
+               "first_event_p50_ms", "first_event_p99_ms"]
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+
+async def run_benchmark(args, stub_env: Dict[str, str]) -> List[Dict[str, Any]]:
+    import httpx
+
+    if args.base_url:
+        transport, base_url, app = None, args.base_url, None
+    else:
+        # Imported only now so the engine reads the stub URLs from the environment
+        from app.main import app
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    rows = []
+    timeout = httpx.Timeout(60.0)
+    limits = httpx.Limits(max_connections=max(args.concurrency) * 2)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=timeout, limits=limits) as client:
+        lifespan = app.router.lifespan_context(app) if app is not None else None
+        if lifespan is not None:
+            await lifespan.__aenter__()
+        try:
+            for endpoint in args.endpoints:
+                # Warm-up: opens pooled connections to the stubs
+                await run_level(client, endpoint, 1, 2, args.batch_size)
+                for concurrency in args.concurrency:
+                    total = max(args.requests, concurrency)
+                    row = await run_level(client, endpoint, concurrency, total, args.batch_size, bool(args.base_url))
+                    rows.append(row)
+                    print(f"  {endpoint:8s} c={concurrency:<4d} p50={row['p50_ms']}ms p99={row['p99_ms']}ms "
+                          f"rps={row['throughput_rps']} errors={row['errors']}")
+        finally:
+            if lifespan is not None:
+                await lifespan.__aexit__(None, None, None)
+    return rows
+
+
+def parse_overrides(values: List[str], cast=float) -> Dict[str, float]:
+    overrides = {}
+    for value in values or []:
+        name, _, number = value.partition("=")
+        if name not in DEFAULT_STUBS:
+            raise SystemExit(f"Unknown stub '{name}' (choose from {', '.join(DEFAULT_STUBS)})")
+        overrides[name] = cast(number)
+    return overrides
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline CrediScope load benchmark against local stub APIs")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=100, help="Requests per concurrency level")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument("--batch-size", type=int, default=8, help="Items per batch request")
+    parser.add_argument("--latency", action="append", metavar="API=MS", help="Median stub latency override")
+    parser.add_argument("--error-rate", action="append", metavar="API=RATE", help="Stub error rate override (0-1)")
+    parser.add_argument("--jitter", type=float, default=0.35, help="Log-normal sigma of stub latency")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep-caches", action="store_true", help="Leave analysis/evidence caches enabled")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    parser.add_argument("--stubs-only", action="store_true", help="Only run the stubs and print their env vars")
+    args = parser.parse_args()
+
+    profiles = {api: dict(p) for api, p in DEFAULT_STUBS.items()}
+    for api, ms in parse_overrides(args.latency).items():
+        profiles[api]["latency_ms"] = ms
+    for api, rate in parse_overrides(args.error_rate).items():
+        profiles[api]["error_rate"] = rate
+
+    random.seed(args.seed)
+    cluster = StubCluster(profiles, args.jitter, args.seed)
+    stub_env = cluster.start()
+
+    if args.stubs_only:
+        for name, value in {**stub_env, **STUB_KEYS}.items():
+            print(f"export {name}={value}")
+        print("# stubs running - Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            cluster.stop()
+            return 0
+
+    os.environ.update(stub_env)
+    os.environ.update(STUB_KEYS)
+    if not args.keep_caches:
+        os.environ["ANALYSIS_CACHE_ENABLED"] = "false"
+        os.environ["EVIDENCE_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("JOB_QUEUE_BACKEND", "memory")
+
+    if args.json_path:
+        args.json_path = os.path.abspath(args.json_path)
+
+    # Keep benchmark analyses out of the real storage directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    workdir = tempfile.mkdtemp(prefix="crediscope-bench-")
+    os.chdir(workdir)
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    summary = ", ".join(f"{api}={p['latency_ms']:g}ms" for api, p in profiles.items())
+    print(f"🧪 Stub APIs: {summary}")
+    print(f"📁 Storage: {workdir}")
+    try:
+        rows = asyncio.run(run_benchmark(args, stub_env))
+    finally:
+        cluster.stop()
+
+    print()
+    print_table(rows)
+    print()
+    print(f"Stub traffic: {json.dumps(cluster.stats())}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"stubs": profiles, "results": rows, "stub_traffic": cluster.stats()}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any, List
 
+from app.services.endpoints import endpoints
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -64,7 +66,7 @@ async def real_gemini_analysis(text: str) -> Dict[str, Any]:
     if not GENAI_API_KEY:
         raise Exception("No Gemini API key")
     
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GENAI_API_KEY}"
+    url = endpoints.url("gemini", f"/models/gemini-pro:generateContent?key={GENAI_API_KEY}")
     
     prompt = f"""Analyze this claim for misinformation. Return ONLY valid JSON:
 {{
@@ -84,35 +86,35 @@ Return ONLY JSON:"""
     }
     
     timeout = aiohttp.ClientTimeout(total=8)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, json=payload) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                content = data["candidates"][0]["content"]["parts"][0]["text"]
-                
-                # Extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
+    session = endpoints.session("gemini")
+    async with session.post(url, json=payload, timeout=timeout) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            content = data["candidates"][0]["content"]["parts"][0]["text"]
             
-            raise Exception("Gemini API failed")
+            # Extract JSON from response
+            import re
+            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            if json_match:
+                return json.loads(json_match.group())
+        
+        raise Exception("Gemini API failed")
 
 async def real_factcheck_search(text: str) -> List[Dict]:
     """Real Google Fact Check API"""
     if not FACTCHECK_API_KEY:
         return []
     
-    url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+    url = endpoints.url("factcheck", "/claims:search")
     params = {"key": FACTCHECK_API_KEY, "query": text, "pageSize": 3}
     
     try:
         timeout = aiohttp.ClientTimeout(total=5)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data.get("claims", [])
+        session = endpoints.session("factcheck")
+        async with session.get(url, params=params, timeout=timeout) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                return data.get("claims", [])
     except Exception as e:
         logger.warning(f"Fact check failed: {e}")
     return []
@@ -122,7 +124,7 @@ async def real_custom_search(text: str) -> List[Dict]:
     if not (CUSTOM_SEARCH_API_KEY and CUSTOM_SEARCH_CX):
         return []
     
-    url = "https://www.googleapis.com/customsearch/v1"
+    url = endpoints.url("custom_search")
     params = {
         "key": CUSTOM_SEARCH_API_KEY,
         "cx": CUSTOM_SEARCH_CX,
@@ -132,11 +134,11 @@ async def real_custom_search(text: str) -> List[Dict]:
     
     try:
         timeout = aiohttp.ClientTimeout(total=5)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data.get("items", [])
+        session = endpoints.session("custom_search")
+        async with session.get(url, params=params, timeout=timeout) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                return data.get("items", [])
     except Exception as e:
         logger.warning(f"Custom search failed: {e}")
     return []
@@ -0,0 +1,39 @@
+# backend/tests/conftest.py
+"""Shared test setup: import path, isolated globals and a local HTTP server."""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing app.services.jobs builds the global queue; keep it off storage/jobs.db
+os.environ.setdefault("JOB_QUEUE_BACKEND", "memory")
+
+
+@asynccontextmanager
+async def _serve(routes):
+    """Run an aiohttp app on a free local port; yields its base URL"""
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        from app.services.http_client import http_clients
+        await http_clients.close()
+        await runner.cleanup()
+
+
+@pytest.fixture
+def local_server():
+    """`async with local_server({"/path": handler}) as base_url:` inside asyncio.run()"""
+    return _serve
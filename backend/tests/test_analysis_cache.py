@@ -0,0 +1,140 @@
+# backend/tests/test_analysis_cache.py
+"""Analysis memo: fingerprint equivalence, TTL, the LRU bound and the kill switch."""
+
+import asyncio
+import base64
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from app.models import Result, Verdict, IntelligenceReport
+from app.services import analysis_engine
+from app.services.cache import ResultMemo
+from app.services.fingerprint import content_fingerprint, normalize_text
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _result(text, status=None):
+    audit = {"analysis_time": "2024-01-01T00:00:00"}
+    if status:
+        audit["status"] = status
+    return Result(
+        input=text, domain="General",
+        verdict=Verdict(label="⚠️ Caution", confidence=50, summary="stub"),
+        quick_analysis="stub", evidence=[], checklist=[],
+        intelligence=IntelligenceReport(), audit=audit,
+    )
+
+
+class StubPipeline:
+    """Counts pipeline runs; `status` is copied into each Result's audit"""
+
+    def __init__(self):
+        self.calls = []
+        self.status = None
+
+    async def __call__(self, content_type, content, language="en", *args):
+        self.calls.append(content)
+        return _result(content, status=self.status)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Replace the pipeline with a stub and give the engine an empty memo"""
+    stub = StubPipeline()
+    monkeypatch.setattr(analysis_engine, "_run_analysis_uncached", stub)
+    monkeypatch.setattr(analysis_engine, "analysis_memo", ResultMemo(ttl=60))
+    return stub
+
+
+@pytest.mark.parametrize("a,b", [
+    ("Vaccines contain microchips!", "vaccines   CONTAIN microchips"),
+    ("Ｖaccines contain microchips", "vaccines contain microchips"),
+    ("5G causes COVID-19?!", "5g causes covid 19"),
+])
+def test_trivially_different_texts_share_a_fingerprint(a, b):
+    assert normalize_text(a) == normalize_text(b)
+    assert content_fingerprint("text", a) == content_fingerprint("text", b)
+
+
+def test_language_and_content_type_are_part_of_the_fingerprint():
+    assert content_fingerprint("text", "claim", "en") != content_fingerprint("text", "claim", "es")
+    assert content_fingerprint("text", "example.com") != content_fingerprint("url", "example.com")
+
+
+@pytest.mark.parametrize("variant", [
+    "HTTPS://Example.com:443/news/story?b=2&a=1",
+    "https://example.com/news/story?a=1&b=2&utm_source=feed#comments",
+    "https://example.com/news/story?fbclid=xyz&a=1&b=2",
+])
+def test_url_variants_share_a_fingerprint(variant):
+    assert content_fingerprint("url", variant) == content_fingerprint("url", "https://example.com/news/story?a=1&b=2")
+
+
+def test_reencoded_images_share_a_fingerprint():
+    payload = base64.b64encode(b"\x89PNG fake image bytes").decode("ascii")
+    assert content_fingerprint("image", payload) == content_fingerprint("image", f"data:image/png;base64,{payload}")
+
+
+def test_memo_entries_expire_after_the_ttl():
+    memo = ResultMemo(ttl=0.05)
+    memo.put("text:a", "result")
+    result, age = memo.get("text:a")
+    assert result == "result" and age < 0.05
+    time.sleep(0.08)
+    assert memo.get("text:a") is None
+    assert memo.stats()["hits"] == 1 and memo.stats()["misses"] == 1
+
+
+def test_memo_is_bounded_by_max_entries():
+    memo = ResultMemo(ttl=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        memo.put(key, key.upper())
+    assert memo.stats()["entries"] == 2
+    assert memo.get("a") is None
+    assert memo.get("c")[0] == "C"
+
+
+def test_disabled_or_zero_ttl_memo_stores_nothing():
+    for memo in (ResultMemo(enabled=False), ResultMemo(ttl=0)):
+        memo.put("text:a", "result")
+        assert memo.get("text:a") is None
+        assert not memo.stats()["enabled"]
+
+
+def test_kill_switch_env_disables_the_global_memo():
+    env = dict(os.environ, ANALYSIS_CACHE_ENABLED="false")
+    out = subprocess.run(
+        [sys.executable, "-c", "from app.services.cache import analysis_memo; print(analysis_memo.enabled)"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_repeat_analysis_is_served_from_the_memo(pipeline):
+    first = asyncio.run(analysis_engine.run_analysis("text", "Vaccines contain microchips!"))
+    second = asyncio.run(analysis_engine.run_analysis("text", "vaccines  contain MICROCHIPS"))
+    assert pipeline.calls == ["Vaccines contain microchips!"]
+    assert second.id != first.id
+    assert second.input == "vaccines  contain MICROCHIPS"
+    assert second.audit["cache"]["hit"] is True
+    assert first.audit["cache"] == {"hit": False, "age_seconds": 0.0}
+
+
+def test_disabled_memo_runs_the_pipeline_every_time(pipeline, monkeypatch):
+    monkeypatch.setattr(analysis_engine, "analysis_memo", ResultMemo(enabled=False))
+    for _ in range(2):
+        asyncio.run(analysis_engine.run_analysis("text", "Vaccines contain microchips!"))
+    assert len(pipeline.calls) == 2
+
+
+@pytest.mark.parametrize("status", ["timeout", "error"])
+def test_failed_analyses_are_not_memoized(pipeline, status):
+    pipeline.status = status
+    for _ in range(2):
+        asyncio.run(analysis_engine.run_analysis("text", "Vaccines contain microchips!"))
+    assert len(pipeline.calls) == 2
@@ -0,0 +1,114 @@
+# backend/tests/test_claim_classifier.py
+"""Claim classifier: same claim types as the original keyword chain."""
+
+import pytest
+
+from app.services.claim_classifier import AhoCorasick, classify_claim
+
+
+def baseline_claim_type(text: str) -> str:
+    """detect_claim_type as it was before the taxonomy file (substring if/elif chain)"""
+    text_lower = text.lower()
+    if any(word in text_lower for word in ["vaccine", "vaccination", "microchip", "tracking"]):
+        return "vaccine_conspiracy"
+    elif any(word in text_lower for word in ["election", "vote", "fraud", "rigged"]):
+        return "election_misinformation"
+    elif any(word in text_lower for word in ["covid", "coronavirus", "pandemic", "lockdown"]):
+        return "health_misinformation"
+    elif any(word in text_lower for word in ["climate", "global warming", "carbon"]):
+        return "climate_misinformation"
+    elif any(word in text_lower for word in ["economy", "stock", "financial", "crash"]):
+        return "financial_misinformation"
+    else:
+        return "general_misinformation"
+
+
+SINGLE_TOPIC_SAMPLES = [
+    "COVID-19 vaccines contain microchips for tracking people",
+    "The vaccination campaign starts next week",
+    "Bill Gates is putting microchips in everyone",
+    "mRNA technology won the Nobel prize",
+    "Booster shots are available at every pharmacy",
+    "The election was rigged by voting machines",
+    "Millions of votes were changed overnight",
+    "Voter fraud decided the result",
+    "Ballots were found in a river",
+    "EVMs were hacked in the last polls",
+    "Coronavirus was made in a lab",
+    "The pandemic lockdowns were planned in 2019",
+    "Ivermectin cures everything",
+    "SARS-CoV-2 does not exist",
+    "Climate change is a hoax",
+    "Global warming stopped in 1998",
+    "Carbon dioxide is good for plants",
+    "Greenhouse gases are a myth",
+    "The economy will collapse tomorrow",
+    "Stock markets crashed because of a tweet",
+    "Financial experts predict a recession",
+    "Bitcoin will replace the dollar",
+    "Inflation hit 50 percent last month",
+    "Drinking hot water cures cancer",
+    "The moon landing was faked",
+    "Scientists discover cure for aging using quantum technology",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", SINGLE_TOPIC_SAMPLES)
+def test_single_topic_texts_match_baseline(text):
+    assert classify_claim(text).claim_type == baseline_claim_type(text)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("mRNA technology won the Nobel prize", "general_misinformation"),
+    ("Ivermectin cures everything", "general_misinformation"),
+    ("Bitcoin will replace the dollar", "general_misinformation"),
+])
+def test_unlisted_topics_stay_general(text, expected):
+    assert classify_claim(text).claim_type == expected
+
+
+def test_keywords_match_at_word_start_only():
+    # The substring chain classified these as election claims
+    assert classify_claim("Her devoted followers").claim_type == "general_misinformation"
+    assert baseline_claim_type("Her devoted followers") == "election_misinformation"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("microchips rigged the vote in the election", "vaccine_conspiracy"),
+    ("The vaccine vote was rigged by fraud in the election", "vaccine_conspiracy"),
+    ("Election fraud: the vote was rigged during the pandemic", "election_misinformation"),
+    ("Lockdown caused the stock market crash", "health_misinformation"),
+    ("Carbon taxes will crash the economy", "climate_misinformation"),
+])
+def test_mixed_texts_keep_the_baseline_priority(text, expected):
+    profile = classify_claim(text)
+    assert profile.claim_type == expected == baseline_claim_type(text)
+
+
+@pytest.mark.parametrize("text", [
+    "microchips rigged the vote in the election",
+    "The vaccine vote was rigged by fraud in the election",
+])
+def test_mixed_vaccine_texts_keep_their_false_verdict(text):
+    from app.services.analysis_engine import transform_raw_to_structured_result
+
+    result = transform_raw_to_structured_result({}, {}, text, "en", 0.1)
+    assert (result.verdict.label, result.verdict.confidence) == ("❌ False", 85)
+
+
+def test_scores_cover_every_matched_category():
+    profile = classify_claim("Election fraud: the vote was rigged, says a vaccine sceptic")
+    assert profile.claim_type == "vaccine_conspiracy"
+    assert profile.scores == {"vaccine_conspiracy": 1.0, "election_misinformation": 4.0}
+    assert profile.terms == frozenset({"vaccine*", "election*", "fraud*", "vote*", "rigged*"})
+
+
+def test_has_requires_every_term():
+    assert classify_claim("Vaccines carry microchips").has("vaccine*", "microchip*")
+    assert not classify_claim("Vaccines are safe").has("vaccine*", "microchip*")
+
+
+def test_automaton_reports_overlapping_matches():
+    matches = sorted(AhoCorasick(["he", "she", "hers"]).iter_matches("ushers"))
+    assert matches == [(1, 1), (2, 0), (2, 2)]
@@ -0,0 +1,117 @@
+# backend/tests/test_claim_evidence.py
+"""Claims looked up per text, and how their evidence is merged and timed."""
+
+import asyncio
+
+from app.services import analysis_engine
+from app.services.analysis_engine import CLAIM_EVIDENCE_CAP, _claim_evidence, _claims_for, _merge_evidence
+from app.services.claim_extraction import CLAIM_SPLIT_MIN_CHARS
+from app.services.deadline import Deadline
+from app.services.metrics import metrics
+
+LONG_TEXT = (
+    "The Eiffel Tower was completed in 1889 and is 330 metres tall. "
+    "I think the weather in Paris is lovely this time of year. "
+    "India's population passed 1.4 billion people in 2023, according to the United Nations. "
+    "The Amazon river carries about 20 percent of the world's fresh water into the ocean. "
+    "Honestly, who knows what will happen next with all of this."
+)
+
+
+def _results(*links):
+    return [{"link": link, "title": link} for link in links]
+
+
+# -- claims per text ---------------------------------------------------------
+
+def test_short_text_is_one_claim():
+    text = "Drinking hot water cures the flu, says a viral post from 2024."
+    assert len(text) <= CLAIM_SPLIT_MIN_CHARS
+    claims = _claims_for(text)
+    assert len(claims) == 1
+    assert claims[0].query == text and claims[0].topic is None
+
+
+def test_long_text_is_split_into_the_top_claims():
+    assert len(LONG_TEXT) > CLAIM_SPLIT_MIN_CHARS
+    claims = _claims_for(LONG_TEXT)
+    assert 1 < len(claims) <= analysis_engine.CLAIM_TOP_K
+    assert all(claim.query != LONG_TEXT for claim in claims)
+    assert not any("weather" in claim.text for claim in claims)
+
+
+def test_claim_extraction_can_be_turned_off(monkeypatch):
+    monkeypatch.setattr(analysis_engine, "CLAIM_EXTRACTION", False)
+    claims = _claims_for(LONG_TEXT)
+    assert [claim.query for claim in claims] == [LONG_TEXT]
+
+
+# -- merging -----------------------------------------------------------------
+
+def test_merge_interleaves_claims_and_caps_the_result():
+    values = [_results(*(f"{claim}{n}" for n in range(4))) for claim in "abc"]
+    merged = _merge_evidence("search_results", values)
+    assert len(merged) == CLAIM_EVIDENCE_CAP
+    assert [item["link"] for item in merged] == ["a0", "b0", "c0", "a1", "b1"]
+
+
+def test_merge_drops_results_found_by_several_claims():
+    values = [_results("shared", "a1"), _results("shared", "b1"), None]
+    merged = _merge_evidence("search_results", values)
+    assert [item["link"] for item in merged] == ["shared", "a1", "b1"]
+
+
+def test_merge_dedups_fact_checks_by_claim_and_review():
+    review = {"text": "Vaccines cause autism", "claimReview": [{"url": "https://checker.example/1"}]}
+    other = {"text": "Vaccines cause autism", "claimReview": [{"url": "https://checker.example/2"}]}
+    merged = _merge_evidence("fact_checks", [[review], [dict(review), other]])
+    assert merged == [review, other]
+
+
+def test_merge_keeps_the_best_claims_wikipedia_article():
+    article = {"title": "Eiffel Tower"}
+    assert _merge_evidence("wikipedia", [None, article, {"title": "Paris"}]) == article
+    assert _merge_evidence("wikipedia", [None, None]) is None
+
+
+# -- lookups -----------------------------------------------------------------
+
+def test_each_distinct_query_is_looked_up_once(monkeypatch):
+    queries = []
+
+    async def lookup(query, deadline):
+        queries.append(query)
+        return _results(f"{query}-1", "shared")
+
+    monkeypatch.setitem(analysis_engine.EVIDENCE_SOURCES, "search_results", (lookup, 4.0, []))
+    claims = _claims_for(LONG_TEXT)
+    # The best claim twice, as when two sentences reduce to the same query
+    claims = [claims[0], claims[0], *claims[1:]]
+    merged, counts = asyncio.run(_claim_evidence("search_results", claims, Deadline.after(10)))
+
+    assert sorted(queries) == sorted({claim.query for claim in claims})
+    assert counts == [2] * len(claims)
+    links = [item["link"] for item in merged]
+    assert links.count("shared") == 1
+    assert len(links) == len(set(links)) <= CLAIM_EVIDENCE_CAP
+
+
+def test_every_per_claim_call_is_kept_in_the_audit(monkeypatch):
+    async def lookup(query, deadline):
+        with metrics.api_call("custom_search", deadline) as call:
+            await asyncio.sleep(0.01)
+            call.status(200)
+        return _results(query)
+
+    monkeypatch.setitem(analysis_engine.EVIDENCE_SOURCES, "search_results", (lookup, 4.0, []))
+    claims = _claims_for(LONG_TEXT)
+
+    async def run():
+        timings = metrics.begin_analysis()
+        await _claim_evidence("search_results", claims, Deadline.after(10))
+        return timings
+
+    timings = asyncio.run(run())
+    calls = timings.as_dict()["apis"]["custom_search"]
+    assert len(calls) == len(claims) > 1
+    assert all(call["outcome"] == "ok" and call["ms"] >= 10 for call in calls)
@@ -0,0 +1,95 @@
+# backend/tests/test_deadline.py
+"""Analysis deadlines: stage budgets, client timeouts and the pipeline backstop."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.models import Result, Verdict, IntelligenceReport
+from app.services import analysis_engine
+from app.services.deadline import Deadline, MIN_TIMEOUT, client_timeout, stage_budget
+
+
+def test_budget_is_the_stage_cap_limited_by_what_is_left():
+    deadline = Deadline.after(10.0, reserve=1.0)
+    assert deadline.budget(2.0) == 2.0
+    assert 8.9 < deadline.budget(20.0) <= 9.0
+    assert 8.9 < deadline.budget() <= 9.0
+    assert not deadline.expired
+
+
+def test_client_timeout_is_clamped_to_the_remaining_budget():
+    deadline = Deadline.after(0.5)
+    assert client_timeout(deadline, 5.0).total <= 0.5
+    assert client_timeout(deadline, 0.2).total == 0.2
+
+
+def test_client_timeout_without_a_deadline_uses_the_cap():
+    assert client_timeout(None, 5.0).total == 5.0
+    assert stage_budget(None, 3.0) == 3.0
+
+
+def test_expired_deadline_still_yields_a_nonzero_timeout():
+    # aiohttp reads total=0 as "no timeout at all"
+    deadline = Deadline.after(0.01)
+    time.sleep(0.02)
+    assert deadline.expired
+    assert deadline.budget(5.0) == 0.0
+    assert stage_budget(deadline, 5.0) == 0.0
+    assert client_timeout(deadline, 5.0).total == MIN_TIMEOUT
+
+
+def test_reserve_is_kept_back_for_assembling_the_result():
+    deadline = Deadline.after(0.5, reserve=0.5)
+    assert deadline.expired
+    assert deadline.remaining() > 0
+
+
+def test_cut_short_stages_are_reported_once():
+    deadline = Deadline.after(1.0)
+    deadline.note_cut_short("wikipedia")
+    deadline.note_cut_short("wikipedia")
+    report = deadline.as_dict()
+    assert report["partial"] is True
+    assert report["cut_short"] == ["wikipedia"]
+    assert report["budget_seconds"] == 1.0
+
+
+def _result(text):
+    return Result(
+        input=text, domain="General",
+        verdict=Verdict(label="⚠️ Caution", confidence=50, summary="partial"),
+        quick_analysis="stub", evidence=[], checklist=[],
+        intelligence=IntelligenceReport(), audit={"analysis_time": "2024-01-01T00:00:00"},
+    )
+
+
+@pytest.fixture
+def short_deadline(monkeypatch):
+    monkeypatch.setattr(analysis_engine, "TEXT_DEADLINE", 0.1)
+    monkeypatch.setattr(analysis_engine, "DEADLINE_RESERVE", 0.02)
+    monkeypatch.setattr(analysis_engine, "DEADLINE_BACKSTOP", 0.1)
+
+
+def test_pipeline_that_honours_its_deadline_returns_its_own_result(short_deadline, monkeypatch):
+    async def pipeline(content, language, on_event, deadline):
+        await asyncio.sleep(deadline.budget())
+        return _result(content)
+
+    monkeypatch.setattr(analysis_engine, "analyze_text_pipeline", pipeline)
+    result = asyncio.run(analysis_engine._run_analysis_uncached("text", "claim"))
+    assert result.verdict.summary == "partial"
+    assert result.audit.get("status") != "timeout"
+
+
+def test_backstop_cuts_off_a_pipeline_that_ignores_its_deadline(short_deadline, monkeypatch):
+    async def pipeline(content, language, on_event, deadline):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(analysis_engine, "analyze_text_pipeline", pipeline)
+    started = time.monotonic()
+    result = asyncio.run(analysis_engine._run_analysis_uncached("text", "claim"))
+    assert time.monotonic() - started < 1.0
+    assert result.audit["status"] == "timeout"
+    assert result.verdict.label == "⚠️ Timeout"
@@ -0,0 +1,94 @@
+# backend/tests/test_domain_reputation.py
+"""Domain reputation: pinned reliability scores and the engine's original boost lists."""
+
+import pytest
+
+from app.services.domain_reputation import DomainReputationIndex, domain_reputation, host_of
+
+# The domain lists analysis_engine matched by substring before the reputation table
+BASELINE_EVIDENCE_BOOST = ["who.int", "cdc.gov", "nih.gov", ".gov", ".edu"]
+BASELINE_SOURCE_BOOST = ["who.int", "cdc.gov", "nih.gov", "gov.uk", "nature.com"]
+
+URLS = [
+    "https://www.who.int/news-room/fact-sheets",
+    "https://www.cdc.gov/vaccines/index.html",
+    "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1",
+    "https://www.nature.com/articles/s41586",
+    "https://www.gov.uk/government/news",
+    "https://www.mohfw.gov.in/",
+    "https://www.health.gov.au/",
+    "https://www.unimelb.edu.au/",
+    "https://www.nasa.gov/climate",
+    "https://web.mit.edu/research",
+    "https://www.bloomberg.com/news/articles/x",
+    "https://www.aljazeera.com/news",
+    "https://www.britannica.com/science/vaccine",
+    "https://www.reuters.com/fact-check/x",
+    "https://www.nhs.uk/conditions/vaccinations",
+    "https://example.com/blog",
+]
+
+
+def _baseline(link, domains):
+    return any(domain in link.lower() for domain in domains)
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_boost_lists_match_the_original_engine(url):
+    reputation = domain_reputation.reputation(url)
+    assert reputation.boosted("evidence_score") == _baseline(url, BASELINE_EVIDENCE_BOOST)
+    assert reputation.boosted("source_credibility") == _baseline(url, BASELINE_SOURCE_BOOST)
+
+
+@pytest.mark.parametrize("url,score", [
+    # The engine's original quality domains and namespaces
+    ("https://www.who.int/x", 0.92),
+    ("https://www.cdc.gov/x", 0.92),
+    ("https://www.nih.gov/x", 0.92),
+    ("https://www.fda.gov/x", 0.92),
+    ("https://www.nature.com/x", 0.92),
+    ("https://www.nejm.org/x", 0.92),
+    ("https://www.bmj.com/x", 0.92),
+    ("https://www.gov.uk/x", 0.92),
+    ("https://europa.eu/x", 0.92),
+    ("https://www.usa.gov/x", 0.88),
+    ("https://www.stanford.edu/x", 0.88),
+    ("https://example.com/x", 0.70),
+    # Added by the reputation table
+    ("https://www.reuters.com/x", 0.93),
+    ("https://www.bloomberg.com/x", 0.90),
+    ("https://www.theonion.com/x", 0.25),
+])
+def test_reliability_scores_are_pinned(url, score):
+    assert domain_reputation.reputation(url).score == score
+
+
+def test_boosts_need_the_host_not_a_substring():
+    # The substring scan boosted these; host matching does not
+    for url in ("https://evil.com/?ref=who.int", "https://cdc.gov.example.com/", "https://www.govtrack.us/"):
+        reputation = domain_reputation.reputation(url)
+        assert not reputation.boosted("evidence_score")
+        assert not reputation.boosted("source_credibility")
+
+
+def test_listed_outlets_get_no_boost():
+    for url in ("https://www.bloomberg.com/x", "https://www.britannica.com/x", "https://www.nhs.uk/x"):
+        assert domain_reputation.reputation(url).boosts == frozenset()
+
+
+def test_longest_suffix_wins():
+    index = DomainReputationIndex({"gov": 0.88, "cdc.gov": 0.94, "stacks.cdc.gov": 0.5})
+    assert index.lookup("www.cdc.gov") == ("cdc.gov", 0.94)
+    assert index.lookup("stacks.cdc.gov") == ("stacks.cdc.gov", 0.5)
+    assert index.lookup("usa.gov") == ("gov", 0.88)
+    assert index.lookup("cdc.gov.evil.com") is None
+
+
+@pytest.mark.parametrize("url,host", [
+    ("https://WWW.CDC.gov./x", "www.cdc.gov"),
+    ("cdc.gov/vaccines", "cdc.gov"),
+    ("http://[::1", ""),
+    ("", ""),
+])
+def test_host_of(url, host):
+    assert host_of(url) == host
@@ -0,0 +1,94 @@
+# backend/tests/test_evidence_cache.py
+"""Evidence cache: key normalization, TTLs, the LRU bound and the disk tier."""
+
+import time
+
+from app.services.cache import LRUCache, TieredCache, MISS, normalize_query
+
+
+def test_queries_differing_in_case_and_spacing_share_an_entry():
+    cache = TieredCache()
+    cache.set("factcheck", "Vaccines  contain\tMICROCHIPS ", ["review"])
+    assert normalize_query(" Vaccines  contain\tMICROCHIPS ") == "vaccines contain microchips"
+    assert cache.get("factcheck", "vaccines contain microchips") == ["review"]
+
+
+def test_sources_and_variants_are_kept_apart():
+    cache = TieredCache()
+    cache.set("factcheck", "moon landing", ["five"], variant="5")
+    assert cache.get("factcheck", "moon landing", variant="10") is MISS
+    assert cache.get("custom_search", "moon landing", variant="5") is MISS
+    assert cache.get("factcheck", "moon landing", variant="5") == ["five"]
+
+
+def test_negative_answers_are_cached_distinctly_from_misses():
+    # A Wikipedia 404 is stored as None; an empty result list is an answer too
+    cache = TieredCache()
+    cache.set("wikipedia", "no such article", None)
+    cache.set("factcheck", "nothing reviewed", [])
+    assert cache.get("wikipedia", "no such article") is None
+    assert cache.get("factcheck", "nothing reviewed") == []
+    assert cache.get("wikipedia", "never asked") is MISS
+
+
+def test_entries_expire_after_their_source_ttl():
+    cache = TieredCache(ttls={"custom_search": 0.05}, default_ttl=60)
+    cache.set("custom_search", "q", ["short"])
+    cache.set("wikipedia", "q", {"title": "long"})
+    time.sleep(0.08)
+    assert cache.get("custom_search", "q") is MISS
+    assert cache.get("wikipedia", "q") == {"title": "long"}
+
+
+def test_zero_ttl_source_is_never_stored():
+    cache = TieredCache(ttls={"factcheck": 0})
+    cache.set("factcheck", "q", ["x"])
+    assert cache.get("factcheck", "q") is MISS
+    assert cache.stats()["sources"]["factcheck"]["writes"] == 0
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    lru = LRUCache(max_entries=2)
+    lru.set("a", 1, 60)
+    lru.set("b", 2, 60)
+    assert lru.get("a") == 1
+    lru.set("c", 3, 60)
+    assert len(lru) == 2
+    assert lru.get("b") is MISS
+    assert lru.get("a") == 1 and lru.get("c") == 3
+
+
+def test_disk_tier_survives_a_restart_and_promotes_to_memory(tmp_path):
+    TieredCache(disk_directory=str(tmp_path)).set("factcheck", "q", ["from disk"])
+
+    restarted = TieredCache(disk_directory=str(tmp_path))
+    assert restarted.get("factcheck", "q") == ["from disk"]
+    assert restarted.get("factcheck", "q") == ["from disk"]
+    counters = restarted.stats()["sources"]["factcheck"]
+    assert counters["disk_hits"] == 1
+    assert counters["memory_hits"] == 1
+    assert counters["misses"] == 0
+
+
+def test_expired_disk_entries_are_not_served(tmp_path):
+    TieredCache(ttls={"custom_search": 0.05}, disk_directory=str(tmp_path)).set("custom_search", "q", ["old"])
+    time.sleep(0.08)
+    assert TieredCache(disk_directory=str(tmp_path)).get("custom_search", "q") is MISS
+
+
+def test_disabled_cache_stores_and_serves_nothing(tmp_path):
+    cache = TieredCache(disk_directory=str(tmp_path), enabled=False)
+    cache.set("factcheck", "q", ["x"])
+    assert cache.get("factcheck", "q") is MISS
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stats_report_hit_ratio_per_source():
+    cache = TieredCache(ttls={"factcheck": 30})
+    cache.get("factcheck", "q")
+    cache.set("factcheck", "q", ["x"])
+    cache.get("factcheck", "q")
+    stats = cache.stats()
+    assert stats["hit_ratio"] == 0.5
+    assert stats["sources"]["factcheck"]["ttl_seconds"] == 30
+    assert stats["sources"]["factcheck"]["writes"] == 1
@@ -0,0 +1,257 @@
+# backend/tests/test_hedging.py
+"""Hedge timing, the hedge budget, and what happens to the losing request."""
+
+import asyncio
+
+import pytest
+
+from app.services.deadline import Deadline
+from app.services.hedging import Hedger, LatencyWindow, MAX_HEDGE_TOKENS
+from app.services.metrics import metrics, _label_key
+
+
+def _requests(api, outcome):
+    return metrics.api_requests._values.get(_label_key({"api": api, "outcome": outcome}), 0.0)
+
+
+async def _warm_up(hedger, api, runs, seconds=0.01):
+    async def fetch():
+        await asyncio.sleep(seconds)
+        return "warm"
+
+    for _ in range(runs):
+        assert await hedger.run(api, fetch) == "warm"
+
+
+def _slow_then_fast(calls, log=None, slow=5.0):
+    """Fetch whose first call hangs and whose later calls answer at once"""
+
+    async def fetch():
+        attempt = len(calls)
+        calls.append(attempt)
+        try:
+            if attempt == 0:
+                await asyncio.sleep(slow)
+                return "primary"
+            return "hedge"
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(attempt)
+            raise
+
+    return fetch
+
+
+# -- hedge delay -------------------------------------------------------------
+
+def test_quantile_picks_the_tail_latency():
+    window = LatencyWindow()
+    for ms in range(1, 21):
+        window.add(ms / 1000)
+    assert window.quantile(0.9) == 0.019
+    assert window.quantile(0.5) == 0.011
+    assert LatencyWindow().quantile(0.9) is None
+
+
+def test_no_hedge_until_enough_samples():
+    hedger = Hedger(apis=["hedge_cold"], min_samples=3, budget=1.0)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_cold", 2)
+        assert hedger.hedge_delay("hedge_cold") is None
+        calls = []
+        fetch = _slow_then_fast(calls, slow=0.1)
+        return await hedger.run("hedge_cold", fetch), calls
+
+    result, calls = asyncio.run(scenario())
+    # Too few latencies to know the tail: the slow request is left alone
+    assert result == "primary"
+    assert calls == [0]
+    assert hedger.stats()["hedge_cold"]["hedges_fired"] == 0
+
+
+def test_hedge_fires_after_the_quantile_delay():
+    hedger = Hedger(apis=["hedge_p90"], quantile=0.9, min_samples=4, budget=1.0)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_p90", 4, seconds=0.02)
+        delay = hedger.hedge_delay("hedge_p90")
+        calls = []
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await hedger.run("hedge_p90", _slow_then_fast(calls))
+        return delay, loop.time() - started, result, calls
+
+    delay, elapsed, result, calls = asyncio.run(scenario())
+    assert delay >= 0.02
+    # The hedge went out after the tail latency, not after the slow request
+    assert delay <= elapsed < 1.0
+    assert result == "hedge"
+    assert calls == [0, 1]
+
+
+def test_apis_not_opted_in_are_never_hedged():
+    hedger = Hedger(apis=["hedge_on"], min_samples=1, budget=1.0)
+    calls = []
+    result = asyncio.run(hedger.run("hedge_off", _slow_then_fast(calls, slow=0.05)))
+    assert result == "primary"
+    assert calls == [0]
+    assert not hedger.enabled("hedge_off")
+
+
+# -- budget ------------------------------------------------------------------
+
+def test_budget_limits_how_many_hedges_fire():
+    # Four warm-up requests earn one token; each later request earns a quarter
+    hedger = Hedger(apis=["hedge_budget"], min_samples=4, budget=0.25)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_budget", 4)
+        first = await hedger.run("hedge_budget", _slow_then_fast([]))
+        second = await hedger.run("hedge_budget", _slow_then_fast([], slow=0.1))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    stats = hedger.stats()["hedge_budget"]
+    assert first == "hedge"
+    assert second == "primary"
+    assert stats["hedges_fired"] == 1
+    assert stats["skipped_no_budget"] == 1
+    assert stats["budget_tokens"] == 0.5
+
+
+def test_banked_tokens_are_capped():
+    hedger = Hedger(apis=["hedge_cap"], min_samples=1000, budget=1.0)
+    asyncio.run(_warm_up(hedger, "hedge_cap", 30, seconds=0))
+    assert hedger.stats()["hedge_cap"]["budget_tokens"] == MAX_HEDGE_TOKENS
+
+
+# -- first answer wins -------------------------------------------------------
+
+def test_first_answer_wins_and_the_loser_is_cancelled():
+    hedger = Hedger(apis=["hedge_race"], min_samples=2, budget=1.0)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_race", 2)
+        calls, cancelled = [], []
+        result = await hedger.run("hedge_race", _slow_then_fast(calls, cancelled))
+        await asyncio.sleep(0)
+        return result, calls, cancelled
+
+    result, calls, cancelled = asyncio.run(scenario())
+    assert result == "hedge"
+    assert calls == [0, 1]
+    assert cancelled == [0]
+    assert hedger.stats()["hedge_race"]["hedges_won"] == 1
+
+
+def test_primary_can_still_win_after_a_hedge_fires():
+    hedger = Hedger(apis=["hedge_primary"], min_samples=2, budget=1.0)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_primary", 2)
+        calls, cancelled = [], []
+
+        async def fetch():
+            attempt = len(calls)
+            calls.append(attempt)
+            try:
+                await asyncio.sleep(0.05 if attempt == 0 else 5.0)
+                return attempt
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+
+        result = await hedger.run("hedge_primary", fetch)
+        await asyncio.sleep(0)
+        return result, calls, cancelled
+
+    result, calls, cancelled = asyncio.run(scenario())
+    assert result == 0
+    assert calls == [0, 1]
+    assert cancelled == [1]
+    assert hedger.stats()["hedge_primary"]["hedges_won"] == 0
+
+
+def test_failed_attempt_waits_for_the_other():
+    hedger = Hedger(apis=["hedge_fail"], min_samples=2, budget=1.0)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_fail", 2)
+        calls = []
+
+        async def fetch():
+            attempt = len(calls)
+            calls.append(attempt)
+            if attempt == 0:
+                await asyncio.sleep(0.05)
+                raise RuntimeError("primary failed")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        return await hedger.run("hedge_fail", fetch)
+
+    assert asyncio.run(scenario()) == "hedge"
+
+
+# -- outcome of the cancelled loser ------------------------------------------
+
+def test_cancelled_loser_is_counted_as_cancelled_not_timeout():
+    hedger = Hedger(apis=["hedge_outcome"], min_samples=2, budget=1.0)
+    deadline = Deadline.after(30)
+
+    async def scenario():
+        await _warm_up(hedger, "hedge_outcome", 2)
+        timings = metrics.begin_analysis()
+        calls = []
+
+        async def fetch():
+            attempt = len(calls)
+            calls.append(attempt)
+            with metrics.api_call("hedge_outcome", deadline):
+                if attempt == 0:
+                    await asyncio.sleep(5.0)
+                return attempt
+
+        result = await hedger.run("hedge_outcome", fetch)
+        await asyncio.sleep(0)
+        return result, timings
+
+    before_cancelled = _requests("hedge_outcome", "cancelled")
+    before_timeout = _requests("hedge_outcome", "timeout")
+    result, timings = asyncio.run(scenario())
+    assert result == 1
+    assert _requests("hedge_outcome", "cancelled") == before_cancelled + 1
+    assert _requests("hedge_outcome", "timeout") == before_timeout
+    assert [call["outcome"] for call in timings.apis["hedge_outcome"]] == ["cancelled"]
+    assert [call["outcome"] for call in timings.apis["hedge_outcome_hedge"]] == ["ok"]
+
+
+def test_cancellation_past_the_deadline_is_a_timeout():
+    deadline = Deadline.after(0.01)
+
+    async def scenario():
+        async def request():
+            with metrics.api_call("hedge_deadline", deadline):
+                await asyncio.sleep(5.0)
+
+        task = asyncio.ensure_future(request())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    before = _requests("hedge_deadline", "timeout")
+    asyncio.run(scenario())
+    assert _requests("hedge_deadline", "timeout") == before + 1
+    assert _requests("hedge_deadline", "cancelled") == 0
+
+
+def test_timeout_error_is_a_timeout():
+    async def scenario():
+        with metrics.api_call("hedge_timeout_error"):
+            await asyncio.wait_for(asyncio.sleep(5.0), 0.01)
+
+    before = _requests("hedge_timeout_error", "timeout")
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+    assert _requests("hedge_timeout_error", "timeout") == before + 1
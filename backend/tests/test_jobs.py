@@ -0,0 +1,202 @@
+# backend/tests/test_jobs.py
+"""Job queues: exactly-once claims, lease-based recovery, schema upgrade."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+
+from app.services.jobs import DONE, QUEUED, RUNNING, FAILED, Job, JobWorkerPool, MemoryJobQueue, SQLiteJobQueue
+
+
+def _queue(tmp_path, **kwargs) -> SQLiteJobQueue:
+    kwargs.setdefault("poll_interval", 0.01)
+    return SQLiteJobQueue(str(tmp_path), **kwargs)
+
+
+def test_every_job_is_claimed_exactly_once_across_processes(tmp_path):
+    producer = _queue(tmp_path)
+    jobs = [Job("text", f"claim {n}") for n in range(200)]
+    for job in jobs:
+        asyncio.run(producer.put(job))
+
+    # One queue per "process": separate connections and owners on the same file
+    queues = [_queue(tmp_path) for _ in range(4)]
+    claimed = {queue.owner: [] for queue in queues}
+
+    def drain(queue):
+        while True:
+            job = queue._claim()
+            if job is None:
+                if queue.stats().get(QUEUED, 0) == 0:
+                    return
+                continue
+            claimed[queue.owner].append(job.id)
+
+    threads = [threading.Thread(target=drain, args=(queue,)) for queue in queues]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [job_id for owned in claimed.values() for job_id in owned]
+    assert sorted(ids) == sorted(job.id for job in jobs)
+    assert producer.stats()[RUNNING] == 200
+
+
+def test_claim_marks_job_running_with_owner_and_lease(tmp_path):
+    queue = _queue(tmp_path, lease_seconds=30)
+    job = asyncio.run(queue.put(Job("text", "hello")))
+    claimed = asyncio.run(queue.get())
+    assert claimed.id == job.id and claimed.status == RUNNING and claimed.attempts == 1
+    owner, lease_until = queue._conn.execute("SELECT owner, lease_until FROM jobs WHERE id = ?", (job.id,)).fetchone()
+    assert owner == queue.owner
+    assert time.time() + 25 < lease_until <= time.time() + 30
+
+
+def test_live_jobs_of_other_processes_are_not_recovered(tmp_path):
+    running = _queue(tmp_path, lease_seconds=60)
+    job = asyncio.run(running.put(Job("text", "slow analysis")))
+    asyncio.run(running.get())
+
+    # A sibling process starting up must leave the running job alone
+    sibling = _queue(tmp_path, lease_seconds=60)
+    assert sibling.get_job(job.id).status == RUNNING
+    assert sibling._claim() is None
+
+
+def test_jobs_with_expired_leases_are_requeued(tmp_path):
+    crashed = _queue(tmp_path, lease_seconds=0.05)
+    job = asyncio.run(crashed.put(Job("text", "interrupted")))
+    asyncio.run(crashed.get())
+    time.sleep(0.1)
+
+    survivor = _queue(tmp_path)
+    recovered = asyncio.run(asyncio.wait_for(survivor.get(), 2))
+    assert recovered.id == job.id
+    assert recovered.attempts == 2
+
+
+def test_renew_keeps_a_running_job_claimed(tmp_path):
+    owner = _queue(tmp_path, lease_seconds=0.2)
+    job = asyncio.run(owner.put(Job("text", "long")))
+    asyncio.run(owner.get())
+    for _ in range(4):
+        time.sleep(0.1)
+        owner.renew()
+    assert _queue(tmp_path).recover() == 0
+    assert owner.get_job(job.id).status == RUNNING
+
+
+def test_jobs_interrupted_too_often_fail(tmp_path):
+    queue = _queue(tmp_path, lease_seconds=0.01, max_attempts=1)
+    job = asyncio.run(queue.put(Job("text", "crashes the worker")))
+    asyncio.run(queue.get())
+    time.sleep(0.05)
+    assert queue.recover() == 1
+    failed = queue.get_job(job.id)
+    assert failed.status == FAILED and failed.error == "Interrupted 1 times"
+
+
+def test_update_from_an_expired_owner_is_dropped(tmp_path):
+    slow = _queue(tmp_path, lease_seconds=0.01)
+    job = asyncio.run(slow.put(Job("text", "taken over")))
+    stale = asyncio.run(slow.get())
+    time.sleep(0.05)
+
+    other = _queue(tmp_path)
+    taken = asyncio.run(asyncio.wait_for(other.get(), 2))
+    assert taken.id == job.id
+
+    stale.status = DONE
+    stale.analysis_id = "from-slow"
+    asyncio.run(slow.update(stale))
+    assert other.get_job(job.id).status == RUNNING
+
+    taken.status = DONE
+    taken.analysis_id = "from-other"
+    asyncio.run(other.update(taken))
+    finished = slow.get_job(job.id)
+    assert finished.status == DONE and finished.analysis_id == "from-other"
+
+
+def test_get_does_not_block_the_event_loop_on_a_locked_database(tmp_path):
+    queue = _queue(tmp_path)
+    job = asyncio.run(queue.put(Job("text", "behind a lock")))
+
+    # Another process holds the write lock while this one looks for work
+    other = sqlite3.connect(str(tmp_path / "jobs.db"), isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        claiming = asyncio.create_task(queue.get())
+        await asyncio.sleep(0.3)
+        assert not claiming.done()
+        other.execute("COMMIT")
+        claimed = await asyncio.wait_for(claiming, 2)
+        ticking.cancel()
+        return claimed, ticks
+
+    claimed, ticks = asyncio.run(run())
+    other.close()
+    assert claimed.id == job.id
+    assert ticks >= 10
+
+
+def test_worker_pool_recovers_expired_leases_on_a_timer(tmp_path):
+    crashed = _queue(tmp_path, lease_seconds=0.05)
+    job = asyncio.run(crashed.put(Job("text", "interrupted")))
+    asyncio.run(crashed.get())
+
+    # Created while the lease is still live, so its startup sweep finds nothing
+    pool = JobWorkerPool(_queue(tmp_path, lease_seconds=0.05))
+
+    async def run():
+        recovering = asyncio.create_task(pool._recover_leases())
+        await asyncio.sleep(0.3)
+        recovering.cancel()
+        await asyncio.gather(recovering, return_exceptions=True)
+
+    asyncio.run(run())
+    recovered = pool.queue.get_job(job.id)
+    assert recovered.status == QUEUED and recovered.attempts == 1
+
+
+def test_tables_without_lease_columns_are_upgraded(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "jobs.db"))
+    conn.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, status TEXT NOT NULL, created_at TEXT NOT NULL, data TEXT NOT NULL)")
+    old = Job("text", "from the previous release", status=RUNNING, attempts=1)
+    conn.execute("INSERT INTO jobs VALUES (?, ?, ?, ?)", (old.id, old.status, old.created_at, json.dumps(old.__dict__)))
+    conn.commit()
+    conn.close()
+
+    queue = _queue(tmp_path)
+    # A running job without a lease predates the upgrade and is re-queued
+    assert queue.get_job(old.id).status == QUEUED
+    assert asyncio.run(queue.get()).id == old.id
+
+
+def test_memory_queue_evicts_oldest_finished_jobs():
+    queue = MemoryJobQueue(max_finished=2)
+
+    async def run():
+        jobs = [await queue.put(Job("text", str(n))) for n in range(3)]
+        for _ in jobs:
+            job = await queue.get()
+            job.status = DONE
+            await queue.update(job)
+        return jobs
+
+    jobs = asyncio.run(run())
+    assert queue.get_job(jobs[0].id) is None
+    assert [queue.get_job(job.id).status for job in jobs[1:]] == [DONE, DONE]
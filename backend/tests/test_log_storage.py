@@ -0,0 +1,172 @@
+# backend/tests/test_log_storage.py
+"""Append-only analysis log: replay, torn tails, background fsync and compaction."""
+
+import os
+import time
+import threading
+
+import pytest
+
+from app.database import LogStorage
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    return str(tmp_path)
+
+
+def _open(log_dir, **kwargs) -> LogStorage:
+    return LogStorage(log_dir, **kwargs)
+
+
+def _segment_files(log_dir):
+    return sorted(name for name in os.listdir(log_dir) if name.endswith(".ndjson"))
+
+
+def test_records_survive_a_reopen_and_later_saves_win(log_dir):
+    store = _open(log_dir)
+    store.save_analysis("a", {"verdict": "False", "timestamp": "2026-01-01T00:00:00"})
+    store.save_analysis("b", {"verdict": "True", "timestamp": "2026-01-02T00:00:00"})
+    store.save_analysis("a", {"verdict": "Misleading", "timestamp": "2026-01-03T00:00:00"})
+    store.close()
+
+    store = _open(log_dir)
+    assert store.get_analysis("a")["verdict"] == "Misleading"
+    assert [item["verdict"] for item in store.get_all_analyses()] == ["Misleading", "True"]
+    store.close()
+
+
+def test_torn_tail_is_truncated_on_startup(log_dir):
+    store = _open(log_dir)
+    store.save_analysis("a", {"verdict": "False"})
+    store.close()
+    path = os.path.join(log_dir, _segment_files(log_dir)[-1])
+    intact = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(b'{"id":"b","data":{"verd')
+
+    store = _open(log_dir)
+    assert os.path.getsize(path) == intact
+    assert store.get_analysis("a")["verdict"] == "False"
+    assert store.get_analysis("b") is None
+    # New records start on a clean line boundary
+    store.save_analysis("c", {"verdict": "True"})
+    store.close()
+    store = _open(log_dir)
+    assert store.get_analysis("c")["verdict"] == "True"
+    store.close()
+
+
+def test_corrupt_complete_lines_are_skipped(log_dir):
+    store = _open(log_dir)
+    store.save_analysis("a", {"verdict": "False"})
+    store.close()
+    with open(os.path.join(log_dir, _segment_files(log_dir)[-1]), "ab") as f:
+        f.write(b"not json\n")
+        f.write(b'{"id":"b","data":{"verdict":"True"}}\n')
+    store = _open(log_dir)
+    assert store.get_analysis("b")["verdict"] == "True"
+    store.close()
+
+
+def test_pending_writes_are_fsynced_after_saves_stop(log_dir, monkeypatch):
+    store = _open(log_dir, fsync_every=1000, fsync_interval=0.2)
+    threads = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        threads.append(threading.current_thread().name)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    store.save_analysis("a", {"verdict": "False"})
+    assert store._pending_writes == 1
+    deadline = time.time() + 2
+    while store._pending_writes and time.time() < deadline:
+        time.sleep(0.01)
+    assert store._pending_writes == 0
+    assert threads == ["log-storage-fsync"]
+    store.close()
+
+
+def test_segments_roll_at_the_size_limit(log_dir):
+    store = _open(log_dir, segment_max_bytes=400)
+    for n in range(20):
+        store.save_analysis(str(n), {"verdict": "False", "claim": "x" * 50})
+    store.close()
+    assert len(_segment_files(log_dir)) > 1
+    store = _open(log_dir)
+    assert all(store.get_analysis(str(n)) for n in range(20))
+    store.close()
+
+
+def test_compaction_keeps_latest_records_and_shrinks_the_log(log_dir):
+    store = _open(log_dir, segment_max_bytes=2000, compact_min_bytes=10 ** 9)
+    for round_no in range(10):
+        for n in range(10):
+            store.save_analysis(str(n), {"round": round_no, "timestamp": f"2026-01-01T00:00:{n:02d}"})
+    before = store._total_bytes
+    store.compact()
+    assert store._total_bytes < before / 5
+    assert len(_segment_files(log_dir)) == 2  # the compacted segment and the new active one
+    assert all(store.get_analysis(str(n))["round"] == 9 for n in range(10))
+    store.close()
+
+    store = _open(log_dir)
+    assert all(store.get_analysis(str(n))["round"] == 9 for n in range(10))
+    store.close()
+
+
+def test_saves_during_compaction_are_not_lost(log_dir, monkeypatch):
+    store = _open(log_dir, compact_min_bytes=10 ** 9)
+    for n in range(50):
+        store.save_analysis(str(n), {"round": 0})
+    for n in range(50):
+        store.save_analysis(str(n), {"round": 1})
+
+    # Save while the sealed segments are being copied (the lock is free then)
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if src.endswith(".compact"):
+            store.save_analysis("7", {"round": 2})
+            store.save_analysis("new", {"round": 2})
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace)
+    store.compact()
+    monkeypatch.setattr(os, "replace", real_replace)
+    assert store.get_analysis("7")["round"] == 2
+    assert store.get_analysis("8")["round"] == 1
+    assert store.get_analysis("new")["round"] == 2
+    store.close()
+
+    store = _open(log_dir)
+    assert store.get_analysis("7")["round"] == 2
+    assert store.get_analysis("8")["round"] == 1
+    store.close()
+
+
+def test_compaction_is_triggered_in_the_background(log_dir, monkeypatch):
+    store = _open(log_dir, compact_min_bytes=1000, compact_ratio=0.5)
+    started = threading.Event()
+    release = threading.Event()
+    real_compact = store.compact
+
+    def slow_compact():
+        started.set()
+        release.wait(2)
+        real_compact()
+
+    monkeypatch.setattr(store, "compact", slow_compact)
+    for n in range(60):
+        store.save_analysis("same", {"round": n, "padding": "x" * 40})
+    assert started.wait(1.0)
+    # Saves keep going while the compaction is held up
+    t0 = time.time()
+    store.save_analysis("other", {"round": 0})
+    assert time.time() - t0 < 0.5
+    release.set()
+    store._compactor.join(2)
+    assert store.get_analysis("same")["round"] == 59
+    store.close()
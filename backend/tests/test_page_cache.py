@@ -0,0 +1,117 @@
+# backend/tests/test_page_cache.py
+"""Page cache: canonical keys, freshness, conditional GET revalidation."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from app.services import page_fetch
+from app.services.cache import PageCache
+from app.services.fingerprint import canonicalize_url
+
+ARTICLE = (
+    "<html><head><title>Report</title></head><body><article>"
+    + "<p>The health ministry confirmed that 12 million doses were delivered in 2023.</p>" * 5
+    + "</article></body></html>"
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = PageCache(fresh_ttl=60)
+    monkeypatch.setattr(page_fetch, "page_cache", cache)
+    return cache
+
+
+@pytest.mark.parametrize("variant", [
+    "HTTP://Example.com:80/news/story/?utm_source=x&b=2&a=1#comments",
+    "example.com/news//story?a=1&b=2&pk_campaign=feed",
+    "http://example.com/news/story?hsa_cam=1&fbclid=abc&b=2&a=1",
+])
+def test_url_variants_share_one_entry(variant):
+    cache = PageCache()
+    cache.put("http://example.com/news/story?a=1&b=2", {"text": "page"})
+    assert cache.get(variant)["text"] == "page"
+    assert canonicalize_url(variant) == "http://example.com/news/story?a=1&b=2"
+
+
+def test_entries_outlive_freshness_for_revalidation():
+    cache = PageCache(fresh_ttl=0.05, max_age=60)
+    cache.put("http://example.com/a", {"text": "page", "etag": '"v1"'})
+    assert cache.is_fresh(cache.get("http://example.com/a"))
+    time.sleep(0.1)
+    entry = cache.get("http://example.com/a")
+    assert entry["etag"] == '"v1"' and not cache.is_fresh(entry)
+
+
+def test_page_max_age_is_capped_by_the_ttl():
+    cache = PageCache(fresh_ttl=10)
+    assert cache.put("http://example.com/a", {}, fresh_ttl=3600)["fresh_until"] <= time.time() + 10
+    assert cache.put("http://example.com/b", {}, fresh_ttl=1)["fresh_until"] <= time.time() + 1
+
+
+def test_disk_tier_survives_a_cold_memory(tmp_path):
+    cache = PageCache(disk_directory=str(tmp_path))
+    cache.put("http://example.com/a", {"text": "page", "etag": '"v1"'})
+    cache.memory.clear()
+    assert cache.get("http://example.com/a")["etag"] == '"v1"'
+    assert PageCache(disk_directory=str(tmp_path)).get("http://example.com/a")["text"] == "page"
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PageCache(enabled=False)
+    cache.put("http://example.com/a", {"text": "page"})
+    assert cache.get("http://example.com/a") is None
+
+
+def test_conditional_get_reuses_the_extraction(cache, local_server):
+    requests = []
+    etag = {"value": '"v1"'}
+
+    async def page(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == etag["value"]:
+            return web.Response(status=304, headers={"ETag": etag["value"]})
+        return web.Response(text=ARTICLE, content_type="text/html", headers={"ETag": etag["value"]})
+
+    async def run():
+        async with local_server({"/story": page}) as base:
+            url = f"{base}/story"
+            first = await page_fetch.get_page_text(url)
+            fresh = await page_fetch.get_page_text(f"{url}?utm_medium=social")
+            cache.put(url, cache.get(url), fresh_ttl=0)
+            revalidated = await page_fetch.get_page_text(url)
+            cache.put(url, cache.get(url), fresh_ttl=0)
+            etag["value"] = '"v2"'
+            changed = await page_fetch.get_page_text(url)
+            return first, fresh, revalidated, changed
+
+    first, fresh, revalidated, changed = asyncio.run(run())
+    assert [first.cache, fresh.cache, revalidated.cache, changed.cache] == ["miss", "fresh", "revalidated", "changed"]
+    assert requests == [None, '"v1"', '"v1"']
+    assert revalidated.status == 304 and revalidated.text == first.text != ""
+    assert changed.status == 200 and changed.etag == '"v2"'
+    assert cache.stats()["revalidated"] == 1
+
+
+@pytest.mark.parametrize("cache_control,stored,fresh", [
+    ("no-store", False, False),
+    ("no-cache", True, False),
+    ("max-age=0", True, False),
+    ("public, max-age=30", True, True),
+])
+def test_cache_control_is_honoured(cache, local_server, cache_control, stored, fresh):
+    async def page(request):
+        return web.Response(text=ARTICLE, content_type="text/html", headers={"Cache-Control": cache_control})
+
+    async def run():
+        async with local_server({"/story": page}) as base:
+            await page_fetch.get_page_text(f"{base}/story")
+            return cache.get(f"{base}/story")
+
+    entry = asyncio.run(run())
+    assert (entry is not None) == stored
+    if entry is not None:
+        assert cache.is_fresh(entry) == fresh
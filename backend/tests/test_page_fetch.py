@@ -0,0 +1,156 @@
+# backend/tests/test_page_fetch.py
+"""Streaming page fetch: extraction rules, byte cap and charset handling."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from app.services import page_fetch
+from app.services.page_fetch import PageTextExtractor, fetch_page_text, MAX_PENDING_CHARS, MIN_MAIN_CHARS
+
+STORY = "Officials confirmed the figures on Tuesday. " * 10
+
+
+def _extract(html, max_chars=5000, chunk=None):
+    extractor = PageTextExtractor(max_chars)
+    chunks = [html[i:i + chunk] for i in range(0, len(html), chunk)] if chunk else [html]
+    for part in chunks:
+        extractor.feed(part)
+    extractor.close()
+    return extractor
+
+
+# -- extractor -----------------------------------------------------------------
+
+def test_chrome_and_scripts_are_dropped():
+    text = _extract(
+        "<html><head><title>Headline</title><style>p{}</style></head><body>"
+        "<nav>Home | About</nav><script>var x = '<p>not text</p>';</script>"
+        "<p>First paragraph.</p><footer>Copyright</footer><p>Second.</p></body></html>"
+    ).text()
+    assert text == "Headline\nFirst paragraph.\nSecond."
+
+
+def test_main_content_is_preferred():
+    text = _extract(f"<body><p>Sidebar teaser</p><article><p>{STORY}</p></article></body>").text()
+    assert "Sidebar teaser" not in text
+    assert text.startswith("Officials confirmed")
+
+
+def test_short_main_falls_back_to_the_whole_page():
+    assert len("Caption") < MIN_MAIN_CHARS
+    text = _extract(f"<body><main>Caption</main><p>{STORY}</p></body>").text()
+    assert "Caption" in text and "Officials confirmed" in text
+
+
+def test_chunk_boundaries_do_not_change_the_text():
+    html = f"<title>T</title><div>{STORY}</div><script>x()</script><p>Tail &amp; end</p>"
+    whole = _extract(html).text()
+    assert _extract(html, chunk=7).text() == whole
+    assert whole.endswith("Tail & end")
+
+
+def test_text_is_capped_and_reported_done():
+    extractor = _extract(f"<article>{STORY * 5}</article>", max_chars=300)
+    assert extractor.done
+    assert len(extractor.text()) == 300
+
+
+def test_unterminated_tag_marks_the_page_malformed():
+    extractor = PageTextExtractor()
+    extractor.feed("<p>Intro</p><div class=\"" + "x" * (MAX_PENDING_CHARS + 1))
+    assert extractor.malformed and extractor.done
+    assert extractor.rawdata == ""
+
+
+def test_huge_script_is_not_buffered():
+    extractor = PageTextExtractor()
+    extractor.feed("<script>")
+    for _ in range(5):
+        extractor.feed("x" * MAX_PENDING_CHARS)
+        assert len(extractor.rawdata) <= MAX_PENDING_CHARS
+    extractor.feed("</script><p>After the script</p>")
+    extractor.close()
+    assert not extractor.malformed
+    assert extractor.text() == "After the script"
+
+
+def test_tag_cut_off_at_the_end_is_not_text():
+    extractor = _extract("<p>Body text</p><a href=\"/next")
+    assert extractor.text() == "Body text"
+
+
+# -- fetch -----------------------------------------------------------------------
+
+def _fetch(local_server, handler, **kwargs):
+    async def run():
+        async with local_server({"/page": handler}) as base:
+            return await fetch_page_text(f"{base}/page", **kwargs)
+    return asyncio.run(run())
+
+
+def _body(body, content_type="text/html", charset=None, status=200):
+    async def handler(request):
+        return web.Response(body=body, status=status, content_type=content_type, charset=charset)
+    return handler
+
+
+def test_body_read_stops_at_the_byte_cap(local_server):
+    body = b"<p>Lead</p><script>" + b"x" * 200_000 + b"</script><p>Never read</p>"
+    page = _fetch(local_server, _body(body), max_bytes=50_000)
+    assert page.truncated and not page.stopped_early
+    assert page.bytes_read == 50_000
+    assert page.text == "Lead"
+
+
+def test_reading_stops_once_enough_text_is_collected(local_server):
+    body = f"<article>{STORY * 20}</article>".encode() + b"<p>filler</p>" * 20_000
+    page = _fetch(local_server, _body(body), max_chars=300)
+    assert page.stopped_early and not page.truncated
+    assert page.bytes_read < len(body)
+    assert len(page.text) == 300
+
+
+@pytest.mark.parametrize("content_type,status,skipped", [
+    ("application/pdf", 200, "unsupported_content_type"),
+    ("image/png", 200, "unsupported_content_type"),
+    ("text/html", 404, "http_404"),
+    ("text/html", 503, "http_503"),
+])
+def test_unusable_responses_are_skipped_unread(local_server, content_type, status, skipped):
+    page = _fetch(local_server, _body(b"<p>ignored</p>", content_type=content_type, status=status))
+    assert page.skipped == skipped
+    assert page.bytes_read == 0 and page.text == ""
+
+
+def test_plain_text_is_passed_through(local_server):
+    page = _fetch(local_server, _body(b"line one\nline two", content_type="text/plain"))
+    assert page.content_type == "text/plain"
+    assert page.text == "line one\nline two"
+
+
+def test_charset_from_the_content_type_header(local_server):
+    body = "<p>“Café”</p>".encode("cp1252")
+    page = _fetch(local_server, _body(body, charset="windows-1252"))
+    assert page.text == "“Café”"
+
+
+def test_charset_sniffed_from_meta_tag(local_server):
+    body = b'<html><head><meta charset="windows-1252"></head><body><p>' + "“Café”".encode("cp1252") + b"</p>"
+    page = _fetch(local_server, _body(body))
+    assert page.text == "“Café”"
+
+
+def test_unknown_charset_falls_back_to_utf8(local_server):
+    body = b'<meta charset="no-such-codec"><p>' + "naïve".encode("utf-8") + b"</p>"
+    page = _fetch(local_server, _body(body))
+    assert page.text == "naïve"
+
+
+def test_multibyte_characters_split_across_chunks(local_server, monkeypatch):
+    monkeypatch.setattr(page_fetch, "CHUNK_SIZE", 1)
+    text = "Élections — 年 \U0001f5f3"
+    page = _fetch(local_server, _body(f"<p>{text}</p>".encode("utf-8"), charset="utf-8"))
+    assert page.text == text
+    assert "�" not in page.text
@@ -0,0 +1,86 @@
+# backend/tests/test_quota.py
+"""Client-side quotas: daily caps under concurrency, refunds, queueing, 429 holds."""
+
+import asyncio
+
+import pytest
+
+from app.services.quota import QuotaExceeded, QuotaManager, TokenBucket
+
+
+def test_concurrent_callers_cannot_overrun_the_daily_cap():
+    # Callers queue for per-minute tokens, so the daily check and take straddle a wait
+    quotas = QuotaManager({"custom_search": (600, 5)}, max_wait=1.0)
+    quotas._buckets["custom_search"].minute.tokens = 0
+
+    async def run():
+        return await asyncio.gather(*(quotas.acquire("custom_search") for _ in range(20)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert sum(result is None for result in results) == 5
+    assert all(isinstance(result, QuotaExceeded) for result in results if result is not None)
+    assert quotas._buckets["custom_search"].day.used == 5
+
+
+def test_cancelled_waiters_get_their_quota_back():
+    quotas = QuotaManager({"factcheck": (60, 10)}, max_wait=5.0)
+    bucket = quotas._buckets["factcheck"]
+    bucket.minute.tokens = 0
+
+    async def run():
+        waiter = asyncio.create_task(quotas.acquire("factcheck"))
+        await asyncio.sleep(0.05)
+        assert bucket.day.used == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+    assert bucket.day.used == 0
+    # The reserved token is back: the next caller waits about one token interval, not two
+    assert bucket.minute.tokens > -0.1
+
+
+def test_refused_requests_spend_nothing():
+    quotas = QuotaManager({"factcheck": (60, 10)}, key_limits=(60, 0), max_wait=0.1)
+    quotas._buckets["factcheck"].minute.tokens = 0
+
+    with pytest.raises(QuotaExceeded):
+        asyncio.run(quotas.acquire("factcheck", api_key="secret"))
+    key_bucket = next(bucket for name, bucket in quotas._buckets.items() if name.startswith("key:"))
+    assert key_bucket.minute.remaining() == 60
+    assert quotas._buckets["factcheck"].day.used == 0
+    assert quotas.events["factcheck"]["rate_limited"] == 1
+
+
+def test_exhausted_daily_quota_is_refused():
+    quotas = QuotaManager({"custom_search": (0, 2)})
+    asyncio.run(quotas.acquire("custom_search"))
+    asyncio.run(quotas.acquire("custom_search"))
+    with pytest.raises(QuotaExceeded, match="Daily quota"):
+        asyncio.run(quotas.acquire("custom_search"))
+
+
+def test_unlimited_endpoints_never_wait():
+    quotas = QuotaManager({"custom_search": (0, 0)})
+    asyncio.run(quotas.acquire("custom_search"))
+    asyncio.run(quotas.acquire("wikipedia"))
+    assert quotas.stats()["buckets"] == {}
+
+
+def test_upstream_429_holds_the_bucket():
+    quotas = QuotaManager({"custom_search": (600, 0)}, max_wait=1.0)
+    quotas.upstream_throttled("custom_search", retry_after="30")
+    with pytest.raises(QuotaExceeded):
+        asyncio.run(quotas.acquire("custom_search"))
+    assert quotas.events["custom_search"]["upstream_429"] == 1
+
+
+def test_token_bucket_reserves_in_order():
+    bucket = TokenBucket(60)
+    bucket.tokens = 0
+    first = bucket.reserve(10)
+    second = bucket.reserve(10)
+    assert 0.9 < first <= 1.0
+    assert 1.9 < second <= 2.0
+    assert bucket.reserve(1.5) is None
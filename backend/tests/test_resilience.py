@@ -0,0 +1,248 @@
+# backend/tests/test_resilience.py
+"""Circuit breaker transitions, AIMD limits and the guarded upstream call."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.resilience import (
+    AdaptiveLimiter, CircuitBreaker, CircuitOpenError, UpstreamRegistry,
+    CLOSED, OPEN, HALF_OPEN, SUCCESS, FAILURE, IGNORED,
+)
+
+
+def _open_breaker(reset_timeout=0.05):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=reset_timeout)
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record(FAILURE)
+    return breaker
+
+
+# -- circuit breaker ---------------------------------------------------------
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record(FAILURE)
+    breaker.record(FAILURE)
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record(FAILURE)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.times_opened == 1
+    assert breaker.as_dict()["retry_in_seconds"] > 0
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record(FAILURE)
+    breaker.record(FAILURE)
+    breaker.record(SUCCESS)
+    breaker.record(FAILURE)
+    breaker.record(FAILURE)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_exactly_one_probe_through():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_success_closes_the_circuit():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(SUCCESS)
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow() and breaker.allow()
+
+
+def test_probe_failure_reopens_immediately():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(FAILURE)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+    assert not breaker.allow()
+
+
+def test_cancelled_probe_frees_the_probe_slot():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(IGNORED)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+
+
+# -- AIMD limiter ------------------------------------------------------------
+
+def test_limit_grows_additively_and_halves_on_failure():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=4, minimum=1, maximum=10)
+        await limiter.acquire()
+        limiter.release(SUCCESS)
+        assert limiter.limit == pytest.approx(4.25)
+        await limiter.acquire()
+        limiter.release(FAILURE)
+        assert limiter.limit == pytest.approx(2.125)
+        await limiter.acquire()
+        limiter.release(IGNORED)
+        assert limiter.limit == pytest.approx(2.125)
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_limit_stays_within_bounds():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=50, minimum=2, maximum=3)
+        assert limiter.limit == 3
+        for _ in range(10):
+            await limiter.acquire()
+            limiter.release(SUCCESS)
+        assert limiter.limit == 3
+        for _ in range(10):
+            await limiter.acquire()
+            limiter.release(FAILURE)
+        assert limiter.limit == 2
+
+    asyncio.run(scenario())
+
+
+def test_requests_over_the_limit_wait_for_a_slot():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert limiter.as_dict()["waiting"] == 1
+
+        limiter.release(SUCCESS)
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 2
+        assert limiter.as_dict()["waiting"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_failure_shrinks_the_limit_for_waiters():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+
+        # Limit drops to 1 with one request still in flight: no slot frees up
+        limiter.release(FAILURE)
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limiter.release(SUCCESS)
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.as_dict()["waiting"] == 0
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+# -- guarded upstream call ---------------------------------------------------
+
+async def _request(registry, status=None, exc=None, api="factcheck", upstream=None):
+    async with registry.call(api, upstream) as call:
+        if exc is not None:
+            raise exc
+        if status is not None:
+            call.status(status)
+
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_server_errors_and_throttling_count_as_failures(status):
+    async def scenario():
+        registry = UpstreamRegistry(failure_threshold=2, reset_timeout=60)
+        await _request(registry, status)
+        await _request(registry, status)
+        assert registry.is_open("factcheck")
+        with pytest.raises(CircuitOpenError):
+            await _request(registry, 200)
+        assert registry.snapshot()["factcheck"]["rejected"] == 1
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("status", [200, 400, 404])
+def test_client_errors_do_not_trip_the_breaker(status):
+    async def scenario():
+        registry = UpstreamRegistry(failure_threshold=1, reset_timeout=60)
+        await _request(registry, status)
+        assert not registry.is_open("factcheck")
+        assert registry.get("factcheck").limiter.limit > registry.initial_limit
+
+    asyncio.run(scenario())
+
+
+def test_exceptions_count_as_failures_and_propagate():
+    async def scenario():
+        registry = UpstreamRegistry(failure_threshold=1, reset_timeout=60)
+        with pytest.raises(RuntimeError):
+            await _request(registry, exc=RuntimeError("boom"))
+        assert registry.is_open("factcheck")
+        assert registry.get("factcheck").limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancellation_is_ignored():
+    async def scenario():
+        registry = UpstreamRegistry(failure_threshold=1, reset_timeout=60, initial_limit=4)
+
+        async def slow():
+            async with registry.call("factcheck"):
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(slow())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        guard = registry.get("factcheck")
+        assert not registry.is_open("factcheck")
+        assert guard.breaker.failures == 0
+        assert guard.limiter.limit == 4
+        assert guard.limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_upstream_groups_calls_under_one_breaker():
+    async def scenario():
+        registry = UpstreamRegistry(failure_threshold=2, reset_timeout=60)
+        await _request(registry, 503, api="language_detection", upstream="translation")
+        await _request(registry, 503, api="translation")
+        assert registry.is_open("translation")
+        assert "language_detection" not in registry.snapshot()
+
+    asyncio.run(scenario())
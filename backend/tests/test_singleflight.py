@@ -0,0 +1,213 @@
+# backend/tests/test_singleflight.py
+"""Request coalescing: one shared run per key, failures and cancellation."""
+
+import asyncio
+
+import pytest
+
+from app.models import Result, Verdict, IntelligenceReport
+from app.services import analysis_engine
+from app.services.cache import ResultMemo
+from app.services.singleflight import SingleFlight, analysis_flights
+
+
+def _result(text):
+    return Result(
+        input=text, domain="General",
+        verdict=Verdict(label="⚠️ Caution", confidence=50, summary="stub"),
+        quick_analysis="stub", evidence=[], checklist=[],
+        intelligence=IntelligenceReport(), audit={"analysis_time": "2024-01-01T00:00:00"},
+    )
+
+
+def test_concurrent_callers_share_one_run():
+    flights = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+    outcomes = asyncio.run(scenario())
+    assert len(runs) == 1
+    assert [result for result, _ in outcomes] == ["answer"] * 5
+    assert [joined for _, joined in outcomes] == [False, True, True, True, True]
+    assert flights.stats()["started"] == 1 and flights.stats()["coalesced"] == 4
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_different_keys_and_later_calls_run_separately():
+    flights = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        return len(runs)
+
+    async def scenario():
+        await asyncio.gather(flights.do("a", work), flights.do("b", work))
+        return await flights.do("a", work)
+
+    assert asyncio.run(scenario()) == (3, False)
+
+
+def test_leader_failure_reaches_every_waiter():
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    outcomes = asyncio.run(scenario())
+    assert all(isinstance(e, RuntimeError) and str(e) == "upstream down" for e in outcomes)
+    assert flights.stats()["failed"] == 1
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_cancelled_follower_does_not_cancel_the_shared_run():
+    flights = SingleFlight()
+    finished = []
+
+    async def work():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+        return "answer"
+
+    async def scenario():
+        leader = asyncio.create_task(flights.do("key", work))
+        follower = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader
+
+    assert asyncio.run(scenario()) == ("answer", False)
+    assert finished == [1]
+    assert flights.stats()["abandoned_waits"] == 1
+
+
+def test_cancelled_leader_leaves_the_run_to_its_followers():
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def scenario():
+        leader = asyncio.create_task(flights.do("key", work))
+        follower = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == ("answer", True)
+
+
+def test_caller_timeout_keeps_the_shared_run_going():
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def scenario():
+        # The impatient caller starts the run; the patient one joins it
+        patient = asyncio.create_task(flights.do("key", work))
+        with pytest.raises(asyncio.TimeoutError):
+            await flights.do("key", work, timeout=0.01)
+        return await patient
+
+    assert asyncio.run(scenario()) == ("answer", True)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Slow counting stub in place of the pipeline, with an empty memo"""
+    calls = []
+
+    async def run(content_type, content, language="en", *args):
+        calls.append(args)
+        await asyncio.sleep(0.05)
+        return _result(content)
+
+    monkeypatch.setattr(analysis_engine, "_run_analysis_uncached", run)
+    monkeypatch.setattr(analysis_engine, "analysis_memo", ResultMemo(ttl=60))
+    return calls
+
+
+def test_identical_analyses_run_the_pipeline_once(pipeline):
+    async def scenario():
+        return await asyncio.gather(*(
+            analysis_engine.run_analysis("text", "Vaccines contain microchips") for _ in range(5)
+        ))
+
+    results = asyncio.run(scenario())
+    assert len(pipeline) == 1
+    assert len({result.id for result in results}) == 5
+    assert sum(bool(result.audit.get("coalesced")) for result in results) == 4
+    assert analysis_flights.stats()["in_flight"] == 0
+
+
+def test_stage_events_reach_every_coalesced_caller(monkeypatch):
+    async def run(content_type, content, language="en", on_event=None, *args):
+        await asyncio.sleep(0.02)
+        on_event("translation", {"ms": 1})
+        await asyncio.sleep(0.02)
+        on_event("evidence", {"sources": 2})
+        return _result(content)
+
+    monkeypatch.setattr(analysis_engine, "_run_analysis_uncached", run)
+    monkeypatch.setattr(analysis_engine, "analysis_memo", ResultMemo(ttl=60))
+    seen = {"first": [], "second": []}
+
+    async def scenario():
+        await asyncio.gather(*(
+            analysis_engine.run_analysis("text", "Vaccines contain microchips",
+                                         on_event=lambda stage, data, name=name: seen[name].append((stage, data)))
+            for name in seen
+        ))
+
+    asyncio.run(scenario())
+    assert seen["first"] == seen["second"] == [("translation", {"ms": 1}), ("evidence", {"sources": 2})]
+    assert analysis_engine._stage_listeners == {}
+
+
+def test_departed_listener_stops_receiving_events(monkeypatch):
+    async def run(content_type, content, language="en", on_event=None, *args):
+        await asyncio.sleep(0.03)
+        on_event("late", {})
+        return _result(content)
+
+    monkeypatch.setattr(analysis_engine, "_run_analysis_uncached", run)
+    monkeypatch.setattr(analysis_engine, "analysis_memo", ResultMemo(ttl=60))
+    seen = {"gone": [], "stays": []}
+
+    def listener(name):
+        def on_event(stage, data):
+            if name == "stays":
+                seen[name].append(stage)
+            else:
+                raise AssertionError("listener of a cancelled caller was called")
+        return on_event
+
+    async def scenario():
+        gone = asyncio.create_task(analysis_engine.run_analysis("text", "claim", on_event=listener("gone")))
+        stays = asyncio.create_task(analysis_engine.run_analysis("text", "claim", on_event=listener("stays")))
+        await asyncio.sleep(0.01)
+        gone.cancel()
+        await asyncio.gather(gone, return_exceptions=True)
+        await stays
+
+    asyncio.run(scenario())
+    assert seen["stays"] == ["late"]
+    assert analysis_engine._stage_listeners == {}
@@ -0,0 +1,156 @@
+# backend/tests/test_sqlite_storage.py
+"""SQLite storage: legacy migration, keyset paging and filters."""
+
+import json
+import random
+
+import pytest
+
+from app.database import ArchiveFilters, LogStorage, SQLiteStorage
+
+VERDICTS = ["❌ False", "✅ True", "⚠️ Caution"]
+
+
+def _record(n: int, timestamp: str, **fields):
+    record = {
+        "analysis_id": f"id-{n:04d}",
+        "timestamp": timestamp,
+        "user_id": f"user-{n % 3}",
+        "verdict": VERDICTS[n % 3],
+        "content_type": "text" if n % 2 else "url",
+        "language": "en" if n % 4 else "hi",
+        "confidence_score": (n * 7) % 100,
+    }
+    record.update(fields)
+    return record
+
+
+def _fill(store, count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for n in range(count):
+        # Few distinct timestamps, so many rows tie and the id breaks the tie
+        store.save_analysis(f"id-{n:04d}", _record(n, f"2026-10-{rng.randint(1, 5):02d}T12:00:00"))
+
+
+def _walk(store, limit: int, filters=None):
+    pages, after = [], None
+    while True:
+        page, after = store.page_analyses(limit=limit, after=after, filters=filters)
+        pages.append([entry["analysis_id"] for entry in page])
+        if after is None:
+            return pages
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStorage(str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_newest_analyses_come_first(store):
+    _fill(store, 40)
+    rows = store.get_all_analyses(limit=15)
+    keys = [(row["timestamp"], row["analysis_id"]) for row in rows]
+    assert len(rows) == 15
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.parametrize("user_id", [None, "user-1"])
+def test_sql_query_matches_the_generic_scan(tmp_path, store, user_id):
+    log = LogStorage(str(tmp_path / "log"))
+    for backend in (store, log):
+        for n in range(80):
+            backend.save_analysis(f"id-{n:04d}", _record(n, f"2026-10-{n % 28 + 1:02d}T{n // 28:02d}:00:00"))
+    try:
+        expected = [e["analysis_id"] for e in log.query_analyses(limit=12, user_id=user_id)]
+        assert [e["analysis_id"] for e in store.query_analyses(limit=12, user_id=user_id)] == expected
+    finally:
+        log.close()
+
+
+def test_pages_cover_every_row_once_in_order(store):
+    _fill(store, 103)
+    pages = _walk(store, limit=10)
+    ids = [analysis_id for page in pages for analysis_id in page]
+    assert len(pages) == 11 and len(ids) == 103 == len(set(ids))
+    rows = [store.get_analysis(analysis_id) for analysis_id in ids]
+    keys = [(row["timestamp"], row["analysis_id"]) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_exact_multiple_of_the_page_size_ends_without_an_empty_page(store):
+    _fill(store, 20)
+    assert [len(page) for page in _walk(store, limit=10)] == [10, 10]
+
+
+def test_cursor_is_stable_while_new_rows_arrive(store):
+    _fill(store, 30)
+    first, after = store.page_analyses(limit=10)
+    # Newer analyses saved between two page requests would shift an OFFSET page
+    for n in range(100, 110):
+        store.save_analysis(f"id-{n:04d}", _record(n, "2026-11-01T00:00:00"))
+    second, _ = store.page_analyses(limit=10, after=after)
+    seen = [entry["analysis_id"] for entry in first + second]
+    everything = [analysis_id for page in _walk(store, limit=50) for analysis_id in page]
+    original = [analysis_id for analysis_id in everything if analysis_id < "id-0100"]
+    assert seen == original[:20]
+
+
+@pytest.mark.parametrize("filters", [
+    ArchiveFilters(user_id="user-1"),
+    ArchiveFilters(verdict="❌ False", content_type="text"),
+    ArchiveFilters(language="hi", since="2026-10-02", until="2026-10-04T23:59:59"),
+    ArchiveFilters(min_confidence=20, max_confidence=60),
+])
+def test_sql_filters_match_the_generic_scan(tmp_path, store, filters):
+    _fill(store, 80)
+    log = LogStorage(str(tmp_path / "log"))
+    _fill(log, 80)
+    try:
+        assert _walk(store, 7, filters) == _walk(log, 7, filters)
+    finally:
+        log.close()
+
+
+def test_analyses_json_is_migrated_into_an_empty_database(tmp_path):
+    legacy = {f"id-{n:04d}": _record(n, f"2026-10-0{n + 1}T00:00:00") for n in range(3)}
+    (tmp_path / "analyses.json").write_text(json.dumps(legacy))
+    store = SQLiteStorage(str(tmp_path))
+    assert store.get_analysis("id-0002")["timestamp"] == "2026-10-03T00:00:00"
+    assert len(store.get_all_analyses()) == 3
+    store.close()
+
+
+def test_append_only_log_is_migrated_with_latest_versions(tmp_path):
+    log = LogStorage(str(tmp_path))
+    log.save_analysis("a", _record(1, "2026-10-01T00:00:00", verdict="old"))
+    log.save_analysis("a", _record(1, "2026-10-01T00:00:00", verdict="new"))
+    log.save_analysis("b", _record(2, "2026-10-02T00:00:00"))
+    log.close()
+    (tmp_path / "analyses.json").write_text(json.dumps({"stale": _record(9, "2020-01-01")}))
+
+    store = SQLiteStorage(str(tmp_path))
+    assert store.get_analysis("a")["verdict"] == "new"
+    assert store.get_analysis("stale") is None  # the log takes precedence over analyses.json
+    store.close()
+
+
+def test_migration_runs_only_into_an_empty_database(tmp_path):
+    store = SQLiteStorage(str(tmp_path))
+    store.save_analysis("kept", _record(1, "2026-10-01T00:00:00"))
+    store.close()
+    (tmp_path / "analyses.json").write_text(json.dumps({"late": _record(2, "2026-10-02T00:00:00")}))
+    store = SQLiteStorage(str(tmp_path))
+    assert store.get_analysis("late") is None
+    assert store.get_analysis("kept") is not None
+    store.close()
+
+
+def test_archive_cursor_round_trip():
+    from app.verify import decode_cursor, encode_cursor
+
+    key = ("2026-10-16T20:41:52.171590", "0f9c-ü/+=")
+    assert decode_cursor(encode_cursor(key)) == key
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
@@ -0,0 +1,159 @@
+# backend/tests/test_task_graph.py
+"""TaskGraph: dependency order, overlap, cycles, timeouts and cancellation."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.task_graph import TaskGraph
+
+
+def _stage(value, delay=0.0, log=None, name=None):
+    async def run(**deps):
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", name))
+        return value(**deps) if callable(value) else value
+    return run
+
+
+def test_dependencies_are_passed_as_keyword_arguments():
+    graph = TaskGraph()
+    graph.add("a", _stage(2))
+    graph.add("b", _stage(3))
+    graph.add("sum", _stage(lambda a, b: a + b), deps=("a", "b"))
+    results, unfinished = asyncio.run(graph.run())
+    assert results == {"a": 2, "b": 3, "sum": 5}
+    assert unfinished == []
+
+
+def test_independent_stages_overlap():
+    graph = TaskGraph()
+    graph.add("a", _stage(1, 0.1))
+    graph.add("b", _stage(2, 0.1))
+    graph.add("c", _stage(3, 0.1), deps=("a",))
+    started = time.monotonic()
+    asyncio.run(graph.run())
+    # Critical path a -> c is 0.2s; running all three in sequence would take 0.3s
+    assert time.monotonic() - started < 0.28
+
+
+def test_a_stage_starts_only_after_its_dependencies():
+    log = []
+    graph = TaskGraph()
+    graph.add("child", _stage(None, log=log, name="child"), deps=("parent",))
+    graph.add("parent", _stage(None, 0.05, log=log, name="parent"))
+    asyncio.run(graph.run())
+    assert log.index(("end", "parent")) < log.index(("start", "child"))
+
+
+@pytest.mark.parametrize("edges,message", [
+    ({"a": ("b",), "b": ("a",)}, "Dependency cycle"),
+    ({"a": ("a",)}, "Dependency cycle"),
+    ({"a": ("b",), "b": ("c",), "c": ("a",)}, "a -> b -> c -> a"),
+    ({"a": ("missing",)}, "unknown stage 'missing'"),
+])
+def test_invalid_graphs_are_rejected_before_anything_runs(edges, message):
+    ran = []
+
+    async def stage(**_):
+        ran.append(True)
+
+    graph = TaskGraph()
+    graph.add("free", stage)
+    for name, deps in edges.items():
+        graph.add(name, stage, deps=deps)
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(graph.run())
+    assert ran == []
+
+
+def test_stage_names_are_unique():
+    graph = TaskGraph()
+    graph.add("a", _stage(1))
+    with pytest.raises(ValueError):
+        graph.add("a", _stage(2))
+
+
+def test_timeout_cancels_and_reports_unfinished_stages():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    graph = TaskGraph()
+    graph.add("fast", _stage("ok"))
+    graph.add("slow", slow)
+    graph.add("after_slow", _stage("never"), deps=("slow",))
+
+    async def run():
+        results, unfinished = await graph.run(timeout=0.05)
+        await asyncio.sleep(0)
+        return results, unfinished
+
+    results, unfinished = asyncio.run(run())
+    assert results == {"fast": "ok"}
+    assert sorted(unfinished) == ["after_slow", "slow"]
+    assert cancelled == ["slow"]
+
+
+def test_failures_skip_dependents_but_not_siblings():
+    async def broken():
+        raise RuntimeError("upstream down")
+
+    graph = TaskGraph()
+    graph.add("broken", broken)
+    graph.add("dependent", _stage("never"), deps=("broken",))
+    graph.add("sibling", _stage("fine"))
+    results, unfinished = asyncio.run(graph.run())
+    assert results == {"sibling": "fine"}
+    assert unfinished == []
+
+
+def test_cancelling_a_dependent_leaves_shared_work_running():
+    graph = TaskGraph()
+
+    async def canceller():
+        graph.task("speculative").cancel()
+        return "cancelled it"
+
+    graph.add("shared", _stage("data", 0.05))
+    graph.add("speculative", _stage(lambda shared: shared + "!"), deps=("shared",))
+    graph.add("consumer", _stage(lambda shared: shared.upper()), deps=("shared",))
+    graph.add("canceller", canceller)
+    results, unfinished = asyncio.run(graph.run())
+    assert results == {"shared": "data", "consumer": "DATA", "canceller": "cancelled it"}
+    assert unfinished == []
+
+
+def test_cancelling_the_run_cancels_every_stage():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    graph = TaskGraph()
+    graph.add("a", slow)
+    graph.add("b", slow)
+
+    async def run():
+        runner = asyncio.create_task(graph.run())
+        await asyncio.sleep(0.02)
+        runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert cancelled == [True, True]
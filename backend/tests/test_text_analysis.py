@@ -0,0 +1,106 @@
+# backend/tests/test_text_analysis.py
+"""Batch text endpoint: input order, in-batch dedup, concurrency bound and size limit."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models import Result, Verdict, IntelligenceReport
+from app.routes import text_analysis
+
+
+def _result(text):
+    return Result(
+        input=text, domain="General",
+        verdict=Verdict(label="⚠️ Caution", confidence=50, summary="stub"),
+        quick_analysis="stub", evidence=[], checklist=[],
+        intelligence=IntelligenceReport(), audit={"analysis_time": "2024-01-01T00:00:00"},
+    )
+
+
+class StubAnalyzer:
+    """Stands in for analyze_text; later items finish first to expose ordering bugs"""
+
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, content, language="en"):
+        self.calls.append((content, language))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.05 / len(self.calls))
+            if content == "explode":
+                raise RuntimeError("pipeline failed")
+            return _result(f"{language}:{content}")
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    stub = StubAnalyzer()
+    monkeypatch.setattr(text_analysis, "analyze_text", stub)
+    return stub
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(text_analysis.router, prefix="/api/v1")
+    return TestClient(app)
+
+
+def _batch(client, items):
+    return client.post("/api/v1/analyze-batch/text", json=[
+        {"content": content, "language": language} for content, language in items
+    ])
+
+
+def test_results_come_back_in_input_order(client, analyzer):
+    items = [(f"claim {i}", "en") for i in range(6)]
+    response = _batch(client, items)
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["result"]["input"] for r in body["results"]] == [f"en:claim {i}" for i in range(6)]
+    assert body["total"] == body["unique"] == 6
+
+
+def test_identical_items_are_analyzed_once(client, analyzer):
+    items = [("Vaccines contain microchips", "en"), ("vaccines  contain MICROCHIPS!", "en"),
+             ("Vaccines contain microchips", "es"), ("Other claim", "en")]
+    body = _batch(client, items).json()
+    assert body["total"] == 4 and body["unique"] == 3
+    assert len(analyzer.calls) == 3
+    inputs = [r["result"]["input"] for r in body["results"]]
+    assert inputs[0] == inputs[1] == "en:Vaccines contain microchips"
+    assert inputs[2] == "es:Vaccines contain microchips"
+
+
+def test_failures_are_reported_per_item(client, analyzer):
+    body = _batch(client, [("fine", "en"), ("explode", "en")]).json()
+    assert body["results"][0]["success"] is True
+    assert body["results"][1] == {"success": False, "error": "pipeline failed"}
+
+
+def test_items_run_concurrently_up_to_the_bound(client, analyzer, monkeypatch):
+    monkeypatch.setattr(text_analysis, "BATCH_CONCURRENCY", 3)
+    _batch(client, [(f"claim {i}", "en") for i in range(9)])
+    assert analyzer.peak == 3
+
+
+def test_oversized_batch_is_rejected(client, analyzer):
+    response = _batch(client, [(f"claim {i}", "en") for i in range(text_analysis.BATCH_MAX_ITEMS + 1)])
+    assert response.status_code == 400
+    assert str(text_analysis.BATCH_MAX_ITEMS) in response.json()["detail"]
+    assert analyzer.calls == []
+
+
+def test_full_batch_is_accepted(client, analyzer):
+    response = _batch(client, [(f"claim {i}", "en") for i in range(text_analysis.BATCH_MAX_ITEMS)])
+    assert response.status_code == 200
+    assert response.json()["total"] == text_analysis.BATCH_MAX_ITEMS